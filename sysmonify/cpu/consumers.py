@@ -8,12 +8,12 @@ Classes:
         client.
 """
 
-import json
+import asyncio
 
 from sysmonify.core.consumers import Consumer
 
 from cpu.tasks.details import CPUDetails
-from cpu.tasks.monitors import CPUFreqMonitor, CPUThermalMonitor
+from cpu.tasks.monitors import CPU_SAMPLER
 
 
 class CPUConsumer(Consumer):
@@ -26,29 +26,50 @@ class CPUConsumer(Consumer):
     """
 
     def __init__(self, *args, **kwargs):
-        """Default initializer."""
+        """Default initializer.
+
+        Uses the process-wide CPU sampler rather than querying the CPU monitors per
+        connection.
+        """
         super().__init__(*args, **kwargs)
 
-        self.freq_monitor = CPUFreqMonitor()
-        self.temp_monitor = CPUThermalMonitor()
+        self.sampler = CPU_SAMPLER
 
     async def connect(self) -> None:
         """Handles a new WebSocket connection.
 
-        Accepts a websocket connection from the client, send initial message containing
-        static CPU details, and calls the `send_message_periodically()` method.
+        Accepts a websocket connection from the client, subscribes to the CPU sampler,
+        sends a single initial message containing static CPU details along with the
+        first CPU metrics, and calls the `send_message_periodically()` method.
+
+        The consumer unsubscribes from the CPU sampler when sending stops, e.g. when
+        the client disconnects and the consumer is cancelled. `disconnect()` cannot be
+        used for this, as it is only dispatched after `connect()` returns.
         """
         await self.accept()
 
-        cpu_details = {"details": await CPUDetails().get_details()}
-        await self.send(text_data=json.dumps(cpu_details))
-        await self.send_message_periodically()
+        try:
+            await self.sampler.subscribe()
 
-    async def get_message_data(self) -> dict:
-        """Retrieve CPU metrics from various CPU monitors and return the data as a dictionary."""
-        cpu_metrics = {
-            "freq": await self.freq_monitor.get_metrics(),
-            "temp": await self.temp_monitor.get_metrics(),
-        }
+            cpu_details, cpu_metrics = await asyncio.gather(
+                CPUDetails().get_details(), self.get_message_data()
+            )
+            initial_message = {"details": cpu_details, **cpu_metrics}
+            await self.send_message(initial_message)
+            await self.send_message_periodically(wait_before_first_message=True)
+
+        finally:
+            self.sampler.unsubscribe()
 
-        return cpu_metrics
+    async def wait_for_next_message(self, interval_seconds: float) -> None:
+        """Waits until the CPU sampler has taken a new sample.
+
+        Args:
+            interval_seconds (float):
+                Unused, the sampler's own interval determines when to send.
+        """
+        await self.sampler.wait_for_sample()
+
+    async def get_message_data(self) -> dict:
+        """Retrieve the latest CPU metrics sampled by the CPU sampler."""
+        return await self.sampler.get_latest()
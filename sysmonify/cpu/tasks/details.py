@@ -18,6 +18,8 @@ Class:
         A class that provides methods to retrieve detailed information about the CPU.
 """
 
+import os
+import asyncio
 import logging
 import subprocess
 
@@ -38,9 +40,24 @@ class CPUDetails(Details):
     to retrieve information about the CPU's capabilities.
 
     Attributes:
+        - `_SYSFS_MAX_FREQ_PATHS` (tuple):
+            Sysfs files to read the maximum CPU frequency (in kHz) from, in order of
+            preference.
+
         - `_raw_cpu_info` (dict):
             A dictionary containing detailed information about the CPU, such as vendor,
-            model, cache size, etc.
+            model, cache size, etc. Shared by all instances, as it is only queried from
+            `cpuinfo` once per process.
+
+        - `_cache_sizes` (dict | None):
+            The formatted L1, L2 and L3 cache sizes, parsed from `_raw_cpu_info` once.
+
+        - `_turbo_frequency` (float | None):
+            The maximum turbo frequency of the CPU in MHz, read once.
+
+        - `_details` (dict | None):
+            The assembled CPU details, cached on the class after the first call to
+            `get_details()` since they do not change during the process lifetime.
 
     Methods:
         - `get_details()`:
@@ -48,10 +65,19 @@ class CPUDetails(Details):
             architecture, and core count.
 
         - `_get_turbo_frequency_linux()`:
+            Retrieves the maximum turbo frequency of the CPU, reading it once.
+
+        - `_read_turbo_frequency_sysfs()`:
+            Retrieves the maximum turbo frequency of the CPU from sysfs.
+
+        - `_get_turbo_frequency_lscpu()`:
             Retrieves the maximum turbo frequency of the CPU using `lscpu`.
 
         - `_get_cpu_cache_sizes()`:
-            Retrieves and formats the CPU cache sizes from `cpuinfo`.
+            Retrieves the formatted CPU cache sizes, parsing them once.
+
+        - `_parse_cpu_cache_sizes()`:
+            Parses and formats the CPU cache sizes from `cpuinfo`.
 
     Example usage:
         cpu_details = CPUDetails()
@@ -64,20 +90,70 @@ class CPUDetails(Details):
         information.
     """
 
-    def __init__(self) -> None:
-        """Default initializer."""
-        try:
-            self._raw_cpu_info = cpuinfo.get_cpu_info()
-        except Exception:
-            logger.exception("Failed to retrieve raw cpu info from `cpuinfo` module.")
+    _SYSFS_MAX_FREQ_PATHS = (
+        "/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq",
+        "/sys/devices/system/cpu/cpu0/cpufreq/scaling_max_freq",
+    )
+
+    _raw_cpu_info: dict | None = None
+    _cache_sizes: dict | None = None
+    _turbo_frequency: float | None = None
+    _details: dict | None = None
+
+    async def _load_raw_cpu_info(self) -> None:
+        """Queries `cpuinfo` for raw CPU info, if it has not been queried already.
+
+        `cpuinfo` can take over a second to gather its data, so it is run in a worker
+        thread to avoid blocking the event loop, and only once per process.
+        """
+        if CPUDetails._raw_cpu_info is None:
+            try:
+                CPUDetails._raw_cpu_info = await asyncio.to_thread(cpuinfo.get_cpu_info)
+            except Exception:
+                logger.exception(
+                    "Failed to retrieve raw cpu info from `cpuinfo` module."
+                )
+                CPUDetails._raw_cpu_info = {}
 
     async def _get_turbo_frequency_linux(self) -> float:
-        """Retrieves the maximum turbo frequency of the CPU using `lscpu`.
+        """Retrieves the maximum turbo frequency of the CPU.
 
-        This method uses the `lscpu` command to query the system's BIOS and fetch
-        the maximum turbo frequency supported by the CPU. The value is extracted
-        from the CPU's configuration section, specifically targeting the "Max Speed"
-        or similar field.
+        The turbo frequency is a hardware constant, so it is only read on the first call
+        and the result is reused thereafter.
+
+        Returns:
+            float: The maximum turbo frequency of the CPU in MHz, or 0.0 if the
+                information could not be retrieved.
+        """
+        if CPUDetails._turbo_frequency is None:
+            CPUDetails._turbo_frequency = self._read_turbo_frequency_sysfs()
+
+        return CPUDetails._turbo_frequency
+
+    def _read_turbo_frequency_sysfs(self) -> float:
+        """Retrieves the maximum turbo frequency of the CPU from sysfs.
+
+        This method reads the maximum frequency supported by the CPU directly from
+        `/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq`, falling back to
+        `scaling_max_freq` if it is unavailable. Both files report the frequency in
+        kHz. If neither file can be read, the `lscpu` command is used as a last resort.
+
+        Returns:
+            float: The maximum turbo frequency of the CPU in MHz, or 0.0 if the
+                information could not be retrieved.
+        """
+        for path in self._SYSFS_MAX_FREQ_PATHS:
+            try:
+                with open(path, "r") as f:
+                    return int(f.read()) / 1000.0
+
+            except (OSError, ValueError):
+                logger.debug(f"Unable to read max cpu frequency from `{path}`.")
+
+        return self._get_turbo_frequency_lscpu()
+
+    def _get_turbo_frequency_lscpu(self) -> float:
+        """Retrieves the maximum turbo frequency of the CPU using `lscpu`.
 
         Returns:
             float: The maximum turbo frequency of the CPU in MHz, or 0.0 if the
@@ -86,11 +162,18 @@ class CPUDetails(Details):
         turbo_freq = 0.0
 
         try:
-            result = subprocess.run(["lscpu"], capture_output=True, text=True)
+            result = subprocess.run(
+                ["lscpu"],
+                capture_output=True,
+                encoding="ascii",
+                errors="replace",
+                env={**os.environ, "LC_ALL": "C"},
+            )
 
-            for line in result.stdout.split("\n"):
-                if "CPU max MHz" in line:
-                    turbo_freq = float(line.split(":")[1].strip())
+            for line in result.stdout.splitlines():
+                if line.startswith("CPU max MHz"):
+                    turbo_freq = float(line.partition(":")[2].strip())
+                    break
 
         except Exception:
             logger.exception(
@@ -101,7 +184,27 @@ class CPUDetails(Details):
         return turbo_freq
 
     async def _get_cpu_cache_sizes(self) -> dict:
-        """Retrieves and formats the CPU cache sizes from `cpuinfo`.
+        """Retrieves the formatted CPU cache sizes.
+
+        The cache sizes are parsed from `cpuinfo` on the first call only, as the raw
+        CPU info does not change, and the parsed result is reused thereafter.
+
+        Returns:
+            dict: A dictionary containing the "l1", "l2" and "l3" cache sizes.
+
+        Raises:
+            TypeError:
+                If `psutil` returns an unexpected type when querying cpu cache sizes.
+            Exception:
+                If unexpected error occurs when querying cpu cache sizes.
+        """
+        if CPUDetails._cache_sizes is None:
+            CPUDetails._cache_sizes = self._parse_cpu_cache_sizes()
+
+        return dict(CPUDetails._cache_sizes)
+
+    def _parse_cpu_cache_sizes(self) -> dict:
+        """Parses and formats the CPU cache sizes from `cpuinfo`.
 
         This method parses cache size information (L1, L2, L3) from the `cpuinfo` data,
         typically represented as integers in bytes.  method converts the byte values
@@ -176,6 +279,19 @@ class CPUDetails(Details):
 
         return cache_sizes
 
+    def _copy_details(self, details: dict) -> dict:
+        """Copy cached CPU details so callers cannot mutate the process-wide cache.
+
+        Args:
+            details (dict):
+                The cached CPU details.
+
+        Returns:
+            dict:
+                A copy of `details` with its nested `cache_sizes` dictionary copied too.
+        """
+        return {**details, "cache_sizes": dict(details["cache_sizes"])}
+
     async def get_details(self) -> dict:
         """Creates a detailed dictionary of general information about the CPU.
 
@@ -211,12 +327,26 @@ class CPUDetails(Details):
             systems. The method will try to fetch as much information as possible, but
             results may vary depending on the platform and the available system
             libraries.
+
+            The details are static for the lifetime of the process, so they are only
+            gathered on the first call and a copy of the cached dictionary (including
+            its nested `cache_sizes`) is returned thereafter.
         """
+        if CPUDetails._details is not None:
+            return self._copy_details(CPUDetails._details)
+
+        await self._load_raw_cpu_info()
+
         cpu_info = {}
         try:
             raw_cpu_freq = psutil.cpu_freq()
             cpu_core_count = psutil.cpu_count(logical=False)
-            cpu_thread_count = psutil.cpu_count(logical=True)
+
+            # `cpuinfo` already reports the logical processor count, only query
+            # `psutil` if it is missing.
+            cpu_thread_count = self._raw_cpu_info.get("count") or psutil.cpu_count(
+                logical=True
+            )
         except Exception:
             logger.exception(
                 "An unexpected error ocurred when retrieving cpu details from the"
@@ -237,4 +367,6 @@ class CPUDetails(Details):
         cpu_info["turbo_frequency"] = cpu_turbo_freq if cpu_turbo_freq else "Unknown"
         cpu_info["cache_sizes"] = cpu_cache_sizes
 
-        return cpu_info
+        CPUDetails._details = cpu_info
+
+        return self._copy_details(cpu_info)
@@ -10,6 +10,14 @@ Classes:
     - CPUThermalMonitor:
         A class to fetch thermal data for the CPU, including sensor readings.
 
+Attributes:
+    - FREQ_MONITOR:
+        A process-wide `CPUFreqMonitor` shared by all consumers.
+    - TEMP_MONITOR:
+        A process-wide `CPUThermalMonitor` shared by all consumers.
+    - CPU_SAMPLER:
+        A process-wide `Sampler` of both monitors, shared by all consumers.
+
 Usage:
     This module is intended to be used as with websockets for real-time monitoring or
     on-demand requests.
@@ -34,11 +42,15 @@ Note:
     especially for temperature sensors.
 """
 
+import os
+import re
+import sys
+import asyncio
 import logging
 
 import psutil
 
-from sysmonify.core.tasks import Monitor
+from sysmonify.core.tasks import SAMPLING_EXECUTOR, Monitor, Sampler
 
 
 logger = logging.getLogger(__name__)
@@ -51,16 +63,134 @@ class CPUFreqMonitor(Monitor):
     for each core. It is useful for monitoring CPU performance, identifying high usage,
     or performance issues.
 
+    On Linux the `scaling_cur_freq` sysfs file of every core is opened once, and the
+    file descriptors are kept open and re-read with `os.pread()` on every call, which
+    avoids re-resolving and re-opening each file per tick, as well as the N
+    `scpufreq` namedtuples `psutil` would allocate when only the current frequency is
+    needed. On other platforms, or if sysfs is unavailable, the monitor falls back to
+    `psutil.cpu_freq()`.
+
     Attributes:
-        None
+        _SYSFS_CPU_PATH (str):
+            The sysfs directory containing a `cpuN` directory for each core.
+
+        _fds (list[int]):
+            Open file descriptors of each core's `scaling_cur_freq` file, ordered by
+            core number. Empty if sysfs is unavailable.
+
+        _core_labels (tuple[str]):
+            Pre-built output keys for each core (e.g. "Core 0"), so they are not
+            re-formatted on every call.
 
     Methods:
         get_metrics() -> dict:
             Retrieves the current CPU frequencies for all cores on the system.
             Returns a dictionary where the keys are the CPU core numbers and
             the values are the current frequency in MHz.
+
+        close() -> None:
+            Closes all open sysfs file descriptors.
     """
 
+    _SYSFS_CPU_PATH = "/sys/devices/system/cpu"
+
+    def __init__(self) -> None:
+        """Default initializer.
+
+        Opens the `scaling_cur_freq` sysfs file for each core and builds the output
+        key for each core.
+        """
+        self._fds = self._open_scaling_cur_freq_fds()
+        self._core_labels = ()
+        self._get_core_labels(len(self._fds) or psutil.cpu_count(logical=True) or 0)
+
+    def __del__(self) -> None:
+        """Release open file descriptors when the monitor is garbage collected."""
+        self.close()
+
+    def _open_scaling_cur_freq_fds(self) -> list[int]:
+        """Opens the `scaling_cur_freq` sysfs file for each core.
+
+        Returns:
+            list[int]:
+                A list of open file descriptors ordered by core number, or an empty list
+                if not running on Linux or any of the files could not be opened.
+        """
+        fds = []
+
+        if not sys.platform.startswith("linux"):
+            return fds
+
+        try:
+            cores = sorted(
+                int(match.group(1))
+                for entry in os.listdir(self._SYSFS_CPU_PATH)
+                if (match := re.fullmatch(r"cpu(\d+)", entry))
+            )
+
+            for core in cores:
+                path = f"{self._SYSFS_CPU_PATH}/cpu{core}/cpufreq/scaling_cur_freq"
+                fds.append(os.open(path, os.O_RDONLY))
+
+        except OSError as e:
+            logger.debug(
+                f"Unable to open cpu frequency sysfs files, using `psutil`. {e}"
+            )
+            for fd in fds:
+                os.close(fd)
+            fds = []
+
+        return fds
+
+    def _get_core_labels(self, core_count: int) -> tuple[str]:
+        """Return the output keys for the given number of cores.
+
+        The labels are only rebuilt if more cores are reported than previously seen.
+
+        Args:
+            core_count (int):
+                The number of cores to return labels for.
+
+        Returns:
+            tuple[str]:
+                A tuple of at least `core_count` labels (e.g. ("Core 0", "Core 1")).
+        """
+        if len(self._core_labels) < core_count:
+            self._core_labels = tuple(f"Core {core}" for core in range(core_count))
+
+        return self._core_labels
+
+    def close(self) -> None:
+        """Closes all open sysfs file descriptors."""
+        for fd in getattr(self, "_fds", []):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+        self._fds = []
+
+    def _get_sysfs_metrics(self) -> dict:
+        """Retrieve the current CPU frequencies for all cores from sysfs.
+
+        Returns:
+            dict:
+                A dictionary containing the current frequency of each core in MHz.
+
+        Raises:
+            OSError:
+                If a sysfs file can no longer be read (e.g. the core went offline).
+
+            ValueError:
+                If a sysfs file contains an invalid value.
+        """
+        # Read every core in one tight pass before parsing, keeping the syscalls
+        # back-to-back rather than interleaved with interpreter work.
+        pread = os.pread
+        raw_freqs = [pread(fd, 32, 0) for fd in self._fds]
+
+        return dict(zip(self._core_labels, [int(raw) / 1000.0 for raw in raw_freqs]))
+
     async def get_metrics(self) -> dict:
         """Retrieve the current CPU frequencies for all cores.
 
@@ -85,18 +215,33 @@ class CPUFreqMonitor(Monitor):
                 If an unexpected exception is raised during retrieval of CPU frequency
                 data.
         """
+        if self._fds:
+            try:
+                return self._get_sysfs_metrics()
+
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Failed to read cpu frequencies from sysfs, using `psutil`. {e}"
+                )
+                self.close()
+
         current_freq = {}
 
         try:
-            cpu_freq = psutil.cpu_freq(percpu=True)
+            # `psutil` reads sysfs synchronously, run it off the event loop so other
+            # consumers are not blocked while it walks every core.
+            cpu_freq = await asyncio.get_running_loop().run_in_executor(
+                SAMPLING_EXECUTOR, psutil.cpu_freq, True
+            )
 
-            for core, freq in enumerate(cpu_freq):
-                if not hasattr(freq, "current"):
-                    raise TypeError(
-                        f"Core `{core}` frequency object does not have a 'current'"
-                        "attribute."
-                    )
-                current_freq[f"Core {core}"] = freq.current
+            try:
+                freqs = [freq.current for freq in cpu_freq]
+            except AttributeError as e:
+                raise TypeError(
+                    "Core frequency object does not have a 'current' attribute."
+                ) from e
+
+            current_freq = dict(zip(self._get_core_labels(len(freqs)), freqs))
 
         except AttributeError as e:
             raise AttributeError(
@@ -124,8 +269,22 @@ class CPUThermalMonitor(Monitor):
     temperature. It is useful for monitoring thermal performance, detecting overheating
     issues, and ensuring efficient cooling.
 
+    On Linux the `coretemp` hwmon input file for the CPU package is resolved and opened
+    once, then re-read with `os.pread()` on every call, rather than scanning every
+    hwmon sensor on the system per tick. If it cannot be resolved the monitor falls back
+    to `psutil.sensors_temperatures()`.
+
     Attributes:
-        None
+        _SYSFS_HWMON_PATH (str):
+            The sysfs directory containing a `hwmonN` directory for each sensor chip.
+
+        _fd (int | None):
+            Open file descriptor of the package temperature input file, or None if it
+            could not be resolved.
+
+        _package_sensor_index (int | None):
+            Index of the "Package id" sensor within the `psutil` coretemp sensors,
+            remembered after it is first found. None until then.
 
     Methods:
         get_metrics() -> dict:
@@ -134,8 +293,73 @@ class CPUThermalMonitor(Monitor):
             current temperature in degrees celsius. Currently only supports CPU package
             temp.
 
+        close() -> None:
+            Closes the open sysfs file descriptor.
     """
 
+    _SYSFS_HWMON_PATH = "/sys/class/hwmon"
+
+    def __init__(self) -> None:
+        """Default initializer.
+
+        Resolves and opens the `coretemp` package temperature input file.
+        """
+        self._fd = self._open_package_temp_fd()
+        self._package_sensor_index = None
+
+    def __del__(self) -> None:
+        """Release the open file descriptor when the monitor is garbage collected."""
+        self.close()
+
+    def _open_package_temp_fd(self) -> int | None:
+        """Resolves and opens the `coretemp` hwmon input file for the CPU package.
+
+        Returns:
+            int | None:
+                An open file descriptor for the first `temp*_input` file labelled
+                "Package id N", or None if no such file exists.
+        """
+        try:
+            for hwmon in sorted(os.listdir(self._SYSFS_HWMON_PATH)):
+                hwmon_path = f"{self._SYSFS_HWMON_PATH}/{hwmon}"
+
+                try:
+                    with open(f"{hwmon_path}/name", "r") as f:
+                        if f.read().strip() != "coretemp":
+                            continue
+                except OSError:
+                    continue
+
+                for entry in sorted(os.listdir(hwmon_path)):
+                    if not re.fullmatch(r"temp\d+_label", entry):
+                        continue
+
+                    with open(f"{hwmon_path}/{entry}", "r") as f:
+                        if not f.read().startswith("Package id"):
+                            continue
+
+                    input_path = f"{hwmon_path}/{entry.replace('_label', '_input')}"
+                    return os.open(input_path, os.O_RDONLY)
+
+        except OSError as e:
+            logger.debug(
+                f"Unable to open cpu package temperature file, using `psutil`. {e}"
+            )
+
+        return None
+
+    def close(self) -> None:
+        """Closes the open sysfs file descriptor."""
+        fd = getattr(self, "_fd", None)
+
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+        self._fd = None
+
     async def get_metrics(self) -> dict:
         """Retrieve the current CPU temperature.
 
@@ -157,13 +381,44 @@ class CPUThermalMonitor(Monitor):
         """
         temps = {"package": "Unknown"}
 
+        if self._fd is not None:
+            try:
+                temps["package"] = str(int(os.pread(self._fd, 16, 0)) / 1000.0)
+                return temps
+
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Failed to read cpu temperature from sysfs, using `psutil`. {e}"
+                )
+                self.close()
+
         try:
-            sensor_temps = psutil.sensors_temperatures()
+            sensor_temps = await asyncio.get_running_loop().run_in_executor(
+                SAMPLING_EXECUTOR, psutil.sensors_temperatures
+            )
             if sensor_temps and "coretemp" in sensor_temps:
-                for sensor in sensor_temps.get("coretemp", []):
-                    if "Package id 0" in sensor.label:
-                        temps["package"] = str(sensor.current)
-                        break
+                sensors = sensor_temps.get("coretemp", [])
+                index = self._package_sensor_index
+
+                if index is None or index >= len(sensors):
+                    index = None
+                elif not sensors[index].label.startswith("Package id"):
+                    index = None
+
+                if index is None:
+                    index = next(
+                        (
+                            i
+                            for i, sensor in enumerate(sensors)
+                            if sensor.label.startswith("Package id")
+                        ),
+                        None,
+                    )
+
+                self._package_sensor_index = index
+
+                if index is not None:
+                    temps["package"] = str(sensors[index].current)
 
         except AttributeError:
             raise AttributeError("Temperature readings not supported on this system.")
@@ -177,3 +432,26 @@ class CPUThermalMonitor(Monitor):
             raise Exception(f"An unexpected error occurred: {str(e)}") from e
 
         return temps
+
+
+# Process-wide monitors shared by all consumers, so the sysfs files are only resolved
+# and opened once rather than per WebSocket connection.
+FREQ_MONITOR = CPUFreqMonitor()
+TEMP_MONITOR = CPUThermalMonitor()
+
+
+async def _sample_cpu_metrics() -> dict:
+    """Retrieve the current CPU frequencies and temperature.
+
+    Returns:
+        dict:
+            A dictionary with the "freq" and "temp" metrics.
+    """
+    freq, temp = await asyncio.gather(
+        FREQ_MONITOR.get_metrics(), TEMP_MONITOR.get_metrics()
+    )
+
+    return {"freq": freq, "temp": temp}
+
+
+CPU_SAMPLER = Sampler(sample=_sample_cpu_metrics)
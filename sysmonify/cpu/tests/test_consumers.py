@@ -4,9 +4,11 @@ This module contains unit tests for cpu.consumers
 """
 
 from django.test import TestCase
+from channels.layers import get_channel_layer
 from channels.testing import WebsocketCommunicator
 
 from cpu.consumers import CPUConsumer
+from cpu.tasks.monitors import CPU_SAMPLER
 
 
 class TestCPUConsumer(TestCase):
@@ -22,11 +24,28 @@ class TestCPUConsumer(TestCase):
         connected, subprotocol = await communicator.connect()
         self.assertTrue(connected)
 
-        response = await communicator.receive_json_from()
+        response = await communicator.receive_json_from(timeout=5)
         self.assertIn("details", response)
 
         await communicator.disconnect()
 
+    async def test_initial_message_contains_cpu_metrics(self):
+        """Test that the initial message also contains the first CPU metrics.
+
+        Asserts:
+            'details', 'freq' and 'temp' keys are present in the initial message.
+        """
+        communicator = WebsocketCommunicator(CPUConsumer.as_asgi(), "ws/cpu/")
+        connected, subprotocol = await communicator.connect()
+        self.assertTrue(connected)
+
+        response = await communicator.receive_json_from(timeout=5)
+        self.assertIn("details", response)
+        self.assertIn("freq", response)
+        self.assertIn("temp", response)
+
+        await communicator.disconnect()
+
     async def test_periodic_cpu_metrics_message(self):
         """Test that the consumer sends periodic messages containing CPU metrics.
 
@@ -37,10 +56,10 @@ class TestCPUConsumer(TestCase):
         connected, subprotocol = await communicator.connect()
         self.assertTrue(connected)
 
-        initial_response = await communicator.receive_json_from()
+        initial_response = await communicator.receive_json_from(timeout=5)
         self.assertIn("details", initial_response)
 
-        periodic_response = await communicator.receive_json_from()
+        periodic_response = await communicator.receive_json_from(timeout=3)
         self.assertIn("freq", periodic_response)
         self.assertIn("temp", periodic_response)
 
@@ -52,3 +71,32 @@ class TestCPUConsumer(TestCase):
         connected, subprotocol = await communicator.connect()
         self.assertTrue(connected)
         await communicator.disconnect()
+
+    async def test_disconnect_unsubscribes_from_cpu_sampler(self):
+        """Test that a disconnected client stops being counted by the CPU sampler.
+
+        Asserts:
+            - The sampler counts the connected client.
+            - The sampler has no subscribers and no sampling task after disconnecting.
+        """
+        communicator = WebsocketCommunicator(CPUConsumer.as_asgi(), "ws/cpu/")
+        connected, subprotocol = await communicator.connect()
+        self.assertTrue(connected)
+
+        await communicator.receive_json_from(timeout=5)
+        self.assertEqual(CPU_SAMPLER._subscribers, 1)
+        task = CPU_SAMPLER._task
+
+        await communicator.disconnect()
+
+        self.assertEqual(CPU_SAMPLER._subscribers, 0)
+        self.assertIsNone(CPU_SAMPLER._task)
+        self.assertTrue(task.cancelled() or task.done())
+
+    def test_no_channel_layer_configured(self):
+        """Test that the CPUConsumer does not rely on a channel layer.
+
+        Asserts:
+            No channel layer is available for the consumer's channel layer alias.
+        """
+        self.assertIsNone(get_channel_layer(CPUConsumer.channel_layer_alias))
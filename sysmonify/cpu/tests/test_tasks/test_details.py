@@ -4,18 +4,21 @@ This module contains unit tests for cpu.tasks.details
 """
 
 import asyncio
+import unittest
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from cpu.tasks.details import CPUDetails
 
 
-class TestCPUDetails(TestCase):
+class TestCPUDetails(SimpleTestCase):
     """Tests for `CPUDetails` class."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Initialize test class."""
-        self.cpu_details = CPUDetails()
+        super().setUpClass()
+        cls.cpu_details = CPUDetails()
 
     def test_get_cpu_info_returns_dict_with_expected_keys(self) -> None:
         """Test that the `get_cpu_info()` method returns a valid dictionary with all the expected keys.
@@ -46,3 +49,110 @@ class TestCPUDetails(TestCase):
         assert "min_frequency" in cpu_info
         assert "max_frequency" in cpu_info
         assert "cache_sizes" in cpu_info
+
+    def test_get_details_is_cached(self) -> None:
+        """Test that CPU details are only gathered once per process.
+
+        Asserts:
+            - Subsequent calls to `get_details()` do not query `psutil` again.
+            - Subsequent calls return an equal, but distinct, dictionary.
+        """
+        first = asyncio.run(self.cpu_details.get_details())
+
+        with unittest.mock.patch("psutil.cpu_freq") as mock_cpu_freq:
+            second = asyncio.run(CPUDetails().get_details())
+
+        mock_cpu_freq.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_get_details_cache_cannot_be_mutated(self) -> None:
+        """Test that mutating returned CPU details does not alter the cached details.
+
+        Asserts:
+            - Changes to the nested `cache_sizes` of one result are not visible in
+              subsequent results.
+        """
+        first = asyncio.run(self.cpu_details.get_details())
+        first["cache_sizes"]["l1"] = "mutated"
+
+        second = asyncio.run(CPUDetails().get_details())
+
+        self.assertNotEqual(second["cache_sizes"].get("l1"), "mutated")
+
+    def test_get_turbo_frequency_reads_sysfs(self) -> None:
+        """Test that the turbo frequency is read from sysfs and converted to MHz.
+
+        Asserts:
+            - The kHz value in `cpuinfo_max_freq` is returned in MHz.
+            - `lscpu` is not invoked.
+        """
+        with (
+            unittest.mock.patch.object(CPUDetails, "_turbo_frequency", None),
+            unittest.mock.patch(
+                "builtins.open", unittest.mock.mock_open(read_data="4700000\n")
+            ),
+            unittest.mock.patch("subprocess.run") as mock_run,
+        ):
+            turbo_freq = asyncio.run(self.cpu_details._get_turbo_frequency_linux())
+
+        self.assertEqual(turbo_freq, 4700.0)
+        mock_run.assert_not_called()
+
+    def test_get_turbo_frequency_falls_back_to_lscpu(self) -> None:
+        """Test that `lscpu` is used when the sysfs files are unavailable.
+
+        Asserts:
+            The value reported by `lscpu` is returned.
+        """
+        lscpu_output = unittest.mock.MagicMock(stdout="CPU max MHz:  4200.0000\n")
+
+        with (
+            unittest.mock.patch.object(CPUDetails, "_turbo_frequency", None),
+            unittest.mock.patch("builtins.open", side_effect=FileNotFoundError),
+            unittest.mock.patch("subprocess.run", return_value=lscpu_output),
+        ):
+            turbo_freq = asyncio.run(self.cpu_details._get_turbo_frequency_linux())
+
+        self.assertEqual(turbo_freq, 4200.0)
+
+    def test_get_details_uses_cpuinfo_thread_count(self) -> None:
+        """Test that the logical processor count reported by `cpuinfo` is reused.
+
+        Asserts:
+            - `psutil.cpu_count` is only queried for the physical core count.
+            - 'threads' is the `cpuinfo` logical processor count.
+        """
+        with (
+            unittest.mock.patch.object(CPUDetails, "_details", None),
+            unittest.mock.patch.object(CPUDetails, "_raw_cpu_info", {"count": 16}),
+            unittest.mock.patch.object(
+                CPUDetails,
+                "_get_cpu_cache_sizes",
+                unittest.mock.AsyncMock(return_value={}),
+            ),
+            unittest.mock.patch("psutil.cpu_count", return_value=8) as mock_count,
+        ):
+            cpu_info = asyncio.run(CPUDetails().get_details())
+
+        mock_count.assert_called_once_with(logical=False)
+        self.assertEqual(cpu_info["cores"], 8)
+        self.assertEqual(cpu_info["threads"], 16)
+
+    def test_get_turbo_frequency_is_cached(self) -> None:
+        """Test that the turbo frequency is only read once.
+
+        Asserts:
+            A second call returns the first value without reading sysfs again.
+        """
+        with (
+            unittest.mock.patch.object(CPUDetails, "_turbo_frequency", None),
+            unittest.mock.patch(
+                "builtins.open", unittest.mock.mock_open(read_data="4700000\n")
+            ) as mock_file,
+        ):
+            first = asyncio.run(self.cpu_details._get_turbo_frequency_linux())
+            second = asyncio.run(self.cpu_details._get_turbo_frequency_linux())
+
+        mock_file.assert_called_once()
+        self.assertEqual(first, second)
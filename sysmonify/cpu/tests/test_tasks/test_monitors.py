@@ -3,20 +3,51 @@
 This module contains unit tests for cpu.tasks.monitors
 """
 
+import os
 import asyncio
+import tempfile
 import unittest
 import collections
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 from cpu.tasks.monitors import CPUFreqMonitor, CPUThermalMonitor
 
 
-class TestCPUFreqMonitor(TestCase):
+class EventLoopTestCase(SimpleTestCase):
+    """Base test class that runs coroutines on one event loop shared by its tests."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the event loop shared by all tests in the class."""
+        super().setUpClass()
+        cls.loop = asyncio.new_event_loop()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Close the shared event loop."""
+        cls.loop.close()
+        super().tearDownClass()
+
+    def _run(self, coro):
+        """Run `coro` to completion on the shared event loop and return its result."""
+        return self.loop.run_until_complete(coro)
+
+
+class TestCPUFreqMonitor(EventLoopTestCase):
     """Test class for CPUFreqMonitor."""
 
     def setUp(self):
-        """Setup test class."""
+        """Setup test class.
+
+        Sysfs is disabled so that the `psutil` fallback is exercised.
+        """
+        patcher = unittest.mock.patch.object(
+            CPUFreqMonitor, "_open_scaling_cur_freq_fds", return_value=[]
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
         self.instance = CPUFreqMonitor()
 
     @unittest.mock.patch("psutil.cpu_freq")
@@ -33,7 +64,7 @@ class TestCPUFreqMonitor(TestCase):
         ]
         expected_output = {"Core 0": 2600.00, "Core 1": 2601.50}
 
-        result = asyncio.run(self.instance.get_metrics())
+        result = self._run(self.instance.get_metrics())
 
         self.assertEqual(result, expected_output)
 
@@ -52,7 +83,7 @@ class TestCPUFreqMonitor(TestCase):
         del mock_cpu_freq.return_value[0].current
 
         with self.assertRaises(TypeError) as context:
-            asyncio.run(self.instance.get_metrics())
+            self._run(self.instance.get_metrics())
         self.assertIn("Invalid structure in 'cpu_freq'", str(context.exception))
 
     @unittest.mock.patch("psutil.cpu_freq")
@@ -65,7 +96,7 @@ class TestCPUFreqMonitor(TestCase):
         mock_cpu_freq.side_effect = Exception("Failed to retrieve frequencies")
 
         with self.assertRaises(Exception) as context:
-            asyncio.run(self.instance.get_metrics())
+            self._run(self.instance.get_metrics())
         self.assertIn("Failed to retrieve frequencies", str(context.exception))
 
     @unittest.mock.patch("psutil.cpu_freq")
@@ -78,15 +109,91 @@ class TestCPUFreqMonitor(TestCase):
         mock_cpu_freq.return_value = ["invalid_data"]
 
         with self.assertRaises(TypeError) as context:
-            asyncio.run(self.instance.get_metrics())
+            self._run(self.instance.get_metrics())
         self.assertIn("Invalid structure in 'cpu_freq'", str(context.exception))
 
 
-class TestCPUThermalMonitor(TestCase):
+class TestCPUFreqMonitorSysfs(EventLoopTestCase):
+    """Test class for CPUFreqMonitor reading frequencies from sysfs."""
+
+    def setUp(self):
+        """Create a fake sysfs cpu directory with two cores."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        for core, freq in ((0, "2600000\n"), (1, "2601500\n")):
+            cpufreq_dir = os.path.join(tmp_dir.name, f"cpu{core}", "cpufreq")
+            os.makedirs(cpufreq_dir)
+            with open(os.path.join(cpufreq_dir, "scaling_cur_freq"), "w") as f:
+                f.write(freq)
+
+        os.makedirs(os.path.join(tmp_dir.name, "cpufreq"))
+
+        patcher = unittest.mock.patch.object(
+            CPUFreqMonitor, "_SYSFS_CPU_PATH", tmp_dir.name
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+        self.instance = CPUFreqMonitor()
+        self.addCleanup(self.instance.close)
+
+    @unittest.mock.patch("psutil.cpu_freq")
+    def test_get_metrics_reads_sysfs(self, mock_cpu_freq):
+        """Test that frequencies are read from sysfs and converted to MHz.
+
+        Asserts:
+            - One file descriptor is opened per core.
+            - `psutil.cpu_freq` is not called.
+            - The output has the expected format and values.
+        """
+        result = self._run(self.instance.get_metrics())
+
+        self.assertEqual(len(self.instance._fds), 2)
+        mock_cpu_freq.assert_not_called()
+        self.assertEqual(result, {"Core 0": 2600.00, "Core 1": 2601.50})
+
+    @unittest.mock.patch("psutil.cpu_freq")
+    def test_get_metrics_falls_back_to_psutil(self, mock_cpu_freq):
+        """Test that `psutil` is used if the sysfs files can no longer be read.
+
+        Asserts:
+            - The file descriptors are released.
+            - The output of `psutil.cpu_freq` is returned.
+        """
+        mock_cpu_freq.return_value = [unittest.mock.MagicMock(current=1200.00)]
+
+        with unittest.mock.patch("os.pread", side_effect=OSError):
+            result = self._run(self.instance.get_metrics())
+
+        self.assertEqual(self.instance._fds, [])
+        self.assertEqual(result, {"Core 0": 1200.00})
+
+    def test_close_releases_file_descriptors(self):
+        """Test that `close()` releases all open file descriptors.
+
+        Asserts:
+            No file descriptors are held after `close()` is called.
+        """
+        self.instance.close()
+
+        self.assertEqual(self.instance._fds, [])
+
+
+class TestCPUThermalMonitor(EventLoopTestCase):
     """Test cases for CPUThermalMonitor class."""
 
     def setUp(self):
-        """Set up any state required for the tests."""
+        """Set up any state required for the tests.
+
+        Sysfs is disabled so that the `psutil` fallback is exercised.
+        """
+        patcher = unittest.mock.patch.object(
+            CPUThermalMonitor, "_open_package_temp_fd", return_value=None
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
         self.monitor = CPUThermalMonitor()
         self.shwtemp = collections.namedtuple("shwtemp", ["label", "current"])
 
@@ -106,10 +213,42 @@ class TestCPUThermalMonitor(TestCase):
             ]
         }
 
-        result = asyncio.run(self.monitor.get_metrics())
+        result = self._run(self.monitor.get_metrics())
 
         self.assertEqual(result, {"package": "55.0"})
 
+    @unittest.mock.patch("psutil.sensors_temperatures")
+    def test_get_metrics_caches_package_sensor_index(self, mock_sensors_temperatures):
+        """Test that the index of the package sensor is remembered between calls.
+
+        Asserts:
+            - The index of the package sensor is cached after the first call.
+            - The cache is invalidated if the sensor at the index changes.
+        """
+        mock_sensors_temperatures.return_value = {
+            "coretemp": [
+                self.shwtemp(label="Core 0", current=40.0),
+                self.shwtemp(label="Package id 0", current=55.0),
+            ]
+        }
+
+        result = self._run(self.monitor.get_metrics())
+
+        self.assertEqual(result, {"package": "55.0"})
+        self.assertEqual(self.monitor._package_sensor_index, 1)
+
+        mock_sensors_temperatures.return_value = {
+            "coretemp": [
+                self.shwtemp(label="Package id 0", current=57.0),
+                self.shwtemp(label="Core 0", current=40.0),
+            ]
+        }
+
+        result = self._run(self.monitor.get_metrics())
+
+        self.assertEqual(result, {"package": "57.0"})
+        self.assertEqual(self.monitor._package_sensor_index, 0)
+
     @unittest.mock.patch("psutil.sensors_temperatures")
     def test_get_metrics_no_package(self, mock_sensors_temperatures):
         """Test when no 'Package id 0' sensor is available.
@@ -125,7 +264,7 @@ class TestCPUThermalMonitor(TestCase):
             ]
         }
 
-        result = asyncio.run(self.monitor.get_metrics())
+        result = self._run(self.monitor.get_metrics())
 
         self.assertEqual(result, {"package": "Unknown"})
 
@@ -139,7 +278,7 @@ class TestCPUThermalMonitor(TestCase):
         """
         mock_sensors_temperatures.return_value = {}
 
-        result = asyncio.run(self.monitor.get_metrics())
+        result = self._run(self.monitor.get_metrics())
 
         self.assertEqual(result, {"package": "Unknown"})
 
@@ -155,7 +294,7 @@ class TestCPUThermalMonitor(TestCase):
         )
 
         with self.assertRaises(AttributeError):
-            asyncio.run(self.monitor.get_metrics())
+            self._run(self.monitor.get_metrics())
 
     @unittest.mock.patch("psutil.sensors_temperatures")
     def test_get_metrics_type_error(self, mock_sensors_temperatures):
@@ -169,7 +308,7 @@ class TestCPUThermalMonitor(TestCase):
         )
 
         with self.assertRaises(TypeError):
-            asyncio.run(self.monitor.get_metrics())
+            self._run(self.monitor.get_metrics())
 
     @unittest.mock.patch("psutil.sensors_temperatures")
     def test_get_metrics_generic_exception(self, mock_sensors_temperatures):
@@ -183,4 +322,70 @@ class TestCPUThermalMonitor(TestCase):
         )
 
         with self.assertRaises(Exception):
-            asyncio.run(self.monitor.get_metrics())
+            self._run(self.monitor.get_metrics())
+
+
+class TestCPUThermalMonitorSysfs(EventLoopTestCase):
+    """Test cases for CPUThermalMonitor reading the package temperature from sysfs."""
+
+    def setUp(self):
+        """Create a fake sysfs hwmon directory with an `acpitz` and `coretemp` chip."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        files = {
+            "hwmon0/name": "acpitz\n",
+            "hwmon0/temp1_input": "30000\n",
+            "hwmon1/name": "coretemp\n",
+            "hwmon1/temp1_label": "Package id 0\n",
+            "hwmon1/temp1_input": "55000\n",
+            "hwmon1/temp2_label": "Core 0\n",
+            "hwmon1/temp2_input": "40000\n",
+        }
+        for path, content in files.items():
+            os.makedirs(
+                os.path.join(tmp_dir.name, os.path.dirname(path)), exist_ok=True
+            )
+            with open(os.path.join(tmp_dir.name, path), "w") as f:
+                f.write(content)
+
+        patcher = unittest.mock.patch.object(
+            CPUThermalMonitor, "_SYSFS_HWMON_PATH", tmp_dir.name
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+        self.monitor = CPUThermalMonitor()
+        self.addCleanup(self.monitor.close)
+
+    @unittest.mock.patch("psutil.sensors_temperatures")
+    def test_get_metrics_reads_sysfs(self, mock_sensors_temperatures):
+        """Test that the package temperature is read from the resolved hwmon file.
+
+        Asserts:
+            - `psutil.sensors_temperatures` is not called.
+            - The output has the expected format and value.
+        """
+        result = self._run(self.monitor.get_metrics())
+
+        mock_sensors_temperatures.assert_not_called()
+        self.assertEqual(result, {"package": "55.0"})
+
+    @unittest.mock.patch("psutil.sensors_temperatures")
+    def test_get_metrics_falls_back_to_psutil(self, mock_sensors_temperatures):
+        """Test that `psutil` is used if the hwmon file can no longer be read.
+
+        Asserts:
+            - The file descriptor is released.
+            - The output of `psutil.sensors_temperatures` is returned.
+        """
+        shwtemp = collections.namedtuple("shwtemp", ["label", "current"])
+        mock_sensors_temperatures.return_value = {
+            "coretemp": [shwtemp(label="Package id 0", current=60.0)]
+        }
+
+        with unittest.mock.patch("os.pread", side_effect=OSError):
+            result = self._run(self.monitor.get_metrics())
+
+        self.assertIsNone(self.monitor._fd)
+        self.assertEqual(result, {"package": "60.0"})
@@ -3,11 +3,11 @@
 Tests for CPU app views.
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 from django.urls import reverse
 
 
-class TestCpuView(TestCase):
+class TestCpuView(SimpleTestCase):
     """Test class for CpuView."""
 
     def test_cpu_view_status_code(self):
@@ -3,14 +3,24 @@
 A module containing WebSocket Consumers for the dashboard app.
 """
 
-import json
 import logging
 
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
 
 
 logger = logging.getLogger(__name__)
 
+# Example of initial metrics data (you would replace this with actual data), serialized
+# once at import rather than on every connection.
+INITIAL_METRICS_JSON = orjson.dumps(
+    {"cpu_usage": 50, "memory_usage": 65, "disk_usage": 40}
+).decode()
+
+# The complete ASGI send event for the initial metrics message. It is handed straight
+# to `base_send`, skipping the per-call event construction in `send`.
+INITIAL_METRICS_EVENT = {"type": "websocket.send", "text": INITIAL_METRICS_JSON}
+
 
 class DashboardConsumer(AsyncWebsocketConsumer):
     """WebSocket consumer for handling real-time dashboard updates.
@@ -18,46 +28,18 @@ class DashboardConsumer(AsyncWebsocketConsumer):
     This consumer allows clients to connect to a WebSocket endpoint
     and receive live system metrics, such as CPU usage, memory usage.
 
+    Disconnections and incoming messages are ignored, so the no-op `disconnect` and
+    `receive` handlers are inherited from `AsyncWebsocketConsumer`.
+
     Methods:
         connect: Handles a new WebSocket connection.
-        disconnect: Handles WebSocket disconnections.
-        receive: Handles incoming messages from the WebSocket client.
     """
 
     async def connect(self) -> None:
         """Handles a new WebSocket connection.
 
-        The method accepts the WebSocket connection, adds the client
-        to a group for broadcasting metrics, and sends an initial
-        success message.
+        The method accepts the WebSocket connection and sends the
+        pre-built initial metrics event.
         """
         await self.accept()
-
-        # Example of sending initial metrics data (you would replace this with actual data)
-        metrics_data = {"cpu_usage": 50, "memory_usage": 65, "disk_usage": 40}
-        await self.send(text_data=json.dumps(metrics_data))
-
-    async def disconnect(self, close_code: int) -> None:
-        """Handles WebSocket disconnections.
-
-        Removes the client from the metrics group when the connection is closed.
-
-        Args:
-            close_code (int): The WebSocket close code.
-        """
-        pass
-
-    async def receive(self, json: str) -> None:
-        """Handles incoming messages from the WebSocket client.
-
-        This method processes messages sent by the client. If necessary,
-        it can be extended to handle commands or actions requested by
-        the client.
-
-        Args:
-            json (str): The raw JSON message received from the client.
-
-        Raises:
-            ValueError: If the `text_data` is not valid JSON.
-        """
-        pass
+        await self.base_send(INITIAL_METRICS_EVENT)
@@ -8,16 +8,10 @@ Classes:
         client.
 """
 
-import logging
-
-from disk.tasks.details import DiskDetails
-from disk.tasks.monitors import DiskIOMonitor
+from disk.tasks.monitors import DISK_SAMPLER
 from sysmonify.core.consumers import Consumer
 
 
-logger = logging.getLogger(__name__)
-
-
 class DiskConsumer(Consumer):
     """WebSocket consumer for handling real-time system disk details/metrics updates to the client.
 
@@ -30,15 +24,42 @@ class DiskConsumer(Consumer):
     def __init__(self, *args, **kwargs):
         """Default initializer.
 
-        Initializes DiskDetails and DiskIOMonitor classes.
+        Uses the process-wide disk sampler rather than polling the disks per connection.
         """
         super().__init__(*args, **kwargs)
 
-        self.disk_details = DiskDetails()
-        self.io_monitor = DiskIOMonitor(disks=[])
+        self.sampler = DISK_SAMPLER
+
+    async def connect(self) -> None:
+        """Handles a new WebSocket connection.
+
+        Accepts a websocket connection from the client, subscribes to the disk sampler
+        and calls the `send_message_periodically()` method.
+
+        The consumer unsubscribes from the disk sampler when sending stops, e.g. when
+        the client disconnects and the consumer is cancelled. `disconnect()` cannot be
+        used for this, as it is only dispatched after `connect()` returns.
+        """
+        await self.accept()
+
+        try:
+            await self.sampler.subscribe()
+            await self.send_message_periodically()
+
+        finally:
+            self.sampler.unsubscribe()
+
+    async def wait_for_next_message(self, interval_seconds: float) -> None:
+        """Waits until the disk sampler has taken a new sample.
+
+        Args:
+            interval_seconds (float):
+                Unused, the sampler's own interval determines when to send.
+        """
+        await self.sampler.wait_for_sample()
 
     async def get_message_data(self) -> dict:
-        """Retrieve CPU metrics from various CPU monitors and return the data as a dictionary.
+        """Retrieve the latest disk details and metrics sampled by the disk sampler.
 
         Returns:
             dict:
@@ -50,11 +71,4 @@ class DiskConsumer(Consumer):
                     - 'disks_speeds':
                         Read/Write stats for all disks in 'disks'.
         """
-        disks = await self.disk_details.get_details()
-        disk_names = [disk["name"] for disk in disks]
-        self.io_monitor.disks = disk_names
-        disks_speeds = self.io_monitor.get_metrics()
-
-        disks = {"disks": disks, "disks_speeds": disks_speeds}
-
-        return disks
+        return await self.sampler.get_latest()
@@ -1,19 +1,22 @@
 """details.py.
 
 This module provides functionality to retrieve and display detailed information about
-the disks and their partitions on a Linux-based system. It leverages and tools like
-`lsblk`, and system files to gather disk-related data.
+the disks and their partitions on a Linux-based system. It reads `/sys/block`, the udev
+database and `/proc` to gather disk-related data, falling back to `lsblk` when sysfs is
+unavailable.
 
 Classes:
     DiskDetails:
         A class for retrieving details about disks and partitions on the system.
 """
 
-import json
+import os
 import logging
-import pathlib
 import subprocess
 
+import orjson
+
+from sysmonify.core.cache import async_ttl_cache
 from sysmonify.core.tasks import Details
 
 
@@ -28,8 +31,26 @@ class DiskDetails(Details):
     types, and additional metadata.
 
     Attributes:
-        LSBLK_HEADERS (list):
-            A list of column headers for `lsblk` subprocess to return.
+        _LSBLK_OPTIONS (str):
+            The comma separated columns for the `lsblk` subprocess to return, only
+            the columns shown on the disk page are requested.
+
+        _SYSFS_BLOCK_PATH (str):
+            The sysfs directory containing an entry for each block device.
+
+        _UDEV_DATA_PATH (str):
+            The udev database directory, holding filesystem and partition table
+            properties probed by udev.
+
+        _IGNORED_BLOCK_DEVICE_PREFIXES (tuple[str]):
+            Prefixes of virtual block devices which are never physical disks.
+
+        _PARTITION_TYPE_NAMES (dict[str, str]):
+            Display names of common partition types, as reported by `lsblk`, keyed by
+            the lowercase GPT type GUID or MBR type id recorded by udev.
+
+        _physical_disk_cache (dict):
+            Cached results of `_is_physical_disk()` keyed by block device name.
 
     Methods:
         get_details():
@@ -39,17 +60,17 @@ class DiskDetails(Details):
 
     def __init__(self) -> None:
         """Default initializer."""
-        self._LSBLK_HEADERS = [
+        self._physical_disk_cache = {}
+
+    _LSBLK_OPTIONS = ",".join(
+        [
             "NAME",
             "LABEL",
             "TYPE",
             "SERIAL",
             "SIZE",
-            "MOUNTPOINT",
             "VENDOR",
             "MODEL",
-            "VENDOR",
-            "PATH",
             "PARTN",
             "PARTTYPENAME",
             "FSTYPE",
@@ -57,10 +78,283 @@ class DiskDetails(Details):
             "TRAN",
             "PTTYPE",
             "UUID",
-            "ROTA",
         ]
+    )
+    _SYSFS_BLOCK_PATH = "/sys/block"
+    _UDEV_DATA_PATH = "/run/udev/data"
+    _IGNORED_BLOCK_DEVICE_PREFIXES = ("loop", "ram", "dm-")
+    _PARTITION_TYPE_NAMES = {
+        # GPT partition type GUIDs.
+        "c12a7328-f81f-11d2-ba4b-00a0c93ec93b": "EFI System",
+        "21686148-6449-6e6f-744e-656564454649": "BIOS boot",
+        "0fc63daf-8483-4772-8e79-3d69d8477de4": "Linux filesystem",
+        "0657fd6d-a4ab-43c4-84e5-0933c84b4f4f": "Linux swap",
+        "e6d6d379-f507-44c2-a23c-238f2a3df928": "Linux LVM",
+        "a19d880f-05fc-4d3b-a006-743f0f84911e": "Linux RAID",
+        "4f68bce3-e8cd-4db1-96e7-fbcaf984b709": "Linux root (x86-64)",
+        "933ac7e1-2eb4-4f13-b844-0e14e2aef915": "Linux home",
+        "bc13c2ff-59e6-4262-a352-b275fd6f7172": "Linux extended boot",
+        "ebd0a0a2-b9e5-4433-87c0-68b6b72699c7": "Microsoft basic data",
+        "e3c9e316-0b5c-4db8-817d-f92df00215ae": "Microsoft reserved",
+        "de94bba4-06d1-4d40-a16a-bfd50179d6ac": "Windows recovery environment",
+        "48465300-0000-11aa-aa11-00306543ecac": "Apple HFS/HFS+",
+        "7c3457ef-0000-11aa-aa11-00306543ecac": "Apple APFS",
+        # MBR partition type ids.
+        "0x5": "Extended",
+        "0x7": "HPFS/NTFS/exFAT",
+        "0xb": "W95 FAT32",
+        "0xc": "W95 FAT32 (LBA)",
+        "0xe": "W95 FAT16 (LBA)",
+        "0xf": "W95 Ext'd (LBA)",
+        "0x27": "Hidden NTFS WinRE",
+        "0x82": "Linux swap / Solaris",
+        "0x83": "Linux",
+        "0x8e": "Linux LVM",
+        "0xef": "EFI (FAT-12/16/32)",
+        "0xfd": "Linux raid autodetect",
+    }
+
+    def _read_sysfs(self, path: str) -> str | None:
+        """Reads and strips a single sysfs attribute file.
+
+        Args:
+            path (str):
+                The path of the sysfs attribute file.
+
+        Returns:
+            str | None:
+                The stripped contents of the file, or None if it does not exist, cannot
+                be read or is empty.
+        """
+        try:
+            with open(path, "r") as f:
+                value = f.read().strip()
+
+        except OSError:
+            return None
+
+        return value or None
+
+    def _read_udev_properties(self, device_path: str) -> dict:
+        """Reads the properties udev recorded for a block device.
+
+        Args:
+            device_path (str):
+                The sysfs directory of the block device, e.g. `/sys/block/sda`.
+
+        Returns:
+            dict:
+                The device's udev properties (e.g. `ID_FS_TYPE`), or an empty dictionary
+                if the udev database is unavailable.
+        """
+        properties = {}
+
+        dev = self._read_sysfs(os.path.join(device_path, "dev"))
+        if dev is None:
+            return properties
+
+        try:
+            with open(os.path.join(self._UDEV_DATA_PATH, f"b{dev}"), "r") as f:
+                for line in f:
+                    if line.startswith("E:"):
+                        key, _, value = line[2:].rstrip("\n").partition("=")
+                        properties[key] = value
+
+        except OSError:
+            pass
+
+        return properties
+
+    def _format_size(self, size_bytes: int) -> str:
+        """Formats a size in bytes the way `lsblk` does, e.g. `931.5G`.
+
+        Args:
+            size_bytes (int):
+                A size in bytes.
+
+        Returns:
+            str:
+                The size in the largest binary unit below it, with at most one decimal.
+        """
+        size = float(size_bytes)
+        for unit in ("B", "K", "M", "G", "T", "P"):
+            if size < 1024 or unit == "P":
+                break
+            size /= 1024
+
+        formatted = f"{size:.1f}".removesuffix(".0")
+        return f"{formatted}{unit}"
+
+    def _get_partition_type_name(self, udev: dict) -> str | None:
+        """Maps the partition type recorded by udev to its display name.
+
+        Args:
+            udev (dict):
+                The udev properties of the partition.
+
+        Returns:
+            str | None:
+                The partition type name, or None if udev recorded no partition type or
+                the type is not a common one.
+        """
+        part_type = udev.get("ID_PART_ENTRY_TYPE")
+        if not part_type:
+            return None
+
+        part_type = part_type.lower()
+        if part_type.startswith("0x"):
+            # Normalise MBR type ids such as `0x07` to the table's `0x7` form.
+            try:
+                part_type = f"0x{int(part_type, 16):x}"
+            except ValueError:
+                return None
+
+        return self._PARTITION_TYPE_NAMES.get(part_type)
+
+    def _get_transport(self, name: str, resolved_path: str, udev: dict) -> str | None:
+        """Determines the transport a disk is attached through.
+
+        Args:
+            name (str):
+                The name of the disk, e.g. `sda`.
 
-    def _get_raw_block_devices(self) -> dict:
+            resolved_path (str):
+                The resolved sysfs path of the disk.
+
+            udev (dict):
+                The udev properties of the disk.
+
+        Returns:
+            str | None:
+                The transport, e.g. `nvme`, `usb`, `sata` or `virtio`, or None if it
+                cannot be determined.
+        """
+        if name.startswith("nvme"):
+            return "nvme"
+        if "/usb" in resolved_path:
+            return "usb"
+        if "/virtio" in resolved_path:
+            return "virtio"
+        if "/ata" in resolved_path:
+            return "sata"
+
+        return udev.get("ID_BUS")
+
+    def _get_sysfs_block_device(
+        self, device_path: str, disk_udev: dict | None = None
+    ) -> dict:
+        """Builds an `lsblk`-style dictionary for a disk or partition from sysfs.
+
+        Args:
+            device_path (str):
+                The sysfs directory of the disk or partition.
+
+            disk_udev (dict | None):
+                The udev properties of the parent disk when `device_path` is a
+                partition, otherwise None.
+
+        Returns:
+            dict:
+                The device's details using the same keys as `lsblk -J` output.
+        """
+        name = os.path.basename(device_path)
+        udev = self._read_udev_properties(device_path)
+        sectors = self._read_sysfs(os.path.join(device_path, "size"))
+        partn = self._read_sysfs(os.path.join(device_path, "partition"))
+
+        device = {
+            "name": name,
+            "label": udev.get("ID_FS_LABEL"),
+            "type": "disk" if disk_udev is None else "part",
+            "size": self._format_size(int(sectors) * 512) if sectors else None,
+            "partn": int(partn) if partn else None,
+            "parttypename": self._get_partition_type_name(udev),
+            "fstype": udev.get("ID_FS_TYPE"),
+            "fsver": udev.get("ID_FS_VERSION"),
+            "uuid": udev.get("ID_FS_UUID"),
+        }
+
+        if disk_udev is not None:
+            return device
+
+        resolved_path = os.path.realpath(device_path)
+
+        device.update(
+            {
+                "serial": udev.get("ID_SERIAL_SHORT")
+                or self._read_sysfs(os.path.join(device_path, "device", "serial"))
+                or self._read_sysfs(os.path.join(device_path, "serial")),
+                "vendor": self._read_sysfs(
+                    os.path.join(device_path, "device", "vendor")
+                ),
+                "model": self._read_sysfs(os.path.join(device_path, "device", "model"))
+                or udev.get("ID_MODEL"),
+                "tran": self._get_transport(name, resolved_path, udev),
+                "pttype": udev.get("ID_PART_TABLE_TYPE"),
+            }
+        )
+
+        children = []
+        with os.scandir(device_path) as entries:
+            for entry in entries:
+                if entry.name.startswith(name) and os.path.exists(
+                    os.path.join(entry.path, "partition")
+                ):
+                    children.append(self._get_sysfs_block_device(entry.path, udev))
+
+        if children:
+            device["children"] = sorted(children, key=lambda child: child["partn"])
+
+        return device
+
+    def _get_sysfs_block_devices(self) -> list:
+        """Reads block device information for all disks and their partitions from sysfs.
+
+        Returns:
+            list:
+                A list of dictionaries with the same shape as the `blockdevices` of
+                `lsblk -J`, one per disk with its partitions under `children`.
+
+        Raises:
+            OSError:
+                If `/sys/block` cannot be read.
+        """
+        block_devices = []
+
+        for name in sorted(os.listdir(self._SYSFS_BLOCK_PATH)):
+            if name.startswith(self._IGNORED_BLOCK_DEVICE_PREFIXES):
+                continue
+
+            device_path = os.path.join(self._SYSFS_BLOCK_PATH, name)
+
+            try:
+                block_devices.append(self._get_sysfs_block_device(device_path))
+
+            except Exception as e:
+                logger.exception(f"Failed to read block device {name} from sysfs: {e}")
+
+        return block_devices
+
+    def _get_raw_block_devices(self) -> list:
+        """Returns block device information for all disks and their partitions.
+
+        Block devices are read directly from sysfs, `lsblk` is only executed if
+        `/sys/block` cannot be read.
+
+        Returns:
+            list:
+                A list of dictionaries with the same shape as the `blockdevices` of
+                `lsblk -J`.
+        """
+        try:
+            return self._get_sysfs_block_devices()
+
+        except OSError as e:
+            logger.warning(f"Failed to read block devices from sysfs, using lsblk. {e}")
+
+        return self._get_lsblk_block_devices()
+
+    def _get_lsblk_block_devices(self) -> dict:
         """Executes the 'lsblk' command and returns block device information as a Python dictionary.
 
         Returns:
@@ -74,7 +368,7 @@ class DiskDetails(Details):
             subprocess.CalledProcessError:
                 If 'lsblk' fails to execute or returns a non-zero exit code.
 
-            json.JSONDecodeError:
+            orjson.JSONDecodeError:
                 If the output from 'lsblk' is not valid JSON and cannot be parsed.
 
             Exception:
@@ -88,13 +382,12 @@ class DiskDetails(Details):
                     "lsblk",
                     "-J",
                     "-o",
-                    ",".join(self._LSBLK_HEADERS),
+                    self._LSBLK_OPTIONS,
                 ],
-                text=True,
                 capture_output=True,
                 check=True,
             )
-            disk_details = json.loads(result.stdout)
+            disk_details = orjson.loads(result.stdout)
 
         except FileNotFoundError:
             logger.exception(
@@ -105,7 +398,7 @@ class DiskDetails(Details):
         except subprocess.CalledProcessError as e:
             logger.exception(f"Error executing 'lsblk': {e}")
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.exception("Error: Failed to parse 'lsblk' JSON output.")
 
         except Exception as e:
@@ -116,11 +409,13 @@ class DiskDetails(Details):
     def _is_physical_disk(self, block_device_name: str) -> bool:
         """Checks if the given block device is a physical disk.
 
-        Constructs an expected symbolic link for a block device given its name then uses
-        linux built-in `readlink` command to return the actual location of the device.
-        If the device path contains a directory named "virtual" (or if it does not
-        exist) we assume it is a virtual disk, otherwise we can assume it is a physical
-        device.
+        Reads the target of the block device's symbolic link in `/sys/block`, which
+        points at the device's location under `/sys/devices`. If the target contains a
+        directory named "virtual" (or if it does not exist) we assume it is a virtual
+        disk, otherwise we can assume it is a physical device.
+
+        The answer does not change for the lifetime of the device, so successful
+        classifications are cached by device name.
 
         Args:
             block_device_name (str):
@@ -144,15 +439,20 @@ class DiskDetails(Details):
             Exception:
                 If an unexpected error occurs during execution.
         """
-        symlink = f"/sys/block/{block_device_name}"
+        if block_device_name in self._physical_disk_cache:
+            return self._physical_disk_cache[block_device_name]
+
+        symlink = os.path.join(self._SYSFS_BLOCK_PATH, block_device_name)
         is_physical = True
 
         try:
-            resolved_path = pathlib.Path(symlink).resolve(strict=True)
-
-            if "virtual" in str(resolved_path):
+            # The relative link target, e.g. `../devices/virtual/block/loop0`, is
+            # enough to classify the device without resolving every path component.
+            if "virtual" in os.readlink(symlink):
                 is_physical = False
 
+            self._physical_disk_cache[block_device_name] = is_physical
+
         except FileNotFoundError:
             logger.exception(
                 f"Error: The block device '{block_device_name}' does not exist with "
@@ -165,7 +465,7 @@ class DiskDetails(Details):
             is_physical = False
 
         except OSError as e:
-            logger.exception(f"Error: OS-related issue when resolving '{symlink}': {e}")
+            logger.exception(f"Error: OS-related issue when reading '{symlink}': {e}")
             is_physical = False
 
         except Exception:
@@ -186,6 +486,9 @@ class DiskDetails(Details):
         of type 'disk' and then verifies whether it is a physical disk using
         `_is_physical_disk()`. Only physical disks are included in the returned list.
 
+        Cached classifications of block devices which are no longer present are dropped,
+        so a device attached later under the same name is classified again.
+
         Args:
             raw_block_devices (list):
                 A list of dictionaries representing block devices, where each
@@ -197,6 +500,10 @@ class DiskDetails(Details):
         """
         physical_disks = []
 
+        device_names = {device.get("name") for device in raw_block_devices}
+        for device_name in self._physical_disk_cache.keys() - device_names:
+            del self._physical_disk_cache[device_name]
+
         for device in raw_block_devices:
             if device.get("type", "") == "disk":
                 device_name = device.get("name")
@@ -207,6 +514,7 @@ class DiskDetails(Details):
 
         return physical_disks
 
+    @async_ttl_cache(ttl_seconds=30)
     async def get_details(self) -> dict:
         """Retrieve and return a dictionary containing detail information about disks and their partitions.
 
@@ -214,6 +522,9 @@ class DiskDetails(Details):
         returns a dictionary containing all relevant information such as device name,
         vendor, model, size, filesystem type and more.
 
+        Disks are rarely attached or removed, so the result is reused for 30 seconds
+        rather than rescanning sysfs on every sample.
+
         Returns:
             dict:
                 A dictionary containing all relevant information related to disks and
@@ -7,16 +7,29 @@ Classes:
     - DiskIOMonitor:
         A class for retrieving real-time read/write stats for all physical disks.
 
+Attributes:
+    - DISK_DETAILS:
+        A process-wide `DiskDetails` shared by all consumers.
+    - IO_MONITOR:
+        A process-wide `DiskIOMonitor` shared by all consumers.
+    - DISK_SAMPLER:
+        A process-wide `Sampler` of disk details and read/write speeds, shared by all
+        consumers.
+
 Examples:
     - Fetching current read/write speed:
         monitor = DiskIOMonitor()
-        io = monitor.get_metrics()
+        io = await monitor.get_metrics()
 """
 
+import os
+import re
+import time
+import asyncio
 import logging
-import datetime
 
-from sysmonify.core.tasks import Monitor
+from disk.tasks.details import DiskDetails
+from sysmonify.core.tasks import SAMPLING_EXECUTOR, Monitor, Sampler
 
 
 logger = logging.getLogger(__name__)
@@ -40,7 +53,7 @@ class DiskIOMonitor(Monitor):
 
     Example:
         monitor = DiskIOMonitor()
-        metrics = monitor.get_metrics(interval=1)
+        metrics = await monitor.get_metrics()
         print(metrics)
 
         # Output:
@@ -56,10 +69,24 @@ class DiskIOMonitor(Monitor):
         # }
     """
 
+    _DISKSTATS_PATH = "/proc/diskstats"
+    _DISKSTATS_READ_SIZE = 8192
+
+    # The kernel reports disk stats in 512 byte sectors regardless of the disk's
+    # actual sector size.
+    _MEGABYTES_PER_SECTOR = 512 / (1024 * 1024)
+
+    # Matches the device name, sectors read and sectors written of each
+    # `/proc/diskstats` line, i.e. the 3rd, 6th and 10th space separated fields.
+    _DISKSTATS_PATTERN = re.compile(
+        rb"^ *\d+ +\d+ +(\S+) +\d+ +\d+ +(\d+)(?: +\d+){3} +(\d+)", re.MULTILINE
+    )
+
     def __init__(self, disks: list, smoothing_factor: float = 0.4) -> None:
         """Default initializer.
 
-        Retrieves initial read and written sector values.
+        The initial read and written sector values are recorded by the first call to
+        `get_metrics()`.
 
         Args:
             disks (list[str]):
@@ -69,11 +96,63 @@ class DiskIOMonitor(Monitor):
                 Used for calculating exponential moving average speeds.
 
         """
-        self._disks = disks
+        self._disks = tuple(disks)
+        self._disk_names = frozenset(disk.encode() for disk in disks)
         self._smoothing_factor = smoothing_factor
         self._ema_speeds = {}
-        self._previous_disks_sectors = self._get_current_disks_sectors()
-        self._previous_timestamp = datetime.datetime.now()
+        self._fd = None
+        self._previous_disks_sectors = None
+        self._previous_ns = None
+
+    def __del__(self, _close=os.close) -> None:
+        """Release the open file descriptor when the monitor is garbage collected.
+
+        `os.close` is bound as a default argument so it is still reachable when the
+        monitor is collected during interpreter shutdown, after module globals are
+        cleared.
+        """
+        self.close(_close=_close)
+
+    def close(self, _close=os.close) -> None:
+        """Closes the `/proc/diskstats` file descriptor if it is open."""
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            try:
+                _close(fd)
+            except OSError:
+                pass
+
+        self._fd = None
+
+    def _read_diskstats(self) -> bytes:
+        """Reads the whole of `/proc/diskstats` through the long-lived file descriptor.
+
+        The file is opened on first use and then kept open, each read uses `os.pread()`
+        from offset 0 so no seek or reopen is needed between reads.
+
+        Returns:
+            bytes:
+                The contents of `/proc/diskstats`.
+
+        Raises:
+            OSError:
+                If `/proc/diskstats` cannot be opened or read.
+        """
+        if self._fd is None:
+            self._fd = os.open(self._DISKSTATS_PATH, os.O_RDONLY | os.O_CLOEXEC)
+
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(self._fd, self._DISKSTATS_READ_SIZE, offset)
+            chunks.append(chunk)
+            offset += len(chunk)
+
+            # A short read means the end of the file was reached.
+            if len(chunk) < self._DISKSTATS_READ_SIZE:
+                break
+
+        return b"".join(chunks)
 
     @property
     def disks(self):
@@ -84,12 +163,20 @@ class DiskIOMonitor(Monitor):
     def disks(self, disks: list):
         """Sets the value of disks property.
 
+        The moving averages of disks which are still monitored are kept, while those
+        of removed disks are dropped so a disk attached later starts from scratch.
+
         Args:
             disks (list):
                 A list of disk names.
         """
+        disks = tuple(disks)
         if disks != self._disks:
             self._disks = disks
+            self._disk_names = frozenset(disk.encode() for disk in disks)
+
+            for disk_name in self._ema_speeds.keys() - set(disks):
+                del self._ema_speeds[disk_name]
 
     def _get_current_disks_sectors(self) -> dict:
         """Read disk stats for a devices from /proc/diskstats.
@@ -106,22 +193,17 @@ class DiskIOMonitor(Monitor):
         disks_sectors = {}
 
         try:
-            with open("/proc/diskstats", "r") as f:
-                for line in f:
-                    parts = line.split()
-                    if parts[2] in self._disks:
-                        try:
-                            read_sectors = int(parts[5])
-                            written_sectors = int(parts[9])
-
-                            disks_sectors[parts[2]] = {
-                                "read": read_sectors,
-                                "written": written_sectors,
-                            }
-                        except ValueError as e:
-                            logger.warning(
-                                f"Failed to convert disk stats for {parts[2]}: {e}"
-                            )
+            # Read the whole file at once so that all disks are read from the same
+            # snapshot, and only convert the values of monitored disks.
+            diskstats = self._read_diskstats()
+
+            for match in self._DISKSTATS_PATTERN.finditer(diskstats):
+                name, read_sectors, written_sectors = match.groups()
+                if name in self._disk_names:
+                    disks_sectors[name.decode()] = {
+                        "read": int(read_sectors),
+                        "written": int(written_sectors),
+                    }
 
         except FileNotFoundError:
             logger.error(
@@ -131,6 +213,7 @@ class DiskIOMonitor(Monitor):
             logger.error("Permission denied when trying to access /proc/diskstats.")
         except Exception as e:
             logger.error(f"Unexpected error while reading /proc/diskstats: {e}")
+            self.close()
 
         return disks_sectors
 
@@ -148,16 +231,17 @@ class DiskIOMonitor(Monitor):
             int:
                 An integer representing the MB equivalent of the given sectors.
         """
-        mb = (sectors * 512) / (1024 * 1024)
-        return mb
+        return sectors * self._MEGABYTES_PER_SECTOR
 
-    def get_metrics(self):
+    async def get_metrics(self) -> dict:
         """Measures real-time read and write speed for all physical disks.
 
         Compares current sectors read and written for each disk and calculates the
         average read and write speeds (MB/s) since the previous measurement. Calculates
         the exponential moving average in order to smooth out read/write spikes caused
-        by batch reads and writes.
+        by batch reads and writes. `/proc/diskstats` is read in the sampling executor so
+        the event loop is not blocked by the file read. The first call only records the
+        baseline and returns an empty dictionary.
 
         Returns:
             dict:
@@ -167,9 +251,6 @@ class DiskIOMonitor(Monitor):
                     - 'write_speed' (float): Write speed in MB/s.
 
         Raises:
-            ValueError:
-                If time delta is zero or negative, preventing division errors.
-
             KeyError:
                 If expected keys are missing from sector data.
 
@@ -179,72 +260,64 @@ class DiskIOMonitor(Monitor):
         current_disks_speeds = {}
 
         try:
-            current_disks_sectors = self._get_current_disks_sectors()
-            current_timestamp = datetime.datetime.now()
-            time_delta = current_timestamp - self._previous_timestamp
-            time_delta_seconds = time_delta.total_seconds()
+            current_disks_sectors = await asyncio.get_running_loop().run_in_executor(
+                SAMPLING_EXECUTOR, self._get_current_disks_sectors
+            )
+            current_ns = time.monotonic_ns()
+
+            # The first measurement only records the baseline for the next one.
+            if self._previous_disks_sectors is None:
+                self._previous_disks_sectors = current_disks_sectors
+                self._previous_ns = current_ns
+                return current_disks_speeds
+
+            time_delta_seconds = (current_ns - self._previous_ns) / 1e9
 
+            # The monotonic clock never goes backwards, but two samples may fall in
+            # the same clock tick. Repeat the previous speeds rather than dividing by
+            # zero, and keep the previous sectors for the next measurement.
             if time_delta_seconds <= 0:
-                raise ValueError(
-                    "Invalid time delta: time must be strictly increasing."
-                )
+                return {
+                    disk_name: self._ema_speeds[disk_name]
+                    for disk_name in self._disks
+                    if disk_name in self._ema_speeds
+                }
+
+            # Speeds are linear in the sector deltas, so convert with a single
+            # multiplication per disk rather than a conversion and division each.
+            mbps_per_sector = self._MEGABYTES_PER_SECTOR / time_delta_seconds
+            alpha = self._smoothing_factor
 
             for disk_name in self._disks:
-                if disk_name not in self._previous_disks_sectors:
+                previous_disk_sectors = self._previous_disks_sectors.get(disk_name)
+                if previous_disk_sectors is None:
                     continue
 
                 try:
                     current_disk_sectors = current_disks_sectors.get(disk_name, {})
-                    current_sectors_read = current_disk_sectors.get("read", 0)
-                    current_sectors_written = current_disk_sectors.get("written", 0)
-
-                    previous_disk_sectors = self._previous_disks_sectors[disk_name]
-                    read_sectors_delta = (
-                        current_sectors_read - previous_disk_sectors.get("read", 0)
-                    )
-                    written_sectors_delta = (
-                        current_sectors_written
-                        - previous_disk_sectors.get("written", 0)
-                    )
-
-                    read_delta_mb = self._sectors_to_megabytes(
-                        sectors=read_sectors_delta
-                    )
-                    written_delta_mb = self._sectors_to_megabytes(
-                        sectors=written_sectors_delta
-                    )
-
                     read_mbps = (
-                        read_delta_mb / time_delta_seconds
-                        if read_delta_mb != 0
-                        else 0.0
-                    )
+                        current_disk_sectors.get("read", 0)
+                        - previous_disk_sectors.get("read", 0)
+                    ) * mbps_per_sector
                     written_mbps = (
-                        written_delta_mb / time_delta_seconds
-                        if written_delta_mb != 0
-                        else 0.0
-                    )
-
-                    if disk_name not in self._ema_speeds:
-                        self._ema_speeds[disk_name] = {
-                            "read_speed": read_mbps,
-                            "write_speed": written_mbps,
-                        }
-
-                    self._ema_speeds[disk_name]["read_speed"] = (
-                        self._smoothing_factor * read_mbps
-                        + (1 - self._smoothing_factor)
-                        * self._ema_speeds[disk_name]["read_speed"]
-                    )
-                    self._ema_speeds[disk_name]["write_speed"] = (
-                        self._smoothing_factor * written_mbps
-                        + (1 - self._smoothing_factor)
-                        * self._ema_speeds[disk_name]["write_speed"]
-                    )
-
-                    current_disks_speeds[disk_name] = {
-                        "read_speed": self._ema_speeds[disk_name]["read_speed"],
-                        "write_speed": self._ema_speeds[disk_name]["write_speed"],
+                        current_disk_sectors.get("written", 0)
+                        - previous_disk_sectors.get("written", 0)
+                    ) * mbps_per_sector
+
+                    # The first measurement of a disk seeds its moving average.
+                    ema_speeds = self._ema_speeds.get(disk_name)
+                    if ema_speeds is not None:
+                        read_mbps = (
+                            alpha * read_mbps + (1 - alpha) * ema_speeds["read_speed"]
+                        )
+                        written_mbps = (
+                            alpha * written_mbps
+                            + (1 - alpha) * ema_speeds["write_speed"]
+                        )
+
+                    self._ema_speeds[disk_name] = current_disks_speeds[disk_name] = {
+                        "read_speed": read_mbps,
+                        "write_speed": written_mbps,
                     }
 
                 except KeyError as e:
@@ -257,11 +330,29 @@ class DiskIOMonitor(Monitor):
                     )
 
             self._previous_disks_sectors = current_disks_sectors
-            self._previous_timestamp = current_timestamp
+            self._previous_ns = current_ns
 
-        except ValueError as e:
-            logger.error(f"ValueError: {e}")
         except Exception as e:
             logger.exception(f"Unexpected error in get_metrics: {e}")
 
         return current_disks_speeds
+
+
+DISK_DETAILS = DiskDetails()
+IO_MONITOR = DiskIOMonitor(disks=[])
+
+
+async def _sample_disk_metrics() -> dict:
+    """Retrieve details of all physical disks and their current read/write speeds.
+
+    Returns:
+        dict:
+            A dictionary with the "disks" details and "disks_speeds" metrics.
+    """
+    disks = await DISK_DETAILS.get_details()
+    IO_MONITOR.disks = [disk["name"] for disk in disks]
+
+    return {"disks": disks, "disks_speeds": await IO_MONITOR.get_metrics()}
+
+
+DISK_SAMPLER = Sampler(sample=_sample_disk_metrics)
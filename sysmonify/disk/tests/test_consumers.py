@@ -4,10 +4,12 @@ This module contains unit tests for the DiskConsumer.
 """
 
 import asyncio
+import unittest
 from django.test import TestCase
 from channels.testing import WebsocketCommunicator
 
 from disk.consumers import DiskConsumer
+from disk.tasks.monitors import DISK_DETAILS, DISK_SAMPLER
 
 
 class TestDiskConsumer(TestCase):
@@ -57,3 +59,38 @@ class TestDiskConsumer(TestCase):
         connected, _ = await communicator.connect()
         self.assertTrue(connected)
         await communicator.disconnect()
+
+    async def test_connections_share_disk_sampler(self):
+        """Test that concurrent connections share a single disk sample.
+
+        Asserts:
+            - Both clients receive the same disk details.
+            - Disk details are only retrieved once for both connections.
+            - The disk sampler stops once both clients have disconnected.
+        """
+        disks = [{"name": "sda"}]
+
+        with unittest.mock.patch.object(
+            DISK_DETAILS,
+            "get_details",
+            new_callable=unittest.mock.AsyncMock,
+            return_value=disks,
+        ) as mock_get_details:
+            first = WebsocketCommunicator(DiskConsumer.as_asgi(), "ws/disks/")
+            second = WebsocketCommunicator(DiskConsumer.as_asgi(), "ws/disks/")
+
+            self.assertTrue((await first.connect())[0])
+            self.assertTrue((await second.connect())[0])
+
+            first_response = await first.receive_json_from()
+            second_response = await second.receive_json_from()
+
+            self.assertEqual(first_response["disks"], disks)
+            self.assertEqual(second_response["disks"], disks)
+            mock_get_details.assert_awaited_once()
+
+            await first.disconnect()
+            await second.disconnect()
+
+        self.assertEqual(DISK_SAMPLER._subscribers, 0)
+        self.assertIsNone(DISK_SAMPLER._task)
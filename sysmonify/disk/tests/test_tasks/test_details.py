@@ -3,10 +3,13 @@
 Tests for disk.tasks.details module.
 """
 
+import os
 import asyncio
-import json
+import tempfile
 import unittest
 
+import orjson
+
 from django.test import TestCase
 
 from disk.tasks.details import DiskDetails
@@ -20,15 +23,15 @@ class DiskDetailsTestCase(TestCase):
         self.disk_details = DiskDetails()
 
     @unittest.mock.patch("subprocess.run")
-    def test_get_raw_block_devices_success(self, mock_subprocess):
-        """Test _get_raw_block_devices when lsblk returns valid JSON data.
+    def test_get_lsblk_block_devices_success(self, mock_subprocess):
+        """Test _get_lsblk_block_devices when lsblk returns valid JSON data.
 
         Asserts:
             - A list is returned.
             - The correct number of element are present in the list.
             - The name of the first block device is what is expected.
         """
-        mock_output = json.dumps(
+        mock_output = orjson.dumps(
             {
                 "blockdevices": [
                     {"name": "sda", "type": "disk", "size": "500G"},
@@ -38,25 +41,74 @@ class DiskDetailsTestCase(TestCase):
         )
         mock_subprocess.return_value = unittest.mock.MagicMock(stdout=mock_output)
 
-        result = self.disk_details._get_raw_block_devices()
+        result = self.disk_details._get_lsblk_block_devices()
         self.assertIsInstance(result, list)
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]["name"], "sda")
 
-    @unittest.mock.patch("pathlib.Path.resolve")
-    def test_is_physical_disk(self, mock_resolve):
+    def test_get_raw_block_devices_falls_back_to_lsblk(self):
+        """Test that lsblk is only used when `/sys/block` cannot be read.
+
+        Asserts:
+            The output of `_get_lsblk_block_devices` is returned.
+        """
+        lsblk_devices = [{"name": "sda", "type": "disk"}]
+
+        with (
+            unittest.mock.patch.object(
+                DiskDetails, "_SYSFS_BLOCK_PATH", "/nonexistent/sys/block"
+            ),
+            unittest.mock.patch.object(
+                DiskDetails, "_get_lsblk_block_devices", return_value=lsblk_devices
+            ) as mock_lsblk,
+        ):
+            result = self.disk_details._get_raw_block_devices()
+
+        mock_lsblk.assert_called_once()
+        self.assertEqual(result, lsblk_devices)
+
+    def test_format_size(self):
+        """Test that sizes in bytes are formatted like `lsblk` does.
+
+        Asserts:
+            Sizes are shown in the largest binary unit with at most one decimal.
+        """
+        self.assertEqual(self.disk_details._format_size(512), "512B")
+        self.assertEqual(self.disk_details._format_size(256 * 1024**3), "256G")
+        self.assertEqual(self.disk_details._format_size(1000204886016), "931.5G")
+
+    @unittest.mock.patch("os.readlink")
+    def test_is_physical_disk(self, mock_readlink):
         """Test _is_physical_disk to differentiate physical and virtual disks.
 
         Asserts:
             - `True` is returned for physical disks.
             - `False` is returned for virtual disks.
         """
-        mock_resolve.return_value = "/sys/devices/pci0000:00/0000:00:1f.2/ata1/host0/target0:0:0/0:0:0:0/block/sda"
+        mock_readlink.return_value = "../devices/pci0000:00/0000:00:1f.2/ata1/host0/target0:0:0/0:0:0:0/block/sda"
         self.assertTrue(self.disk_details._is_physical_disk("sda"))
 
-        mock_resolve.return_value = "/sys/devices/virtual/block/zd0"
+        mock_readlink.return_value = "../devices/virtual/block/zd0"
         self.assertFalse(self.disk_details._is_physical_disk("zd0"))
 
+    @unittest.mock.patch("os.readlink")
+    def test_is_physical_disk_is_cached(self, mock_readlink):
+        """Test that block devices are only classified once while they are present.
+
+        Asserts:
+            - The symbolic link is only read once for repeated checks.
+            - A device is classified again after it disappeared from a scan.
+        """
+        mock_readlink.return_value = "../devices/pci0000:00/ata1/block/sda"
+
+        self.assertTrue(self.disk_details._is_physical_disk("sda"))
+        self.assertTrue(self.disk_details._is_physical_disk("sda"))
+        self.assertEqual(mock_readlink.call_count, 1)
+
+        self.disk_details._get_physical_disks_from_raw_block_devices([])
+        self.assertTrue(self.disk_details._is_physical_disk("sda"))
+        self.assertEqual(mock_readlink.call_count, 2)
+
     def test_get_physical_disks_from_raw_block_devices(self):
         """Test filtering physical disks from block devices.
 
@@ -104,3 +156,103 @@ class DiskDetailsTestCase(TestCase):
         details = asyncio.run(self.disk_details.get_details())
         self.assertEqual(len(details), 1)
         self.assertEqual(details[0]["name"], "sda")
+
+
+class DiskDetailsSysfsTestCase(TestCase):
+    """Test case for the DiskDetails class reading block devices from sysfs."""
+
+    def setUp(self):
+        """Create a fake sysfs block directory and udev database.
+
+        The fake sysfs contains an SSD `sda` with one partition, and a loop device.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+
+        files = {
+            "block/sda/dev": "8:0",
+            "block/sda/size": "1953525168",
+            "block/sda/device/vendor": "ATA     ",
+            "block/sda/device/model": "Samsung SSD 860",
+            "block/sda/sda1/dev": "8:1",
+            "block/sda/sda1/size": "2048",
+            "block/sda/sda1/partition": "1",
+            "block/loop0/dev": "7:0",
+            "block/loop0/size": "0",
+            "udev/b8:0": "E:ID_SERIAL_SHORT=S3Z9NB0K\nE:ID_PART_TABLE_TYPE=gpt\n",
+            "udev/b8:1": (
+                "E:ID_FS_TYPE=ext4\nE:ID_FS_VERSION=1.0\nE:ID_FS_UUID=1234\n"
+                "E:ID_PART_ENTRY_TYPE=C12A7328-F81F-11D2-BA4B-00A0C93EC93B\n"
+            ),
+        }
+        for path, contents in files.items():
+            path = os.path.join(tmp_dir.name, path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(contents)
+
+        for attribute, path in (
+            ("_SYSFS_BLOCK_PATH", "block"),
+            ("_UDEV_DATA_PATH", "udev"),
+        ):
+            patcher = unittest.mock.patch.object(
+                DiskDetails, attribute, os.path.join(tmp_dir.name, path)
+            )
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+        self.disk_details = DiskDetails()
+
+    @unittest.mock.patch("subprocess.run")
+    def test_get_raw_block_devices_reads_sysfs(self, mock_subprocess):
+        """Test that block devices are read from sysfs in the shape of `lsblk -J`.
+
+        Asserts:
+            - `lsblk` is not executed.
+            - Loop devices are skipped.
+            - Disk and partition details are read from sysfs and the udev database.
+        """
+        result = self.disk_details._get_raw_block_devices()
+
+        mock_subprocess.assert_not_called()
+        self.assertEqual([device["name"] for device in result], ["sda"])
+
+        disk = result[0]
+        self.assertEqual(disk["type"], "disk")
+        self.assertEqual(disk["size"], "931.5G")
+        self.assertEqual(disk["vendor"], "ATA")
+        self.assertEqual(disk["model"], "Samsung SSD 860")
+        self.assertEqual(disk["serial"], "S3Z9NB0K")
+        self.assertEqual(disk["pttype"], "gpt")
+
+        partition = disk["children"][0]
+        self.assertEqual(partition["name"], "sda1")
+        self.assertEqual(partition["type"], "part")
+        self.assertEqual(partition["partn"], 1)
+        self.assertEqual(partition["size"], "1M")
+        self.assertEqual(partition["fstype"], "ext4")
+        self.assertEqual(partition["fsver"], "1.0")
+        self.assertEqual(partition["uuid"], "1234")
+        self.assertEqual(partition["parttypename"], "EFI System")
+
+    def test_get_partition_type_name(self):
+        """Test that udev partition types are mapped to their display names.
+
+        Asserts:
+            - GPT type GUIDs are matched case-insensitively.
+            - MBR type ids are matched with or without leading zeros.
+            - Unknown, malformed or missing partition types return None.
+        """
+        for part_type, expected in (
+            ("0FC63DAF-8483-4772-8E79-3D69D8477DE4", "Linux filesystem"),
+            ("0x83", "Linux"),
+            ("0x07", "HPFS/NTFS/exFAT"),
+            ("0xda", None),
+            ("0xzz", None),
+            (None, None),
+        ):
+            udev = {} if part_type is None else {"ID_PART_ENTRY_TYPE": part_type}
+            with self.subTest(part_type=part_type):
+                self.assertEqual(
+                    self.disk_details._get_partition_type_name(udev), expected
+                )
@@ -3,7 +3,9 @@
 Test cases for disk.tests.monitors
 """
 
-import datetime
+import os
+import asyncio
+import tempfile
 import unittest
 
 from disk.tasks.monitors import DiskIOMonitor
@@ -25,25 +27,12 @@ class TestDiskIOMonitor(unittest.TestCase):
 
         Creates:
             - list of disks.
-            - mock object for mocking `_get_current_sectors` method.
+            - `DiskIOMonitor` for the disks.
         """
         self.disks = ["sda", "nvme0n1"]
-        patcher = unittest.mock.patch.object(
-            DiskIOMonitor,
-            "_get_current_disks_sectors",
-            return_value={
-                "sda": {"read": 0, "written": 0},
-                "nvme0n1": {"read": 0, "written": 0},
-            },
-        )
-        self.addCleanup(patcher.stop)
-        self.mock_init_sectors = patcher.start()
-
         self.monitor = DiskIOMonitor(disks=self.disks)
 
-    @unittest.mock.patch(
-        "disk.tasks.monitors.datetime.datetime", wraps=datetime.datetime
-    )
+    @unittest.mock.patch("disk.tasks.monitors.time.monotonic_ns")
     @unittest.mock.patch.object(
         DiskIOMonitor,
         "_get_current_disks_sectors",
@@ -52,7 +41,7 @@ class TestDiskIOMonitor(unittest.TestCase):
             "nvme0n1": {"read": 2048, "written": 8192},
         },
     )
-    def test_get_metrics(self, mock_get_sectors, mock_datetime):
+    def test_get_metrics(self, mock_get_sectors, mock_monotonic_ns):
         """Test get metrics.
 
         Asserts:
@@ -60,16 +49,14 @@ class TestDiskIOMonitor(unittest.TestCase):
             - Each disk has `read_speed` and `write_speed` keys.
             - `read_speed` and `write_speed` are of type `float`
         """
-        self.monitor._previous_timestamp = datetime.datetime(2024, 2, 5, 12, 0, 0)
+        self.monitor._previous_ns = 1_000_000_000
         self.monitor._previous_disks_sectors = {
             "sda": {"read": 0, "written": 0},
             "nvme0n1": {"read": 0, "written": 0},
         }
-        mock_datetime.now.side_effect = [
-            datetime.datetime(2024, 2, 5, 12, 0, 1),
-        ]
+        mock_monotonic_ns.return_value = 2_000_000_000
 
-        metrics = self.monitor.get_metrics()
+        metrics = asyncio.run(self.monitor.get_metrics())
 
         expected_metrics = {
             "sda": {"read_speed": unittest.mock.ANY, "write_speed": unittest.mock.ANY},
@@ -86,6 +73,103 @@ class TestDiskIOMonitor(unittest.TestCase):
             self.assertIsInstance(metrics[disk]["read_speed"], float)
             self.assertIsInstance(metrics[disk]["write_speed"], float)
 
+    @unittest.mock.patch.object(
+        DiskIOMonitor,
+        "_get_current_disks_sectors",
+        return_value={"sda": {"read": 1024, "written": 4096}},
+    )
+    def test_get_metrics_records_baseline_first(self, mock_get_sectors):
+        """Test that the first measurement only records the baseline.
+
+        Asserts:
+            - No baseline is recorded before the first measurement.
+            - The first measurement returns no speeds.
+            - The sectors of the first measurement become the baseline.
+        """
+        self.assertIsNone(self.monitor._previous_disks_sectors)
+
+        metrics = asyncio.run(self.monitor.get_metrics())
+
+        mock_get_sectors.assert_called_once()
+        self.assertEqual(metrics, {})
+        self.assertEqual(
+            self.monitor._previous_disks_sectors,
+            {"sda": {"read": 1024, "written": 4096}},
+        )
+
+    @unittest.mock.patch("disk.tasks.monitors.time.monotonic_ns")
+    def test_get_metrics_repeats_speeds_without_elapsed_time(self, mock_monotonic_ns):
+        """Test that the previous speeds are returned when no time has passed.
+
+        Asserts:
+            - The previous speeds are returned.
+            - The previous sectors are kept for the next measurement.
+        """
+        speeds = {"read_speed": 1.0, "write_speed": 2.0}
+        self.monitor._ema_speeds = {"sda": speeds}
+        previous_disks_sectors = {"sda": {"read": 0, "written": 0}}
+        self.monitor._previous_disks_sectors = previous_disks_sectors
+        self.monitor._previous_ns = 1_000_000_000
+        mock_monotonic_ns.return_value = 1_000_000_000
+
+        metrics = asyncio.run(self.monitor.get_metrics())
+
+        self.assertEqual(metrics, {"sda": speeds})
+        self.assertIs(self.monitor._previous_disks_sectors, previous_disks_sectors)
+
+    def test_set_disks_keeps_moving_averages(self):
+        """Test that changing the monitored disks only drops state of removed disks.
+
+        Asserts:
+            - Disks are stored in the given order.
+            - Moving averages of disks which are still monitored are kept.
+            - Moving averages of removed disks are dropped.
+        """
+        speeds = {"read_speed": 1.0, "write_speed": 2.0}
+        self.monitor._ema_speeds = {"sda": speeds, "nvme0n1": speeds}
+
+        self.monitor.disks = ["nvme0n1", "sdb"]
+
+        self.assertEqual(self.monitor.disks, ("nvme0n1", "sdb"))
+        self.assertEqual(self.monitor._ema_speeds, {"nvme0n1": speeds})
+
+    def test_get_current_disks_sectors(self):
+        """Test that sectors are parsed from `/proc/diskstats` for monitored disks only.
+
+        Asserts:
+            - Sectors read and written are parsed for monitored disks.
+            - Unmonitored devices are ignored.
+            - The file descriptor is kept open between reads.
+        """
+        diskstats = (
+            b"   7       0 loop0 10 0 20 0 0 0 0 0 0 0 0 0 0 0 0 0 0\n"
+            b"   8       0 sda 100 5 2048 30 40 6 4096 70 0 80 90 0 0 0 0 0 0\n"
+            b" 259       0 nvme0n1 1 2 512 4 5 6 1024 8 0 9 10 0 0 0 0 0 0\n"
+        )
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        diskstats_path = os.path.join(tmp_dir.name, "diskstats")
+        with open(diskstats_path, "wb") as f:
+            f.write(diskstats)
+
+        with unittest.mock.patch.object(
+            DiskIOMonitor, "_DISKSTATS_PATH", diskstats_path
+        ):
+            sectors = self.monitor._get_current_disks_sectors()
+            fd = self.monitor._fd
+            self.monitor._get_current_disks_sectors()
+
+        self.addCleanup(self.monitor.close)
+        self.assertEqual(self.monitor._fd, fd)
+        self.assertEqual(
+            sectors,
+            {
+                "sda": {"read": 2048, "written": 4096},
+                "nvme0n1": {"read": 512, "written": 1024},
+            },
+        )
+
     def test_sectors_to_megabytes(self):
         """Test that sectors can be converted to megabytes.
 
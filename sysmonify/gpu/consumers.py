@@ -8,12 +8,12 @@ Classes:
         client.
 """
 
-import json
+import asyncio
 
 from sysmonify.core.consumers import Consumer
 
 from gpu.tasks.details import GPUDetails
-from gpu.tasks.monitors import GPUMonitor
+from gpu.tasks.monitors import GPU_SAMPLER
 
 
 class GPUConsumer(Consumer):
@@ -26,33 +26,56 @@ class GPUConsumer(Consumer):
     """
 
     def __init__(self, *args, **kwargs) -> None:
-        """Default initializer."""
+        """Default initializer.
+
+        Uses the process-wide GPU sampler rather than querying the GPUs per connection.
+        """
         super().__init__(*args, **kwargs)
 
-        self.gpu_monitor = GPUMonitor()
+        self.sampler = GPU_SAMPLER
 
-    async def connect(self):
+    async def connect(self) -> None:
         """Handles a new WebSocket connection.
 
-        Accepts a websocket connection from the client, send initial message containing
-        static GPU details, and calls the `send_message_periodically()` method.
+        Accepts a websocket connection from the client, subscribes to the GPU sampler,
+        sends a single initial message containing static GPU details along with the
+        first GPU metrics, and calls the `send_message_periodically()` method.
+
+        The consumer unsubscribes from the GPU sampler when sending stops, e.g. when
+        the client disconnects and the consumer is cancelled. `disconnect()` cannot be
+        used for this, as it is only dispatched after `connect()` returns.
         """
         await self.accept()
 
-        gpu_details = {"details": await GPUDetails().get_details()}
-        await self.send(text_data=json.dumps(gpu_details))
-        await self.send_message_periodically()
+        try:
+            await self.sampler.subscribe()
+
+            gpu_details, gpu_metrics = await asyncio.gather(
+                GPUDetails().get_details(), self.get_message_data()
+            )
+            initial_message = {"details": gpu_details, **gpu_metrics}
+            await self.send_message(initial_message)
+            await self.send_message_periodically(wait_before_first_message=True)
+
+        finally:
+            self.sampler.unsubscribe()
+
+    async def wait_for_next_message(self, interval_seconds: float) -> None:
+        """Waits until the GPU sampler has taken a new sample.
+
+        Args:
+            interval_seconds (float):
+                Unused, the `GPU_POLL_INTERVAL_SECONDS` interval of the sampler
+                determines when to send.
+        """
+        await self.sampler.wait_for_sample()
 
     async def get_message_data(self) -> dict:
-        """Retrieve GPU metrics and return the data as a dictionary.
+        """Retrieve the latest GPU metrics sampled by the GPU sampler.
 
         Returns:
             dict:
                 A dictionary containing upto date GPU metrics such as temperature and
                 utilization.
         """
-        gpu_metrics = {
-            "metrics": await self.gpu_monitor.get_metrics(),
-        }
-
-        return gpu_metrics
+        return await self.sampler.get_latest()
@@ -280,7 +280,7 @@
                     let powerDrawFloat = parseFloat(powerDraw);
                     let powerMaxFloat = parseFloat(powerMax);
                     let powerUtil = powerDrawFloat / powerMaxFloat * 100;
-                    powerDrawText.innerText = `${powerDraw} / ${powerMax} W`;
+                    powerDrawText.innerText = `${powerDrawFloat.toFixed(2)} / ${powerMax} W`;
                     powerDrawProgressBar.setAttribute("aria-valuenow", powerUtil);
                     powerDrawProgressBar.setAttribute("style", `width: ${powerUtil}%`);
 
@@ -317,26 +317,23 @@
                     const dropdownMenu = document.querySelector('.dropdown-menu');
                     dropdownMenu.innerHTML = '';
 
-                    Object.keys(gpuDetails).forEach(index => {
-                        let gpu = gpuDetails[index];
+                    gpuDetails.forEach((gpu, index) => {
                         const newItem = document.createElement('a');
                         newItem.classList.add('dropdown-item');
                         newItem.href = '#';
-                        newItem.textContent = `GPU ${gpu.index}: ${gpu.model}`;
+                        newItem.textContent = `GPU ${index}: ${gpu.model}`;
                         newItem.setAttribute("data-index", index);
                         dropdownMenu.appendChild(newItem);
 
                         newItem.addEventListener('click', (event) => {
-                            const index = event.target.getAttribute('data-index');
-
-                            selectedGPUIndex = index;
-                            dropDownMenuButton.innerText = `GPU ${gpu.index}: ${gpu.model}`;
+                            selectedGPUIndex = parseInt(event.target.getAttribute('data-index'));
+                            dropDownMenuButton.innerText = `GPU ${index}: ${gpu.model}`;
                             diskUtilDatasets = Array(60).fill(0.00);
                             diskUtilLabels = Array(60).fill("");
                         });
                     });
 
-                    dropDownMenuButton.innerText = `GPU ${gpuDetails[selectedGPUIndex].index}: ${gpuDetails[selectedGPUIndex].model}`;
+                    dropDownMenuButton.innerText = `GPU ${selectedGPUIndex}: ${gpuDetails[selectedGPUIndex].model}`;
 
                     resolve();
                 } catch (error) {
@@ -10,11 +10,22 @@ Classes:
 import logging
 
 from sysmonify.core.tasks import Details
-from gpu.tasks.utils import NvidiaSMI, LSPCI
+from gpu.tasks.utils import NVIDIA_SMI_HEADERS, NvidiaSMI, LSPCI
 
 
 logger = logging.getLogger(__name__)
 
+# Maps 'nvidia-smi' output columns to GPU detail keys and their default values, used
+# when a value is missing or not supported by the GPU.
+_NVIDIA_DETAILS_COLUMNS = (
+    ("name", "model", "Unknown"),
+    ("uuid", "uuid", "Unknown"),
+    ("memory.total [MiB]", "total_vram", "Unknown"),
+    ("driver_version", "driver_version", "Unknown"),
+    ("power.min_limit [W]", "min_power", "Unknown"),
+    ("power.max_limit [W]", "max_power", "Unknown"),
+)
+
 
 class GPUDetails(Details):
     """A class for retrieving GPU details such as vendor, model, vram and more.
@@ -23,72 +34,57 @@ class GPUDetails(Details):
             gpu_details = GPUDetails()
             gpu_info = gpu_details.get_details()
             print(gpu_info[0]['vendor'])  # Output: 'NVIDIA'
-            print(gpu_info[0]['min_power'])   # Output: '5.00'
+            print(gpu_info[0]['min_power'])   # Output: 5.0
     """
 
-    def __init__(self) -> None:
-        """Default initializer."""
-        self._NVIDIA_SMI_HEADERS = [
-            "index",
-            "gpu_name",
-            "uuid",
-            "driver_version",
-            "memory.total",
-            "power.max_limit",
-            "power.min_limit",
-        ]
-
-    async def get_details(self) -> dict:
-        """Gather details about all GPUs on the system and return the details in a dictionary.
+    async def get_details(self) -> list:
+        """Gather details about all GPUs on the system and return the details in a list.
 
         Gathers a list of GPU details, for GPUs installed in the system, and then use
         vendor specific subprocesses to gather details for each GPU.
 
-        This method returns key details about the system's CPU, including:
-        - Index (e.g., 0)
+        This method returns key details about the system's GPUs, ordered by GPU index,
+        including:
         - Vendor (e.g., NVIDIA, AMD)
         - Model (e.g., NVIDIA GeForce RTX™ 4050 Laptop GPU)
         - UUID (e.g., GPU-c6fd5115-f7fc-73ba-4862-000000000)
-        - Total VRAM (e.g., 6141)
+        - Total VRAM in MiB (e.g., 6141)
         - Driver version (e.g., 550.107.02)
-        - Min Power (e.g., 5.00)
-        - Max Power (e.g., 50.00)
+        - Min Power in W (e.g., 5.0)
+        - Max Power in W (e.g., 50.0)
 
         Returns:
-            dict: A dictionary of dictionaries with the following format:
-            {
-                "0": {
+            list: A list of dictionaries, where the position of each dictionary is the
+            index of the GPU, with the following format:
+            [
+                {
                     "vendor": "NVIDIA",
                     "model": "NVIDIA GeForce RTX™ 4050 Laptop GPU",
                     ...
                 },
-                "1": {...},
+                {...},
                 ...
-            }
+            ]
 
         Note:
             Some details may not be available on all systems. The method will try to
             fetch as much information as possible, but results may vary depending on
             the platform and the GPU driver capabilities.
         """
-        details = {}
+        details = []
         vendors = await LSPCI.get_gpu_vendors()
 
         if "NVIDIA" in vendors:
-            nv_gpu_details = await NvidiaSMI.query_gpu(headers=self._NVIDIA_SMI_HEADERS)
+            nv_gpu_details = await NvidiaSMI.query_gpu_cached(
+                headers=NVIDIA_SMI_HEADERS
+            )
 
             for gpu in nv_gpu_details:
-                gpu_index = gpu.get("index")
-                gpu_details = {
-                    "vendor": "NVIDIA Corporation",
-                    "model": gpu.get("name", "Unknown"),
-                    "uuid": gpu.get("uuid", "Unknown"),
-                    "total_vram": gpu.get("memory.total [MiB]", "Unknown"),
-                    "driver_version": gpu.get("driver_version", "Unknown"),
-                    "min_power": gpu.get("power.min_limit [W]", "Unknown"),
-                    "max_power": gpu.get("power.max_limit [W]", "Unknown"),
-                }
-                details[gpu_index] = gpu_details
+                gpu_details = {"vendor": "NVIDIA Corporation"}
+                for column, key, default in _NVIDIA_DETAILS_COLUMNS:
+                    value = gpu.get(column)
+                    gpu_details[key] = default if value is None else value
+                details.append(gpu_details)
 
         if "AMD" in vendors:
             logger.warning("AMD GPUs are currently not supported.")
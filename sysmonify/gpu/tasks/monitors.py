@@ -6,6 +6,13 @@ Classes:
     - GPUMonitor:
         A class for retrieving real-time GPU stats for all GPUs installed on a system.
 
+Attributes:
+    - GPU_MONITOR:
+        A process-wide `GPUMonitor` shared by all consumers.
+    - GPU_SAMPLER:
+        A process-wide `Sampler` of `GPU_MONITOR`, sampling every
+        `GPU_POLL_INTERVAL_SECONDS` seconds and shared by all consumers.
+
 Examples:
     gpu_monitor = GPUMonitor()
     gpu_metrics = gpu_monitor.get_metrics()
@@ -14,12 +21,24 @@ Examples:
 
 import logging
 
-from sysmonify.core.tasks import Monitor
-from gpu.tasks.utils import LSPCI, NvidiaSMI
+from django.conf import settings
+
+from sysmonify.core.tasks import Monitor, Sampler
+from gpu.tasks.utils import NVIDIA_SMI_HEADERS, LSPCI, NvidiaSMI
 
 
 logger = logging.getLogger(__name__)
 
+# Maps 'nvidia-smi' output columns to GPU metric keys and their default values, used
+# when a value is missing or not supported by the GPU.
+_NVIDIA_METRICS_COLUMNS = (
+    ("utilization.gpu [%]", "gpu_utilization", 0),
+    ("utilization.memory [%]", "memory_utilization", 0),
+    ("temperature.gpu", "temperature", 0),
+    ("memory.used [MiB]", "memory_used", 0),
+    ("power.draw [W]", "power_draw", 0.0),
+)
+
 
 class GPUMonitor(Monitor):
     """Monitors real-time GPU stats for all GPUs installed on a system.
@@ -28,57 +47,46 @@ class GPUMonitor(Monitor):
     for all GPUs installed on a system.
 
     Methods:
-        get_metrics() -> dict:
-            Gathers current GPU stats and returns the data in a dictionary.
+        get_metrics() -> list:
+            Gathers current GPU stats and returns the data in a list.
     """
 
-    def __init__(self) -> None:
-        """Default initializer."""
-        self._NVIDIA_SMI_HEADERS = [
-            "index",
-            "utilization.gpu",
-            "utilization.memory",
-            "memory.used",
-            "power.draw",
-            "temperature.gpu",
-        ]
-
-    async def get_metrics(self) -> dict:
-        """Gathers real-time GPU metrics and returns the data in a dictionary.
+    async def get_metrics(self) -> list:
+        """Gathers real-time GPU metrics and returns the data in a list.
 
         Retrieves GPU related stats for all GPUs installed on a system. Stats such as
-        utilization, temperature, memory usage and power draw.
+        utilization (%), temperature (°C), memory usage (MiB) and power draw (W) are
+        returned as numbers, ordered by GPU index.
 
         Returns:
-            dict: A dictionary of dictionaries with the following format:
-            {
-                "0": {
-                    "gpu_utilization": "10",
-                    "memory_utilization": "10",
-                    "temperature": "43",
-                    "memory_used": "894",
-                    "power_draw": "5.91"
+            list: A list of dictionaries, where the position of each dictionary is the
+            index of the GPU, with the following format:
+            [
+                {
+                    "gpu_utilization": 10,
+                    "memory_utilization": 10,
+                    "temperature": 43,
+                    "memory_used": 894,
+                    "power_draw": 5.91
                 },
                 ...
-            }
+            ]
         """
-        metrics = {}
+        metrics = []
 
         vendors = await LSPCI.get_gpu_vendors()
 
         if "NVIDIA" in vendors:
-            nv_gpu_metrics = await NvidiaSMI.query_gpu(headers=self._NVIDIA_SMI_HEADERS)
+            nv_gpu_metrics = await NvidiaSMI.query_gpu_cached(
+                headers=NVIDIA_SMI_HEADERS
+            )
 
             for gpu in nv_gpu_metrics:
-                gpu_index = gpu.get("index")
-                gpu_metrics = {
-                    "gpu_utilization": gpu.get("utilization.gpu [%]", "0"),
-                    "memory_utilization": gpu.get("utilization.memory [%]", "0"),
-                    "temperature": gpu.get("temperature.gpu", "0"),
-                    "memory_used": gpu.get("memory.used [MiB]", "0"),
-                    "power_draw": gpu.get("power.draw [W]", "0"),
-                }
-                metrics[gpu_index] = gpu_metrics
+                gpu_metrics = {}
+                for column, key, default in _NVIDIA_METRICS_COLUMNS:
+                    value = gpu.get(column)
+                    gpu_metrics[key] = default if value is None else value
+                metrics.append(gpu_metrics)
 
         if "AMD" in vendors:
             logger.warning("AMD GPUs are currently not supported.")
@@ -87,3 +95,21 @@ class GPUMonitor(Monitor):
             logger.warning("Intel GPUs are currently not supported.")
 
         return metrics
+
+
+GPU_MONITOR = GPUMonitor()
+
+
+async def _sample_gpu_metrics() -> dict:
+    """Retrieve the current metrics of all GPUs.
+
+    Returns:
+        dict:
+            A dictionary with the GPU "metrics".
+    """
+    return {"metrics": await GPU_MONITOR.get_metrics()}
+
+
+GPU_SAMPLER = Sampler(
+    sample=_sample_gpu_metrics, interval_seconds=settings.GPU_POLL_INTERVAL_SECONDS
+)
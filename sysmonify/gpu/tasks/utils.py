@@ -3,34 +3,313 @@
 This module contains utility classes that are used by multiple GPU tasks.
 
 Classes:
+    NVML:
+        An interface for the NVIDIA Management Library (NVML).
+
     NvidiaSMI:
         An interface for the 'nvidia-smi' command-line utility.
 
     LSPCI:
-        An interface for 'lspci' command-line utility.
+        Finds GPU vendors through sysfs, or the 'lspci' command-line utility.
+
+Attributes:
+    NVIDIA_SMI_HEADERS:
+        The 'nvidia-smi' query headers for both GPU details and metrics.
+
+    NVIDIA_SMI_COLUMN_TYPES:
+        The types of the numeric 'nvidia-smi' output columns.
 """
 
-import csv
+import os
+import re
+import time
+import atexit
+import asyncio
 import logging
+import threading
+
+import pynvml
 
+from sysmonify.core.cache import async_ttl_cache
+from sysmonify.core.tasks import SAMPLING_EXECUTOR
 from sysmonify.core.utils import run_command_async
 
 
 logger = logging.getLogger(__name__)
 
+# GPU details and metrics are queried together, so a single query serves both the
+# details sent on connect and the metrics sent every tick.
+NVIDIA_SMI_HEADERS = (
+    "index",
+    "gpu_name",
+    "uuid",
+    "driver_version",
+    "memory.total",
+    "power.max_limit",
+    "power.min_limit",
+    "utilization.gpu",
+    "utilization.memory",
+    "memory.used",
+    "power.draw",
+    "temperature.gpu",
+)
+
+# Types of the numeric 'nvidia-smi' output columns, units are part of the column names
+# rather than of each value. Values of other columns are kept as strings.
+NVIDIA_SMI_COLUMN_TYPES = {
+    "memory.total [MiB]": int,
+    "memory.used [MiB]": int,
+    "power.min_limit [W]": float,
+    "power.max_limit [W]": float,
+    "power.draw [W]": float,
+    "utilization.gpu [%]": int,
+    "utilization.memory [%]": int,
+    "temperature.gpu": int,
+}
+
+
+class NVML:
+    """A static class for querying NVIDIA GPUs through the NVML library.
+
+    NVML is the library 'nvidia-smi' itself is built on. Calling it directly avoids
+    spawning an 'nvidia-smi' process, which initializes the driver, on every query.
+    Results use the same keys as the CSV output of 'nvidia-smi', so they can be used
+    interchangeably with those of `NvidiaSMI.query_gpu()`.
+
+    Methods:
+        query_gpu(headers: list) -> list | None:
+            Queries GPU information.
+    """
+
+    _lock = threading.Lock()
+    _available: bool | None = None
+    _handles: list = []
+
+    # Maps 'nvidia-smi --query-gpu' headers to the column name 'nvidia-smi' outputs
+    # for it, and a function reading its value for a device handle.
+    _QUERIES = {
+        "index": ("index", lambda handle: str(pynvml.nvmlDeviceGetIndex(handle))),
+        "gpu_name": ("name", lambda handle: pynvml.nvmlDeviceGetName(handle)),
+        "uuid": ("uuid", lambda handle: pynvml.nvmlDeviceGetUUID(handle)),
+        "driver_version": (
+            "driver_version",
+            lambda handle: pynvml.nvmlSystemGetDriverVersion(),
+        ),
+        "memory.total": (
+            "memory.total [MiB]",
+            lambda handle: pynvml.nvmlDeviceGetMemoryInfo(handle).total // 2**20,
+        ),
+        "memory.used": (
+            "memory.used [MiB]",
+            lambda handle: pynvml.nvmlDeviceGetMemoryInfo(handle).used // 2**20,
+        ),
+        "power.min_limit": (
+            "power.min_limit [W]",
+            lambda handle: NVML._to_watts(
+                pynvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[0]
+            ),
+        ),
+        "power.max_limit": (
+            "power.max_limit [W]",
+            lambda handle: NVML._to_watts(
+                pynvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[1]
+            ),
+        ),
+        "power.draw": (
+            "power.draw [W]",
+            lambda handle: NVML._to_watts(pynvml.nvmlDeviceGetPowerUsage(handle)),
+        ),
+        "utilization.gpu": (
+            "utilization.gpu [%]",
+            lambda handle: pynvml.nvmlDeviceGetUtilizationRates(handle).gpu,
+        ),
+        "utilization.memory": (
+            "utilization.memory [%]",
+            lambda handle: pynvml.nvmlDeviceGetUtilizationRates(handle).memory,
+        ),
+        "temperature.gpu": (
+            "temperature.gpu",
+            lambda handle: pynvml.nvmlDeviceGetTemperature(
+                handle, pynvml.NVML_TEMPERATURE_GPU
+            ),
+        ),
+    }
+
+    @staticmethod
+    def _to_watts(milliwatts: int) -> float:
+        """Converts a power value reported by NVML in milliwatts to watts.
+
+        Args:
+            milliwatts (int):
+                A power value in milliwatts.
+
+        Returns:
+            float:
+                The power in watts rounded to two decimals like 'nvidia-smi' does,
+                e.g. `5.91`.
+        """
+        return round(milliwatts / 1000, 2)
+
+    @classmethod
+    def _initialize(cls) -> bool:
+        """Initializes NVML and caches a handle for each GPU, once per process.
+
+        Returns:
+            bool:
+                True if NVML was initialized, False if it is not available, e.g. when
+                no NVIDIA driver is loaded.
+        """
+        with cls._lock:
+            if cls._available is None:
+                try:
+                    pynvml.nvmlInit()
+                    atexit.register(pynvml.nvmlShutdown)
+
+                    cls._handles = [
+                        pynvml.nvmlDeviceGetHandleByIndex(index)
+                        for index in range(pynvml.nvmlDeviceGetCount())
+                    ]
+                    cls._available = True
+
+                except pynvml.NVMLError as e:
+                    logger.warning(f"NVML is not available, using 'nvidia-smi': {e}")
+                    cls._available = False
+
+        return cls._available
+
+    @classmethod
+    def _query_gpu(cls, headers: list) -> list | None:
+        """Queries GPU information from NVML, blocking until all values are read.
+
+        Args:
+            headers (list[str]):
+                A list of 'nvidia-smi' query headers, see `query_gpu()`.
+
+        Returns:
+            list[dict] | None:
+                A list of dictionaries with the values of each GPU, or None if NVML is
+                not available. Values the GPU does not support are None.
+        """
+        if not cls._initialize():
+            return None
+
+        gpu_info = []
+
+        for handle in cls._handles:
+            gpu = {}
+
+            for header in headers:
+                column, query = cls._QUERIES[header]
+
+                try:
+                    gpu[column] = query(handle)
+
+                except pynvml.NVMLError:
+                    # Values the GPU does not support, reported as `[N/A]` by
+                    # 'nvidia-smi'.
+                    gpu[column] = None
+
+            gpu_info.append(gpu)
+
+        return gpu_info
+
+    @classmethod
+    async def query_gpu(cls, headers: list) -> list | None:
+        """Asynchronously queries GPU information from NVML.
+
+        Args:
+            headers (list[str]):
+                A list of 'nvidia-smi' query headers, e.g. `memory.used`.
+
+        Returns:
+            list[dict] | None:
+                A list of dictionaries where the keys are the column names 'nvidia-smi'
+                outputs for the given headers. None if NVML is not available or does
+                not support one of the headers.
+        """
+        if cls._available is False or not all(
+            header in cls._QUERIES for header in headers
+        ):
+            return None
+
+        return await asyncio.get_running_loop().run_in_executor(
+            SAMPLING_EXECUTOR, cls._query_gpu, headers
+        )
+
 
 class NvidiaSMI:
     """A static class for asynchronously interfacing with the 'nvidia-smi' command-line utility.
 
+    When 'nvidia-smi' fails, e.g. because the GPU of a dual GPU laptop is powered
+    down, it is not run again for an exponentially growing period of time, as each
+    failing run can block for around a second and wakes up the GPU.
+
+    Attributes:
+        _MAX_BACKOFF_SECONDS (int):
+            The longest time 'nvidia-smi' is not run for after consecutive failures.
+
+        _failure_count (int):
+            The number of consecutive failed runs of 'nvidia-smi'.
+
+        _retry_at (float):
+            The `time.monotonic()` time before which 'nvidia-smi' is not run again.
+
     Methods:
         query_gpu(headers: list) -> list:
             Queries GPU information.
+
+        parse_value(column: str, value: str) -> int | float | str | None:
+            Converts a value output by 'nvidia-smi' to the type of its column.
+
+        query_gpu_cached(headers: list) -> list:
+            Queries GPU information, reusing results for half a second.
     """
 
+    _MAX_BACKOFF_SECONDS = 600
+
+    _failure_count = 0
+    _retry_at = 0.0
+
     @staticmethod
-    async def query_gpu(headers: list) -> list:
+    def parse_value(column: str, value: str) -> int | float | str | None:
+        """Converts a value output by 'nvidia-smi' to the type of its column.
+
+        Args:
+            column (str):
+                The 'nvidia-smi' output column the value is from, e.g.
+                `memory.used [MiB]`.
+
+            value (str):
+                The value output by 'nvidia-smi' with `--format=csv,nounits`.
+
+        Returns:
+            int | float | str | None:
+                The value as the type in `NVIDIA_SMI_COLUMN_TYPES`, or as a string for
+                other columns. None for placeholders such as `[N/A]` or
+                `[Not Supported]`.
+        """
+        if value.startswith("[") and value.endswith("]"):
+            return None
+
+        column_type = NVIDIA_SMI_COLUMN_TYPES.get(column)
+        if column_type is None:
+            return value
+
+        try:
+            return column_type(value)
+
+        except ValueError:
+            logger.warning(f"Unexpected '{column}' value from 'nvidia-smi': {value}")
+            return None
+
+    @classmethod
+    async def query_gpu(cls, headers: list) -> list:
         """Asynchronously queries GPU information via 'nvidia-smi' command.
 
+        The NVML library is queried directly when it is available, 'nvidia-smi' is
+        only executed otherwise. An empty list is returned without running
+        'nvidia-smi' while backing off after failed runs.
+
         Args:
             headers (list[str]):
                 A list of column headers to query 'nvidia-smi' with. For a full list of
@@ -38,10 +317,19 @@ class NvidiaSMI:
 
         Returns:
             list[dict]:
-                A list of dictionaries where the keys are the given headers.
+                A list of dictionaries where the keys are the output column names of
+                the given headers, and numeric values are converted to numbers, see
+                `parse_value()`.
         """
+        gpu_info = await NVML.query_gpu(headers=headers)
+        if gpu_info is not None:
+            return gpu_info
+
         gpu_info = []
 
+        if time.monotonic() < cls._retry_at:
+            return gpu_info
+
         command = [
             "nvidia-smi",
             f"--query-gpu={','.join(headers)}",
@@ -54,16 +342,22 @@ class NvidiaSMI:
             if output["exit_code"] != 0:
                 raise Exception(output["stderr"])
 
-            output_lines = output["stdout"].split("\n")
-            output_lines = [line.strip("\n") for line in output_lines]
-
-            reader = csv.DictReader(output_lines)
-            gpu_info = [
-                {key.strip(): value.strip() for key, value in row.items()}
-                for row in reader
-            ]
-
-        except csv.Error as e:
+            # `--format=csv` output is a header line and a line per GPU, values are
+            # never quoted, so splitting on commas is enough.
+            output_lines = output["stdout"].splitlines()
+            if output_lines:
+                keys = [key.strip() for key in output_lines[0].split(",")]
+                gpu_info = [
+                    {
+                        key: cls.parse_value(key, value.strip())
+                        for key, value in zip(keys, line.split(","), strict=True)
+                    }
+                    for line in output_lines[1:]
+                    if line
+                ]
+            cls._failure_count = 0
+
+        except ValueError as e:
             logger.exception(
                 f"Error: Issue while parsing CSV output of nvidia-smi - {e}"
             )
@@ -71,48 +365,168 @@ class NvidiaSMI:
         except Exception as e:
             logger.exception(f"Error occurred when running 'nvidia-smi': Error: {e}")
 
+            cls._failure_count += 1
+            backoff_seconds = min(cls._MAX_BACKOFF_SECONDS, 2**cls._failure_count)
+            cls._retry_at = time.monotonic() + backoff_seconds
+            logger.warning(f"Not running 'nvidia-smi' for {backoff_seconds} seconds.")
+
         return gpu_info
 
+    @staticmethod
+    @async_ttl_cache(ttl_seconds=0.5)
+    async def _query_gpu_cached(headers: tuple) -> list:
+        """Queries GPU information, see `query_gpu_cached()`."""
+        return await NvidiaSMI.query_gpu(headers=list(headers))
+
+    @staticmethod
+    async def query_gpu_cached(headers: list) -> list:
+        """Asynchronously queries GPU information, reusing results for half a second.
+
+        GPU counters are averaged by the driver over their own sampling period, so
+        results up to half a second old are served to all callers querying the same
+        headers, e.g. several connected clients or GPU details and metrics requested
+        together.
+
+        Args:
+            headers (list[str]):
+                A list of column headers to query 'nvidia-smi' with, see `query_gpu()`.
+
+        Returns:
+            list[dict]:
+                A list of dictionaries shared between callers, which must not be
+                modified.
+        """
+        return await NvidiaSMI._query_gpu_cached(tuple(headers))
+
 
 class LSPCI:
-    """A static class for asynchronously interfacing with the 'lspci' command-line utility.
+    """A static class for asynchronously finding the vendors of all GPUs on a system.
+
+    PCI devices are read directly from sysfs, the 'lspci' command-line utility is only
+    run if sysfs cannot be read.
+
+    Attributes:
+        _SYSFS_PCI_DEVICES_PATH (str):
+            The sysfs directory containing an entry for each PCI device.
+
+        _PCI_DISPLAY_CLASS_PREFIXES (tuple):
+            The PCI class codes of VGA, 3D and other display controllers.
+
+        _PCI_VENDOR_IDS (dict):
+            The names of GPU vendors by their PCI vendor ID.
+
+        _gpu_vendors (frozenset | None):
+            The GPU vendors found by the first successful scan, GPUs are not added or
+            removed while the system is running.
 
     Methods:
-        get_gpu_vendors() -> set:
+        get_gpu_vendors() -> frozenset:
             Asynchronously retrieves a set of vendor names of all GPUs installed on a
             system.
+
+        invalidate_vendor_cache() -> None:
+            Drops the cached GPU vendors so PCI devices are scanned again.
     """
 
-    @staticmethod
-    async def get_gpu_vendors() -> set:
-        """Asynchronously runs the 'lspci' command and filters output for GPU vendors.
+    _SYSFS_PCI_DEVICES_PATH = "/sys/bus/pci/devices"
+    _PCI_DISPLAY_CLASS_PREFIXES = ("0x0300", "0x0302", "0x0380")
+    _PCI_VENDOR_IDS = {"0x10de": "NVIDIA", "0x1002": "AMD", "0x8086": "Intel"}
+
+    # Matches the first GPU vendor named on a VGA or 3D controller line.
+    _GPU_VENDOR_PATTERN = re.compile(r"(?:VGA|3D)[^\n]*?(NVIDIA|AMD|Intel)")
+
+    _gpu_vendors: frozenset | None = None
+
+    @classmethod
+    def _get_sysfs_gpu_vendors(cls) -> set:
+        """Finds the vendors of all display controllers in `/sys/bus/pci/devices`.
 
         Returns:
             set[str]:
                 A set containing all GPU vendor names of GPUs installed on the system.
+
+        Raises:
+            OSError:
+                If `/sys/bus/pci/devices` cannot be read.
         """
         gpu_vendors = set()
 
+        with os.scandir(cls._SYSFS_PCI_DEVICES_PATH) as devices:
+            for device in devices:
+                try:
+                    with open(os.path.join(device.path, "class"), "r") as f:
+                        if not f.read().startswith(cls._PCI_DISPLAY_CLASS_PREFIXES):
+                            continue
+
+                    with open(os.path.join(device.path, "vendor"), "r") as f:
+                        vendor = cls._PCI_VENDOR_IDS.get(f.read().strip())
+
+                except OSError as e:
+                    logger.warning(f"Failed to read PCI device {device.name}: {e}")
+                    continue
+
+                if vendor is not None:
+                    gpu_vendors.add(vendor)
+
+        return gpu_vendors
+
+    @classmethod
+    async def _get_lspci_gpu_vendors(cls) -> set | None:
+        """Asynchronously runs the 'lspci' command and filters output for GPU vendors.
+
+        Returns:
+            set[str] | None:
+                A set containing all GPU vendor names of GPUs installed on the system,
+                or None if 'lspci' failed.
+        """
         try:
             result = await run_command_async(["lspci", "-nn"])
 
             if result["exit_code"] != 0:
                 raise Exception(result["stderr"])
 
-            lines = result["stdout"].splitlines()
-
-            for line in lines:
-                if "VGA" in line or "3D" in line:
-                    if "NVIDIA" in line:
-                        gpu_vendors.add("NVIDIA")
-                    elif "AMD" in line:
-                        gpu_vendors.add("AMD")
-                    elif "Intel" in line:
-                        gpu_vendors.add("Intel")
+            return {
+                match.group(1)
+                for match in cls._GPU_VENDOR_PATTERN.finditer(result["stdout"])
+            }
 
         except Exception as e:
             logger.exception(
                 f"Unexpected error occurred when querying lspci for available GPUs: {e}"
             )
 
-        return gpu_vendors
+        return None
+
+    @classmethod
+    async def get_gpu_vendors(cls) -> frozenset:
+        """Asynchronously retrieves the vendors of all GPUs installed on the system.
+
+        PCI devices are only scanned until a scan succeeds once, later calls return the
+        cached vendors.
+
+        Returns:
+            frozenset[str]:
+                A set containing all GPU vendor names of GPUs installed on the system.
+        """
+        if cls._gpu_vendors is not None:
+            return cls._gpu_vendors
+
+        try:
+            gpu_vendors = await asyncio.get_running_loop().run_in_executor(
+                SAMPLING_EXECUTOR, cls._get_sysfs_gpu_vendors
+            )
+
+        except OSError as e:
+            logger.warning(f"Failed to read PCI devices from sysfs, using lspci: {e}")
+            gpu_vendors = await cls._get_lspci_gpu_vendors()
+
+        if gpu_vendors is None:
+            return frozenset()
+
+        cls._gpu_vendors = frozenset(gpu_vendors)
+        return cls._gpu_vendors
+
+    @classmethod
+    def invalidate_vendor_cache(cls) -> None:
+        """Drops the cached GPU vendors so `get_gpu_vendors()` scans PCI devices again."""
+        cls._gpu_vendors = None
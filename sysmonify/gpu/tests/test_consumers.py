@@ -3,20 +3,24 @@
 This module contains unit tests for gpu.consumers
 """
 
+import unittest
+
+from django.conf import settings
 from django.test import TestCase
 from channels.testing import WebsocketCommunicator
 
 from gpu.consumers import GPUConsumer
+from gpu.tasks.monitors import GPU_MONITOR, GPU_SAMPLER
 
 
 class TestGPUConsumer(TestCase):
     """Tests for GPUConsumer."""
 
     async def test_websocket_connect_and_receive_initial_details(self):
-        """Test that on connection, the consumer sends a message containing GPU details.
+        """Test that on connection, the consumer sends GPU details and metrics at once.
 
         Asserts:
-            'details' key is present in initial message sent.
+            'details' and 'metrics' keys are present in the initial message sent.
         """
         communicator = WebsocketCommunicator(GPUConsumer.as_asgi(), "ws/gpu/")
         connected, subprotocol = await communicator.connect()
@@ -24,9 +28,11 @@ class TestGPUConsumer(TestCase):
 
         response = await communicator.receive_json_from()
         self.assertIn("details", response)
+        self.assertIn("metrics", response)
 
         await communicator.disconnect()
 
+    @unittest.mock.patch.object(GPU_SAMPLER, "_interval_seconds", 0.5)
     async def test_periodic_cpu_metrics_message(self):
         """Test that the consumer sends periodic messages containing GPU metrics.
 
@@ -40,8 +46,9 @@ class TestGPUConsumer(TestCase):
         initial_response = await communicator.receive_json_from()
         self.assertIn("details", initial_response)
 
-        periodic_response = await communicator.receive_json_from()
+        periodic_response = await communicator.receive_json_from(timeout=3)
         self.assertIn("metrics", periodic_response)
+        self.assertNotIn("details", periodic_response)
 
         await communicator.disconnect()
 
@@ -51,3 +58,53 @@ class TestGPUConsumer(TestCase):
         connected, subprotocol = await communicator.connect()
         self.assertTrue(connected)
         await communicator.disconnect()
+
+    def test_poll_interval_setting(self):
+        """Test that GPUs are sampled at the configured interval.
+
+        Asserts:
+            The GPU sampler samples every `GPU_POLL_INTERVAL_SECONDS` seconds.
+        """
+        self.assertEqual(
+            GPU_SAMPLER._interval_seconds, settings.GPU_POLL_INTERVAL_SECONDS
+        )
+
+    async def test_connections_share_gpu_sampler(self):
+        """Test that concurrent connections share a single GPU sample.
+
+        Asserts:
+            - Both clients receive the same GPU metrics.
+            - GPU metrics are only retrieved once for both connections.
+            - The GPU sampler stops once both clients have disconnected.
+        """
+        metrics = [{"gpu_utilization": 10}]
+
+        with (
+            unittest.mock.patch(
+                "gpu.consumers.GPUDetails.get_details", return_value=[]
+            ),
+            unittest.mock.patch.object(
+                GPU_MONITOR,
+                "get_metrics",
+                new_callable=unittest.mock.AsyncMock,
+                return_value=metrics,
+            ) as mock_get_metrics,
+        ):
+            first = WebsocketCommunicator(GPUConsumer.as_asgi(), "ws/gpu/")
+            second = WebsocketCommunicator(GPUConsumer.as_asgi(), "ws/gpu/")
+
+            self.assertTrue((await first.connect())[0])
+            self.assertTrue((await second.connect())[0])
+
+            first_response = await first.receive_json_from()
+            second_response = await second.receive_json_from()
+
+            self.assertEqual(first_response["metrics"], metrics)
+            self.assertEqual(second_response["metrics"], metrics)
+            mock_get_metrics.assert_awaited_once()
+
+            await first.disconnect()
+            await second.disconnect()
+
+        self.assertEqual(GPU_SAMPLER._subscribers, 0)
+        self.assertIsNone(GPU_SAMPLER._task)
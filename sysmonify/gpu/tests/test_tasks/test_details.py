@@ -17,13 +17,14 @@ class TestGPUDetails(TestCase):
     @unittest.mock.patch(
         "gpu.tasks.details.LSPCI.get_gpu_vendors", return_value={"NVIDIA"}
     )
-    @unittest.mock.patch("gpu.tasks.details.NvidiaSMI.query_gpu")
+    @unittest.mock.patch("gpu.tasks.details.NvidiaSMI.query_gpu_cached")
     async def test_get_details_nvidia(self, mock_nvidia_smi, mock_lspci):
         """Test get_details returns expected NVIDIA GPU details.
 
         Asserts:
-            - The details are returned in a dictionary with GPU index keys.
+            - The details are returned in a list ordered by GPU index.
             - The values for vendor, model, and total_vram match expected values.
+            - Details the GPU does not support are "Unknown".
         """
         mock_nvidia_smi.return_value = [
             {
@@ -31,27 +32,29 @@ class TestGPUDetails(TestCase):
                 "name": "NVIDIA GeForce RTX 4050",
                 "uuid": "GPU-123456",
                 "driver_version": "550.107.02",
-                "memory.total [MiB]": "6144 MiB",
-                "power.max_limit [W]": "50.00 W",
-                "power.min_limit [W]": "5.00 W",
+                "memory.total [MiB]": 6144,
+                "power.max_limit [W]": 50.0,
+                "power.min_limit [W]": None,
             }
         ]
 
         details = await self.gpu_details.get_details()
 
-        self.assertIsInstance(details, dict)
-        self.assertIn("0", details)
-        gpu_detail = details["0"]
+        self.assertIsInstance(details, list)
+        self.assertEqual(len(details), 1)
+        gpu_detail = details[0]
         self.assertEqual(gpu_detail["vendor"], "NVIDIA Corporation")
         self.assertEqual(gpu_detail["model"], "NVIDIA GeForce RTX 4050")
-        self.assertEqual(gpu_detail["total_vram"], "6144 MiB")
+        self.assertEqual(gpu_detail["total_vram"], 6144)
+        self.assertEqual(gpu_detail["max_power"], 50.0)
+        self.assertEqual(gpu_detail["min_power"], "Unknown")
 
     @unittest.mock.patch("gpu.tasks.details.LSPCI.get_gpu_vendors", return_value=set())
     async def test_get_details_no_gpu(self, mock_lspci):
         """Test get_details when no GPU is detected.
 
         Asserts:
-            LSPCI returns an empty set if no GPUs are installed on the system.
+            An empty list is returned if no GPUs are installed on the system.
         """
         details = await self.gpu_details.get_details()
-        self.assertEqual(details, {})
+        self.assertEqual(details, [])
@@ -15,7 +15,7 @@ class TestGPUMonitor(TestCase):
         self.gpu_monitor = GPUMonitor()
 
     @patch("gpu.tasks.monitors.LSPCI.get_gpu_vendors", return_value={"NVIDIA"})
-    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu")
+    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu_cached")
     async def test_get_metrics_success(self, mock_query_gpu, mock_get_gpu_vendors):
         """Test get_metrics returns expected NVIDIA GPU metrics.
 
@@ -26,39 +26,64 @@ class TestGPUMonitor(TestCase):
         mock_query_gpu.return_value = [
             {
                 "index": "0",
-                "utilization.gpu [%]": "15",
-                "utilization.memory [%]": "20",
-                "temperature.gpu": "55",
-                "memory.used [MiB]": "1024",
-                "power.draw [W]": "35",
+                "utilization.gpu [%]": 15,
+                "utilization.memory [%]": 20,
+                "temperature.gpu": 55,
+                "memory.used [MiB]": 1024,
+                "power.draw [W]": 35.0,
             }
         ]
 
         metrics = await self.gpu_monitor.get_metrics()
 
-        expected = {
-            "0": {
-                "gpu_utilization": "15",
-                "memory_utilization": "20",
-                "temperature": "55",
-                "memory_used": "1024",
-                "power_draw": "35",
+        expected = [
+            {
+                "gpu_utilization": 15,
+                "memory_utilization": 20,
+                "temperature": 55,
+                "memory_used": 1024,
+                "power_draw": 35.0,
             }
-        }
+        ]
         self.assertEqual(metrics, expected)
 
+    @patch("gpu.tasks.monitors.LSPCI.get_gpu_vendors", return_value={"NVIDIA"})
+    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu_cached")
+    async def test_get_metrics_not_supported(
+        self, mock_query_gpu, mock_get_gpu_vendors
+    ):
+        """Test get_metrics uses default values for metrics the GPU does not support.
+
+        Asserts:
+            Unsupported and missing metrics are returned as zero.
+        """
+        mock_query_gpu.return_value = [
+            {
+                "index": "0",
+                "utilization.gpu [%]": 15,
+                "utilization.memory [%]": 20,
+                "temperature.gpu": 55,
+                "power.draw [W]": None,
+            }
+        ]
+
+        metrics = await self.gpu_monitor.get_metrics()
+
+        self.assertEqual(metrics[0]["power_draw"], 0.0)
+        self.assertEqual(metrics[0]["memory_used"], 0)
+
     @patch("gpu.tasks.monitors.LSPCI.get_gpu_vendors", return_value=set())
     async def test_get_metrics_no_gpu(self, mock_get_gpu_vendors):
         """Test get_metrics returns an empty dictionary when no GPU is detected.
 
         Asserts:
-            Empty dictionary is returned when no GPUs are installed on the system.
+            An empty list is returned when no GPUs are installed on the system.
         """
         metrics = await self.gpu_monitor.get_metrics()
-        self.assertEqual(metrics, {})
+        self.assertEqual(metrics, [])
 
     @patch("gpu.tasks.monitors.LSPCI.get_gpu_vendors", return_value={"AMD", "NVIDIA"})
-    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu")
+    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu_cached")
     async def test_get_metrics_amd_warning(self, mock_query_gpu, mock_get_gpu_vendors):
         """Test get_metrics logs a warning when AMD GPUs are present.
 
@@ -68,11 +93,11 @@ class TestGPUMonitor(TestCase):
         mock_query_gpu.return_value = [
             {
                 "index": "0",
-                "utilization.gpu [%]": "10",
-                "utilization.memory [%]": "15",
-                "temperature.gpu": "50",
-                "memory.used [MiB]": "512",
-                "power.draw [W]": "30",
+                "utilization.gpu [%]": 10,
+                "utilization.memory [%]": 15,
+                "temperature.gpu": 50,
+                "memory.used [MiB]": 512,
+                "power.draw [W]": 30.0,
             }
         ]
 
@@ -85,19 +110,19 @@ class TestGPUMonitor(TestCase):
                 for message in log_capture.output
             )
         )
-        expected = {
-            "0": {
-                "gpu_utilization": "10",
-                "memory_utilization": "15",
-                "temperature": "50",
-                "memory_used": "512",
-                "power_draw": "30",
+        expected = [
+            {
+                "gpu_utilization": 10,
+                "memory_utilization": 15,
+                "temperature": 50,
+                "memory_used": 512,
+                "power_draw": 30.0,
             }
-        }
+        ]
         self.assertEqual(metrics, expected)
 
     @patch("gpu.tasks.monitors.LSPCI.get_gpu_vendors", return_value={"Intel", "NVIDIA"})
-    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu")
+    @patch("gpu.tasks.monitors.NvidiaSMI.query_gpu_cached")
     async def test_get_metrics_intel_warning(
         self, mock_query_gpu, mock_get_gpu_vendors
     ):
@@ -109,11 +134,11 @@ class TestGPUMonitor(TestCase):
         mock_query_gpu.return_value = [
             {
                 "index": "0",
-                "utilization.gpu [%]": "20",
-                "utilization.memory [%]": "25",
-                "temperature.gpu": "60",
-                "memory.used [MiB]": "2048",
-                "power.draw [W]": "40",
+                "utilization.gpu [%]": 20,
+                "utilization.memory [%]": 25,
+                "temperature.gpu": 60,
+                "memory.used [MiB]": 2048,
+                "power.draw [W]": 40.0,
             }
         ]
 
@@ -126,13 +151,13 @@ class TestGPUMonitor(TestCase):
                 for message in log_capture.output
             )
         )
-        expected = {
-            "0": {
-                "gpu_utilization": "20",
-                "memory_utilization": "25",
-                "temperature": "60",
-                "memory_used": "2048",
-                "power_draw": "40",
+        expected = [
+            {
+                "gpu_utilization": 20,
+                "memory_utilization": 25,
+                "temperature": 60,
+                "memory_used": 2048,
+                "power_draw": 40.0,
             }
-        }
+        ]
         self.assertEqual(metrics, expected)
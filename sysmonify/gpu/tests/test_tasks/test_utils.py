@@ -1,15 +1,204 @@
 """Tests for gpu.tasks.utils module."""
 
+import os
+import asyncio
+import tempfile
 import unittest
 
+import pynvml
+
 from django.test import TestCase
 
-from gpu.tasks.utils import NvidiaSMI, LSPCI
+from gpu.tasks.utils import NVML, NvidiaSMI, LSPCI
+
+
+class TestNVML(TestCase):
+    """Unit tests for NVML utility class."""
+
+    def setUp(self):
+        """Mock the NVML library with a single GPU.
+
+        NVML is initialized once per process, so its cached state is reset for every
+        test.
+        """
+        for attribute in ("_available", "_handles"):
+            patcher = unittest.mock.patch.object(
+                NVML, attribute, getattr(NVML, attribute)
+            )
+            self.addCleanup(patcher.stop)
+            patcher.start()
+        NVML._available = None
+
+        patcher = unittest.mock.patch("gpu.tasks.utils.pynvml")
+        self.addCleanup(patcher.stop)
+        self.mock_pynvml = patcher.start()
+        self.mock_pynvml.NVMLError = pynvml.NVMLError
+        self.mock_pynvml.nvmlDeviceGetCount.return_value = 1
+        self.mock_pynvml.nvmlDeviceGetIndex.return_value = 0
+        self.mock_pynvml.nvmlDeviceGetName.return_value = "NVIDIA GeForce RTX 4050"
+        self.mock_pynvml.nvmlDeviceGetMemoryInfo.return_value = unittest.mock.Mock(
+            total=6144 * 2**20, used=894 * 2**20
+        )
+        self.mock_pynvml.nvmlDeviceGetPowerUsage.return_value = 5910
+        self.mock_pynvml.nvmlDeviceGetUtilizationRates.return_value = (
+            unittest.mock.Mock(gpu=10, memory=20)
+        )
+
+    async def test_query_gpu_success(self):
+        """Test query_gpu returns GPU info in the format of 'nvidia-smi'.
+
+        Asserts:
+            - NVML is only initialized once.
+            - Values are keyed by the column names output by 'nvidia-smi'.
+            - Numeric values are returned as numbers.
+        """
+        headers = ["index", "gpu_name", "memory.total", "memory.used", "power.draw"]
+
+        await NVML.query_gpu(headers)
+        gpu_info = await NVML.query_gpu(headers)
+
+        self.mock_pynvml.nvmlInit.assert_called_once()
+        self.assertEqual(
+            gpu_info,
+            [
+                {
+                    "index": "0",
+                    "name": "NVIDIA GeForce RTX 4050",
+                    "memory.total [MiB]": 6144,
+                    "memory.used [MiB]": 894,
+                    "power.draw [W]": 5.91,
+                }
+            ],
+        )
+
+    async def test_query_gpu_not_supported(self):
+        """Test query_gpu reports values the GPU does not support like 'nvidia-smi'.
+
+        Asserts:
+            Unsupported values are returned as None.
+        """
+        self.mock_pynvml.nvmlDeviceGetPowerUsage.side_effect = pynvml.NVMLError(
+            pynvml.NVML_ERROR_NOT_SUPPORTED
+        )
+
+        gpu_info = await NVML.query_gpu(["utilization.gpu", "power.draw"])
+
+        self.assertEqual(
+            gpu_info, [{"utilization.gpu [%]": 10, "power.draw [W]": None}]
+        )
+
+    async def test_query_gpu_unavailable(self):
+        """Test query_gpu when NVML cannot be initialized.
+
+        Asserts:
+            - None is returned.
+            - NVML initialization is not retried.
+        """
+        self.mock_pynvml.nvmlInit.side_effect = pynvml.NVMLError(
+            pynvml.NVML_ERROR_LIBRARY_NOT_FOUND
+        )
+
+        with self.assertLogs("gpu.tasks.utils", level="WARNING"):
+            self.assertIsNone(await NVML.query_gpu(["index"]))
+        self.assertIsNone(await NVML.query_gpu(["index"]))
+
+        self.mock_pynvml.nvmlInit.assert_called_once()
+
+    async def test_query_gpu_unsupported_header(self):
+        """Test query_gpu with a header NVML queries are not defined for.
+
+        Asserts:
+            None is returned without initializing NVML.
+        """
+        self.assertIsNone(await NVML.query_gpu(["index", "clocks.sm"]))
+        self.mock_pynvml.nvmlInit.assert_not_called()
 
 
 class TestNvidiaSMI(TestCase):
     """Unit tests for NvidiaSMI utility class."""
 
+    def setUp(self):
+        """Use the 'nvidia-smi' command unless a test mocks NVML itself.
+
+        The backoff after failed runs of 'nvidia-smi' is reset for every test.
+        """
+        patcher = unittest.mock.patch.object(NVML, "query_gpu", return_value=None)
+        self.addCleanup(patcher.stop)
+        self.mock_nvml_query_gpu = patcher.start()
+
+        for attribute, value in (("_failure_count", 0), ("_retry_at", 0.0)):
+            patcher = unittest.mock.patch.object(NvidiaSMI, attribute, value)
+            self.addCleanup(patcher.stop)
+            patcher.start()
+
+    @unittest.mock.patch("gpu.tasks.utils.time.monotonic")
+    @unittest.mock.patch("gpu.tasks.utils.run_command_async")
+    async def test_query_gpu_backs_off_after_failures(
+        self, mock_run_command_async, mock_monotonic
+    ):
+        """Test query_gpu stops running 'nvidia-smi' for longer after each failure.
+
+        Asserts:
+            - 'nvidia-smi' is not run during the backoff.
+            - The backoff doubles after consecutive failures.
+            - 'nvidia-smi' is run again once the backoff has passed.
+        """
+        mock_run_command_async.return_value = {
+            "exit_code": 1,
+            "stdout": "",
+            "stderr": "Error: nvidia-smi command failed",
+        }
+
+        with self.assertLogs("gpu.tasks.utils", level="ERROR"):
+            mock_monotonic.return_value = 100.0
+            await NvidiaSMI.query_gpu(["index"])
+            self.assertEqual(NvidiaSMI._retry_at, 102.0)
+
+            mock_monotonic.return_value = 101.0
+            self.assertEqual(await NvidiaSMI.query_gpu(["index"]), [])
+            self.assertEqual(mock_run_command_async.await_count, 1)
+
+            mock_monotonic.return_value = 102.0
+            await NvidiaSMI.query_gpu(["index"])
+            self.assertEqual(mock_run_command_async.await_count, 2)
+            self.assertEqual(NvidiaSMI._retry_at, 106.0)
+
+    async def test_query_gpu_cached(self):
+        """Test query_gpu_cached shares results of the same headers between callers.
+
+        Asserts:
+            - Concurrent and repeated queries of the same headers query the GPU once.
+            - Queries of other headers are not served from the cache.
+        """
+        NvidiaSMI._query_gpu_cached.cache_clear()
+        self.addCleanup(NvidiaSMI._query_gpu_cached.cache_clear)
+        self.mock_nvml_query_gpu.return_value = [{"index": "0"}]
+
+        await asyncio.gather(
+            NvidiaSMI.query_gpu_cached(["index"]),
+            NvidiaSMI.query_gpu_cached(["index"]),
+        )
+        gpu_info = await NvidiaSMI.query_gpu_cached(["index"])
+        await NvidiaSMI.query_gpu_cached(["index", "uuid"])
+
+        self.assertEqual(gpu_info, [{"index": "0"}])
+        self.assertEqual(self.mock_nvml_query_gpu.await_count, 2)
+
+    @unittest.mock.patch("gpu.tasks.utils.run_command_async")
+    async def test_query_gpu_uses_nvml(self, mock_run_command_async):
+        """Test query_gpu returns GPU info from NVML when it is available.
+
+        Asserts:
+            - The NVML result is returned.
+            - 'nvidia-smi' is not executed.
+        """
+        self.mock_nvml_query_gpu.return_value = [{"index": "0"}]
+
+        gpu_info = await NvidiaSMI.query_gpu(["index"])
+
+        self.assertEqual(gpu_info, [{"index": "0"}])
+        mock_run_command_async.assert_not_called()
+
     @unittest.mock.patch("gpu.tasks.utils.run_command_async")
     async def test_query_gpu_success(self, mock_run_command_async):
         """Test query_gpu returns expected GPU info.
@@ -17,11 +206,12 @@ class TestNvidiaSMI(TestCase):
         Asserts:
             - Expected number of GPU detail dictionaries is present in the list
             - GPU detail values are as expected.
+            - Numeric values are converted to numbers, `[N/A]` to None.
         """
         mock_run_command_async.return_value = {
             "exit_code": 0,
-            "stdout": "index, gpu_name, uuid, driver_version, memory.total, power.max_limit, power.min_limit\n"
-            "0, NVIDIA GeForce RTX 4050, GPU-123456, 550.107.02, 6144, 50.00, 5.00\n",
+            "stdout": "index, name, uuid, driver_version, memory.total [MiB], power.max_limit [W], power.min_limit [W]\n"
+            "0, NVIDIA GeForce RTX 4050, GPU-123456, 550.107.02, 6144, 50.00, [N/A]\n",
             "stderr": "",
         }
 
@@ -38,10 +228,32 @@ class TestNvidiaSMI(TestCase):
 
         self.assertEqual(len(gpu_info), 1)
         self.assertEqual(gpu_info[0]["index"], "0")
-        self.assertEqual(gpu_info[0]["gpu_name"], "NVIDIA GeForce RTX 4050")
+        self.assertEqual(gpu_info[0]["name"], "NVIDIA GeForce RTX 4050")
         self.assertEqual(gpu_info[0]["uuid"], "GPU-123456")
         self.assertEqual(gpu_info[0]["driver_version"], "550.107.02")
-        self.assertEqual(gpu_info[0]["memory.total"], "6144")
+        self.assertEqual(gpu_info[0]["memory.total [MiB]"], 6144)
+        self.assertEqual(gpu_info[0]["power.max_limit [W]"], 50.0)
+        self.assertIsNone(gpu_info[0]["power.min_limit [W]"])
+
+    @unittest.mock.patch("gpu.tasks.utils.run_command_async")
+    async def test_query_gpu_malformed_output(self, mock_run_command_async):
+        """Test query_gpu handles a row not matching the header line.
+
+        Asserts:
+            - An empty list is returned.
+            - The parsing error is logged.
+        """
+        mock_run_command_async.return_value = {
+            "exit_code": 0,
+            "stdout": "index, uuid\n0, GPU-123456, 550.107.02\n",
+            "stderr": "",
+        }
+
+        with self.assertLogs("gpu.tasks.utils", level="ERROR") as log_capture:
+            gpu_info = await NvidiaSMI.query_gpu(["index", "uuid"])
+
+        self.assertEqual(gpu_info, [])
+        self.assertIn("Issue while parsing CSV output", log_capture.output[0])
 
     @unittest.mock.patch("gpu.tasks.utils.run_command_async")
     async def test_query_gpu_failure(self, mock_run_command_async):
@@ -82,6 +294,77 @@ class TestNvidiaSMI(TestCase):
 class TestLSPCI(TestCase):
     """Unit tests for LSPCI utility class."""
 
+    def setUp(self):
+        """Scan PCI devices in every test rather than using cached vendors.
+
+        Sysfs is made unreadable so 'lspci' is run, unless a test creates a fake sysfs
+        PCI devices directory.
+        """
+        LSPCI.invalidate_vendor_cache()
+        self.addCleanup(LSPCI.invalidate_vendor_cache)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.sysfs_pci_devices_path = os.path.join(tmp_dir.name, "devices")
+
+        patcher = unittest.mock.patch.object(
+            LSPCI, "_SYSFS_PCI_DEVICES_PATH", self.sysfs_pci_devices_path
+        )
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+    @unittest.mock.patch("gpu.tasks.utils.run_command_async")
+    async def test_get_gpu_vendors_from_sysfs(self, mock_run_command_async):
+        """Test get_gpu_vendors finds display controllers in sysfs.
+
+        Asserts:
+            - Vendors of VGA, 3D and other display controllers are returned.
+            - Other PCI devices and unknown vendors are ignored.
+            - 'lspci' is not run.
+        """
+        devices = {
+            "0000:00:02.0": ("0x030000", "0x8086"),
+            "0000:01:00.0": ("0x030200", "0x10de"),
+            "0000:02:00.0": ("0x038000", "0x1002"),
+            "0000:03:00.0": ("0x020000", "0x10de"),
+            "0000:04:00.0": ("0x030000", "0x1af4"),
+        }
+        for device, (pci_class, vendor) in devices.items():
+            device_path = os.path.join(self.sysfs_pci_devices_path, device)
+            os.makedirs(device_path)
+            for name, value in (("class", pci_class), ("vendor", vendor)):
+                with open(os.path.join(device_path, name), "w") as f:
+                    f.write(f"{value}\n")
+
+        gpu_vendors = await LSPCI.get_gpu_vendors()
+
+        self.assertEqual(gpu_vendors, {"NVIDIA", "AMD", "Intel"})
+        mock_run_command_async.assert_not_called()
+
+    @unittest.mock.patch("gpu.tasks.utils.run_command_async")
+    async def test_get_gpu_vendors_is_cached(self, mock_run_command_async):
+        """Test get_gpu_vendors only runs 'lspci' until it succeeds.
+
+        Asserts:
+            - 'lspci' is run again after a failure.
+            - The vendors of the first successful run are returned afterwards.
+        """
+        mock_run_command_async.side_effect = [
+            {"exit_code": 1, "stdout": "", "stderr": "Error: lspci command failed"},
+            {
+                "exit_code": 0,
+                "stdout": "01:00.0 VGA compatible controller: NVIDIA Corporation\n",
+                "stderr": "",
+            },
+        ]
+
+        with self.assertLogs("gpu.tasks.utils", level="ERROR"):
+            self.assertEqual(await LSPCI.get_gpu_vendors(), set())
+        self.assertEqual(await LSPCI.get_gpu_vendors(), {"NVIDIA"})
+        self.assertEqual(await LSPCI.get_gpu_vendors(), {"NVIDIA"})
+
+        self.assertEqual(mock_run_command_async.await_count, 2)
+
     @unittest.mock.patch("gpu.tasks.utils.run_command_async")
     async def test_get_gpu_vendors_success(self, mock_run_command_async):
         """Test get_gpu_vendors detects GPU vendors correctly.
@@ -7,9 +7,15 @@ Classes:
         A class for retrieving real-time memory and swap stats.
 """
 
+import os
+import re
+import time
+import asyncio
 import logging
 
-from sysmonify.core.tasks import Monitor
+from django.conf import settings
+
+from sysmonify.core.tasks import SAMPLING_EXECUTOR, Monitor
 
 
 logger = logging.getLogger(__name__)
@@ -19,28 +25,130 @@ class MemoryMonitor(Monitor):
     """A class for retrieving real-time memory and swap stats.
 
     Reads real-time memory metrics from /proc/meminfo and returns the metrics in a
-    dictionary.
+    dictionary. The parsed statistics are shared by all monitors for
+    `MEMORY_CACHE_TTL_SECONDS` seconds, so consumers ticking at the same time only
+    read `/proc/meminfo` once.
+
+    Attributes:
+        _cached_memory_info (dict | None):
+            The most recently parsed `/proc/meminfo` statistics, shared by all
+            monitors.
+
+        _cached_at (float):
+            The `time.monotonic()` time `_cached_memory_info` was read at.
 
     Methods:
+        close() -> None:
+            Closes the `/proc/meminfo` file descriptor if it is open.
+
+        _read_meminfo() -> bytes:
+            Reads the whole of `/proc/meminfo` through a long-lived file descriptor.
+
         _get_memory_info() -> dict:
             Reads and parses memory information from the /proc/meminfo file.
 
-        get_metrics() -> dict:
+        get_metrics(force: bool = False) -> dict:
             Retrieves real-time memory metrics and returns a dictionary.
     """
 
+    _MEMINFO_PATH = "/proc/meminfo"
+    _MEMINFO_READ_SIZE = 4096
+
+    # The `/proc/meminfo` statistics used by `get_metrics()`.
+    _MEMINFO_KEYS = (
+        "MemTotal",
+        "MemFree",
+        "Buffers",
+        "Cached",
+        "SwapTotal",
+        "SwapFree",
+    )
+
+    # Matches the statistics in `_MEMINFO_KEYS`. Anchored to the start of a line so
+    # e.g. `SwapCached` does not match `Cached`.
+    _MEMINFO_PATTERN = re.compile(
+        rb"^(" + "|".join(_MEMINFO_KEYS).encode() + rb"): +(\d+)", re.MULTILINE
+    )
+
+    _cached_memory_info: dict | None = None
+    _cached_at = 0.0
+
+    def __init__(self) -> None:
+        """Default initializer.
+
+        `/proc/meminfo` is opened by the first call to `get_metrics()`. The metrics
+        dictionary returned by `get_metrics()` is created once and updated in place.
+        """
+        self._fd = None
+        self._metrics = {
+            "memory": {"total": 0, "used": 0, "free": 0},
+            "swap": {"total": 0, "used": 0, "free": 0},
+        }
+
+    def __del__(self, _close=os.close) -> None:
+        """Release the open file descriptor when the monitor is garbage collected.
+
+        `os.close` is bound as a default argument so it is still reachable when the
+        monitor is collected during interpreter shutdown, after module globals are
+        cleared.
+        """
+        self.close(_close=_close)
+
+    def close(self, _close=os.close) -> None:
+        """Closes the `/proc/meminfo` file descriptor if it is open."""
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            try:
+                _close(fd)
+            except OSError:
+                pass
+
+        self._fd = None
+
+    def _read_meminfo(self) -> bytes:
+        """Reads the whole of `/proc/meminfo` through the long-lived file descriptor.
+
+        The file is opened on first use and then kept open, each read uses `os.pread()`
+        from offset 0 so no seek or reopen is needed between reads.
+
+        Returns:
+            bytes:
+                The contents of `/proc/meminfo`.
+
+        Raises:
+            OSError:
+                If `/proc/meminfo` cannot be opened or read.
+        """
+        if self._fd is None:
+            self._fd = os.open(self._MEMINFO_PATH, os.O_RDONLY | os.O_CLOEXEC)
+
+        chunks = []
+        offset = 0
+        while True:
+            chunk = os.pread(self._fd, self._MEMINFO_READ_SIZE, offset)
+            chunks.append(chunk)
+            offset += len(chunk)
+
+            # A short read means the end of the file was reached.
+            if len(chunk) < self._MEMINFO_READ_SIZE:
+                break
+
+        return b"".join(chunks)
+
     def _get_memory_info(self) -> dict:
         """Reads and parses memory information from the /proc/meminfo file.
 
-        This method attempts to open and read the contents of the `/proc/meminfo` file,
-        which contains various memory statistics on Linux systems. The file is parsed
-        line-by-line, splitting each line into a key-value pair, where the key is the
-        memory metric name and the value is the corresponding memory value (e.g.,
-        total memory, free memory). All parsed memory statistics are returned as a
-        dictionary.
+        This method reads the contents of the `/proc/meminfo` file, which contains
+        various memory statistics on Linux systems, through a file descriptor kept open
+        between calls. The file is read at once and only the statistics used by
+        `get_metrics()` are extracted with a single regular expression pass, where the
+        key is the memory metric name and the value is the corresponding memory value
+        (e.g., total memory, free memory). The statistics are near the top of the file,
+        so the scan stops as soon as all of them have been found.
 
         If an error occurs while reading the file (e.g., file not found, I/O error),
-        the exception is logged.
+        the exception is logged and the file descriptor is closed so the next call
+        reopens the file.
 
         Returns:
             dict:
@@ -61,35 +169,49 @@ class MemoryMonitor(Monitor):
         mem_stats = {}
 
         try:
-            with open("/proc/meminfo", "r") as file:
-                for line in file:
-                    parts = line.split(":")
-                    if len(parts) == 2:
-                        key = parts[0].strip()
-                        value = parts[1].strip().split()[0]
-                        mem_stats[key] = int(value)
+            meminfo = self._read_meminfo()
+
+            for match in self._MEMINFO_PATTERN.finditer(meminfo):
+                mem_stats[match[1].decode()] = int(match[2])
+
+                if len(mem_stats) == len(self._MEMINFO_KEYS):
+                    break
 
         except FileNotFoundError:
             logger.exception("/proc/meminfo file not found.")
+            self.close()
 
         except IOError as e:
             logger.exception(f"IOError while opening /proc/meminfo: {e}")
+            self.close()
 
         except Exception as e:
             logger.exception(f"Unexpected error while accessing /proc/meminfo: {e}")
+            self.close()
 
         return mem_stats
 
-    def get_metrics(self) -> dict:
+    async def get_metrics(self, force: bool = False) -> dict:
         """Retrieves real-time memory and swap metrics from the system.
 
         This method gathers memory and swap statistics, such as total, used, and free
         memory, by reading from the system's memory information (e.g., `/proc/meminfo`
         on Linux). It calculates used memory as the total memory minus free memory,
-        buffers, and cached memory, and similarly computes swap usage.
+        buffers, and cached memory, and similarly computes swap usage. `/proc/meminfo`
+        is read in the sampling executor so the event loop is not blocked by the file
+        read.
+
+        Statistics read less than `MEMORY_CACHE_TTL_SECONDS` seconds ago, by any
+        monitor, are reused unless `force` is True. If memory information cannot be
+        retrieved, it returns a dictionary with all values set to 0.
+
+        The same dictionary is returned by every call and updated in place, so callers
+        must copy it to keep values across calls.
 
-        If memory information cannot be retrieved, it returns a dictionary with all
-        values set to 0.
+        Args:
+            force (bool):
+                Whether to read `/proc/meminfo` even if cached statistics are still
+                fresh. Default is `False`.
 
         Returns:
             dict:
@@ -114,30 +236,41 @@ class MemoryMonitor(Monitor):
                 "swap": {"total": 2048, "used": 1024, "free": 1024}
             }
         """
-        metrics = {
-            "memory": {"total": 0, "used": 0, "free": 0},
-            "swap": {"total": 0, "used": 0, "free": 0},
-        }
-
-        mem_info = self._get_memory_info()
-
-        if mem_info:
-            mem_total = mem_info.get("MemTotal", 0)
-            mem_free = mem_info.get("MemFree", 0)
-            buffers = mem_info.get("Buffers", 0)
-            cached = mem_info.get("Cached", 0)
-            mem_used = mem_total - (mem_free + buffers + cached)
-
-            metrics["memory"]["total"] = mem_total
-            metrics["memory"]["used"] = mem_used
-            metrics["memory"]["free"] = mem_free
-
-            swap_total = mem_info.get("SwapTotal", 0)
-            swap_free = mem_info.get("SwapFree", 0)
-            swap_used = swap_total - swap_free
-
-            metrics["swap"]["total"] = swap_total
-            metrics["swap"]["used"] = swap_used
-            metrics["swap"]["free"] = swap_free
-
-        return metrics
+        mem_info = MemoryMonitor._cached_memory_info
+        if (
+            force
+            or mem_info is None
+            or time.monotonic() - MemoryMonitor._cached_at
+            >= settings.MEMORY_CACHE_TTL_SECONDS
+        ):
+            mem_info = await asyncio.get_running_loop().run_in_executor(
+                SAMPLING_EXECUTOR, self._get_memory_info
+            )
+
+            # Failed reads are not cached, so the next call tries again.
+            if mem_info:
+                MemoryMonitor._cached_memory_info = mem_info
+                MemoryMonitor._cached_at = time.monotonic()
+
+        # Every value is written on each call, a failed read resets them all to 0.
+        mem_total = mem_info.get("MemTotal", 0)
+        mem_free = mem_info.get("MemFree", 0)
+        buffers = mem_info.get("Buffers", 0)
+        cached = mem_info.get("Cached", 0)
+        mem_used = mem_total - (mem_free + buffers + cached)
+
+        memory = self._metrics["memory"]
+        memory["total"] = mem_total
+        memory["used"] = mem_used
+        memory["free"] = mem_free
+
+        swap_total = mem_info.get("SwapTotal", 0)
+        swap_free = mem_info.get("SwapFree", 0)
+        swap_used = swap_total - swap_free
+
+        swap = self._metrics["swap"]
+        swap["total"] = swap_total
+        swap["used"] = swap_used
+        swap["free"] = swap_free
+
+        return self._metrics
@@ -1,94 +1,141 @@
 """Unit tests for memory app monitors."""
 
-from unittest.mock import mock_open, patch
+import os
+import tempfile
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from memory.tasks.monitors import MemoryMonitor
 
 
 class MemoryMonitorTestCase(TestCase):
     """Test case for MemoryMonitor."""
 
-    @patch(
-        "builtins.open",
-        mock_open(
-            read_data="MemTotal: 16384 kB\nMemFree: 4096 kB\nSwapTotal: 8192 kB\nSwapFree: 2048 kB"
-        ),
+    def setUp(self):
+        """Start every test with no cached /proc/meminfo statistics.
+
+        The statistics are cached on the class and shared by all monitors, so the
+        cache is reset for every test.
+        """
+        for attribute in ("_cached_memory_info", "_cached_at"):
+            patcher = patch.object(
+                MemoryMonitor, attribute, getattr(MemoryMonitor, attribute)
+            )
+            self.addCleanup(patcher.stop)
+            patcher.start()
+        MemoryMonitor._cached_memory_info = None
+
+    @patch.object(
+        MemoryMonitor,
+        "_read_meminfo",
+        return_value=b"MemTotal: 16384 kB\nMemFree: 4096 kB\nSwapTotal: 8192 kB\nSwapFree: 2048 kB",
     )
-    def test_get_metrics_success(self):
+    async def test_get_metrics_success(self, mock_read_meminfo):
         """Test that get_metrics returns correct data from /proc/meminfo.
 
         Assets:
             get_metrics() returns the expected values.
         """
         monitor = MemoryMonitor()
-        result = monitor.get_metrics()
+        result = await monitor.get_metrics()
 
         self.assertEqual(result["memory"]["total"], 16384)
         self.assertEqual(result["memory"]["free"], 4096)
         self.assertEqual(result["swap"]["total"], 8192)
         self.assertEqual(result["swap"]["free"], 2048)
 
-    @patch(
-        "builtins.open",
-        mock_open(read_data="MemTotal: 16384 kB\nMemFree: 4096 kB\nSwapTotal: 8192 kB"),
+    @patch.object(
+        MemoryMonitor,
+        "_read_meminfo",
+        return_value=b"MemTotal: 16384 kB\nMemFree: 4096 kB\nSwapTotal: 8192 kB",
     )
-    def test_get_metrics_missing_swap(self):
+    async def test_get_metrics_missing_swap(self, mock_read_meminfo):
         """Test case where SwapFree is missing.
 
         Asserts:
             The default free swap value is returned.
         """
         monitor = MemoryMonitor()
-        result = monitor.get_metrics()
+        result = await monitor.get_metrics()
 
         self.assertEqual(result["swap"]["free"], 0)
 
-    @patch(
-        "builtins.open",
-        mock_open(read_data="MemTotal: 16384 kB\nMemFree: 4096 kB\nSwapFree: 2048 kB"),
+    @patch.object(
+        MemoryMonitor,
+        "_read_meminfo",
+        return_value=b"MemTotal: 16384 kB\nMemFree: 4096 kB\nSwapFree: 2048 kB",
     )
-    def test_get_metrics_missing_swap_total(self):
+    async def test_get_metrics_missing_swap_total(self, mock_read_meminfo):
         """Test case where SwapTotal is missing.
 
         Asserts:
             The default total swap value is returned.
         """
         monitor = MemoryMonitor()
-        result = monitor.get_metrics()
+        result = await monitor.get_metrics()
 
         self.assertEqual(result["swap"]["total"], 0)
 
-    @patch("builtins.open", mock_open(read_data="MemTotal: 16384 kB\nMemFree: 4096 kB"))
-    def test_get_metrics_no_swap(self):
+    @patch.object(
+        MemoryMonitor,
+        "_read_meminfo",
+        return_value=b"MemTotal: 16384 kB\nMemFree: 4096 kB",
+    )
+    async def test_get_metrics_no_swap(self, mock_read_meminfo):
         """Test case where both swap metrics are missing.
 
         Asserts:
             The default values for both swap metrics is returned.
         """
         monitor = MemoryMonitor()
-        result = monitor.get_metrics()
+        result = await monitor.get_metrics()
 
         self.assertEqual(result["swap"]["total"], 0)
         self.assertEqual(result["swap"]["free"], 0)
 
-    @patch("builtins.open", mock_open(read_data=""))
-    def test_get_metrics_empty_file(self):
+    @patch.object(
+        MemoryMonitor,
+        "_read_meminfo",
+        return_value=b"MemTotal:       16384 kB\nMemFree:         4096 kB\n"
+        b"Buffers:         1024 kB\nCached:          2048 kB\n"
+        b"SwapCached:       512 kB\nActive(anon):    8192 kB\n",
+    )
+    async def test_get_memory_info_only_used_statistics(self, mock_read_meminfo):
+        """Test that only the statistics used for the metrics are parsed.
+
+        Asserts:
+            - Used statistics are parsed regardless of their padding.
+            - Other statistics, including `SwapCached`, are ignored.
+        """
+        monitor = MemoryMonitor()
+
+        self.assertEqual(
+            monitor._get_memory_info(),
+            {"MemTotal": 16384, "MemFree": 4096, "Buffers": 1024, "Cached": 2048},
+        )
+        self.assertEqual((await monitor.get_metrics())["memory"]["used"], 9216)
+
+    @patch.object(
+        MemoryMonitor,
+        "_read_meminfo",
+        return_value=b"",
+    )
+    async def test_get_metrics_empty_file(self, mock_read_meminfo):
         """Test case where /proc/meminfo is empty.
 
         Asserts:
             The default values for all memory metrics are returned.
         """
         monitor = MemoryMonitor()
-        result = monitor.get_metrics()
+        result = await monitor.get_metrics()
 
         self.assertEqual(result["memory"]["total"], 0)
         self.assertEqual(result["memory"]["free"], 0)
         self.assertEqual(result["swap"]["total"], 0)
         self.assertEqual(result["swap"]["free"], 0)
 
-    @patch("builtins.open", side_effect=FileNotFoundError)
-    def test_get_metrics_file_not_found(self, mock_open):
+    @patch.object(MemoryMonitor, "_MEMINFO_PATH", "/nonexistent/meminfo")
+    async def test_get_metrics_file_not_found(self):
         """Test case where /proc/meminfo is not found.
 
         Asserts:
@@ -97,7 +144,7 @@ class MemoryMonitorTestCase(TestCase):
         """
         with self.assertLogs("memory.tasks.monitors", level="ERROR") as log_capture:
             monitor = MemoryMonitor()
-            result = monitor.get_metrics()
+            result = await monitor.get_metrics()
 
         self.assertTrue(
             any(
@@ -110,3 +157,86 @@ class MemoryMonitorTestCase(TestCase):
         self.assertEqual(result["memory"]["free"], 0)
         self.assertEqual(result["swap"]["total"], 0)
         self.assertEqual(result["swap"]["free"], 0)
+
+    async def test_read_meminfo_keeps_fd_open(self):
+        """Test that /proc/meminfo is read through a file descriptor kept open.
+
+        Asserts:
+            - The metrics are parsed from the file.
+            - The file descriptor is reused between reads.
+            - `close()` releases the file descriptor.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        meminfo_path = os.path.join(tmp_dir.name, "meminfo")
+        with open(meminfo_path, "w") as f:
+            f.write("MemTotal: 16384 kB\nMemFree: 4096 kB\n")
+
+        monitor = MemoryMonitor()
+        self.addCleanup(monitor.close)
+
+        with patch.object(MemoryMonitor, "_MEMINFO_PATH", meminfo_path):
+            result = await monitor.get_metrics()
+            fd = monitor._fd
+            await monitor.get_metrics(force=True)
+
+        self.assertEqual(result["memory"]["total"], 16384)
+        self.assertEqual(monitor._fd, fd)
+
+        monitor.close()
+        self.assertIsNone(monitor._fd)
+
+    @patch.object(MemoryMonitor, "_read_meminfo", return_value=b"MemTotal: 16384 kB")
+    async def test_get_metrics_cached(self, mock_read_meminfo):
+        """Test that /proc/meminfo statistics are shared by monitors within the TTL.
+
+        Asserts:
+            - /proc/meminfo is read once for two monitors.
+            - `force=True` reads /proc/meminfo again.
+        """
+        await MemoryMonitor().get_metrics()
+        result = await MemoryMonitor().get_metrics()
+
+        self.assertEqual(result["memory"]["total"], 16384)
+        mock_read_meminfo.assert_called_once()
+
+        await MemoryMonitor().get_metrics(force=True)
+
+        self.assertEqual(mock_read_meminfo.call_count, 2)
+
+    @override_settings(MEMORY_CACHE_TTL_SECONDS=0)
+    @patch.object(MemoryMonitor, "_read_meminfo", return_value=b"MemTotal: 16384 kB")
+    async def test_get_metrics_cache_expired(self, mock_read_meminfo):
+        """Test that /proc/meminfo is read again once the cached statistics expire.
+
+        Asserts:
+            /proc/meminfo is read on every call with a TTL of 0 seconds.
+        """
+        monitor = MemoryMonitor()
+        await monitor.get_metrics()
+        await monitor.get_metrics()
+
+        self.assertEqual(mock_read_meminfo.call_count, 2)
+
+    async def test_get_metrics_updates_in_place(self):
+        """Test that the metrics dictionary is reused and fully updated on every call.
+
+        Asserts:
+            - The same dictionary is returned by both calls.
+            - Values from a previous read are reset when /proc/meminfo cannot be read.
+        """
+        monitor = MemoryMonitor()
+
+        with patch.object(
+            MemoryMonitor, "_read_meminfo", return_value=b"MemTotal: 16384 kB"
+        ):
+            first = await monitor.get_metrics()
+
+        with (
+            patch.object(MemoryMonitor, "_read_meminfo", side_effect=OSError),
+            self.assertLogs("memory.tasks.monitors", level="ERROR"),
+        ):
+            second = await monitor.get_metrics(force=True)
+
+        self.assertIs(first, second)
+        self.assertEqual(second["memory"]["total"], 0)
@@ -15,9 +15,11 @@ Example:
 """
 
 import os
+import asyncio
 import logging
 
-from sysmonify.core.tasks import Details
+from sysmonify.core.cache import async_ttl_cache
+from sysmonify.core.tasks import SAMPLING_EXECUTOR, Details
 from network.tasks.utils import IP, IW, get_physical_network_interfaces
 
 
@@ -40,6 +42,16 @@ class NetworkDetails(Details):
         _get_interface_type(interface_name: str) -> str:
             Retrieve the interface type for a given interface.
 
+        _read_sysfs_details() -> dict:
+            Reads the sysfs details of all physical network interfaces at once.
+
+        _get_sysfs_details() -> dict:
+            Retrieves the sysfs details of all physical network interfaces, reusing
+            them for 10 seconds.
+
+        _query_interface_details(interface_name: str, interface_type: str) -> tuple:
+            Concurrently queries the IP addresses and WiFi info of a given interface.
+
         get_details() -> dict:
             Retrieve details about all physical network interfaces on the system and
             return the data in a dictionary.
@@ -227,11 +239,84 @@ class NetworkDetails(Details):
 
         return interface_type
 
+    def _read_sysfs_details(self) -> dict:
+        """Reads the sysfs details of all physical network interfaces at once.
+
+        Every sysfs file read for the network details is read by this method, so all of
+        them are read in a single call to the sampling executor rather than blocking the
+        event loop once per file.
+
+        Returns:
+            dict[dict]:
+                A dictionary where the keys are the physical network interface names
+                and the values are dictionaries with their "mac", "type", "speed" and
+                "mtu".
+        """
+        return {
+            interface: {
+                "mac": self._get_interface_mac(interface_name=interface),
+                "type": self._get_interface_type(interface_name=interface),
+                "speed": self._get_interface_max_speed(interface_name=interface),
+                "mtu": self._get_interface_mtu(interface_name=interface),
+            }
+            for interface in get_physical_network_interfaces()
+        }
+
+    @staticmethod
+    @async_ttl_cache(ttl_seconds=10)
+    async def _get_sysfs_details() -> dict:
+        """Retrieves the sysfs details of all physical network interfaces, reusing them for 10 seconds.
+
+        MAC addresses, interface types and link speeds do not change at runtime, and
+        MTUs rarely do, so they are shared by all `NetworkDetails` instances for 10
+        seconds rather than read on every tick.
+
+        Returns:
+            dict[dict]:
+                The details returned by `_read_sysfs_details()`, shared between callers,
+                which must not be modified.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            SAMPLING_EXECUTOR, NetworkDetails()._read_sysfs_details
+        )
+
+    async def _query_interface_details(
+        self, interface_name: str, interface_type: str
+    ) -> tuple:
+        """Concurrently queries the IP addresses and WiFi info of a given interface.
+
+        Args:
+            interface_name (str):
+                The name of the network interface, e.g. `wlan0`.
+
+            interface_type (str):
+                The type of the network interface, WiFi info is only queried for
+                `WiFi` interfaces.
+
+        Returns:
+            tuple[list, list, dict]:
+                The IPv4 addresses, IPv6 addresses and WiFi info of the interface. The
+                WiFi info is empty for other interface types.
+        """
+        queries = [
+            IP.get_ip_addresses(interface_name=interface_name),
+            IP.get_ip_addresses(interface_name=interface_name, ip_type=6),
+        ]
+        if interface_type == "WiFi":
+            queries.append(IW.get_wifi_info(interface_name=interface_name))
+
+        ipv4, ipv6, *wifi_info = await asyncio.gather(*queries)
+
+        return ipv4, ipv6, wifi_info[0] if wifi_info else {}
+
     async def get_details(self) -> dict:
         """Retrieve details about all physical network interfaces on the system and return the data in a dictionary.
 
         Gathers network interface details for all physical network interfaces on the
-        system, and parses the details in a dictionary.
+        system, and parses the details in a dictionary. The sysfs files of all
+        interfaces are read in one call to the sampling executor at most every 10
+        seconds, and the 'ip' and 'iw' commands of all interfaces are run concurrently
+        on every call.
 
         Details gathered:
             - Network Interface Name (e.g., 'eth0')
@@ -262,20 +347,27 @@ class NetworkDetails(Details):
                 }
         """
         details = {}
-        interfaces = get_physical_network_interfaces()
+        sysfs_details = await self._get_sysfs_details()
+
+        interface_details = await asyncio.gather(
+            *(
+                self._query_interface_details(
+                    interface_name=interface, interface_type=interface_sysfs["type"]
+                )
+                for interface, interface_sysfs in sysfs_details.items()
+            )
+        )
 
-        for interface in interfaces:
-            additional_info = {}
-            interface_type = self._get_interface_type(interface_name=interface)
-            if interface_type == "WiFi":
-                additional_info = await IW.get_wifi_info(interface_name=interface)
+        for (interface, interface_sysfs), (ipv4, ipv6, additional_info) in zip(
+            sysfs_details.items(), interface_details
+        ):
             details[interface] = {
-                "mac": self._get_interface_mac(interface_name=interface),
-                "type": interface_type,
-                "ipv4": await IP.get_ip_addresses(interface_name=interface),
-                "ipv6": await IP.get_ip_addresses(interface_name=interface, ip_type=6),
-                "speed": self._get_interface_max_speed(interface_name=interface),
-                "mtu": self._get_interface_mtu(interface_name=interface),
+                "mac": interface_sysfs["mac"],
+                "type": interface_sysfs["type"],
+                "ipv4": ipv4,
+                "ipv6": ipv6,
+                "speed": interface_sysfs["speed"],
+                "mtu": interface_sysfs["mtu"],
                 "additional": additional_info,
             }
 
@@ -226,15 +226,17 @@ class NetworkConnectionsMonitor(Monitor):
                 will be an empty string.
         """
         inode_proc = {}
-        for pid in filter(str.isdigit, os.listdir("/proc")):
-            fd_dir = os.path.join("/proc", pid, "fd")
+        for proc_entry in os.scandir("/proc"):
+            pid = proc_entry.name
+            if not pid.isdigit():
+                continue
 
-            try:
-                for fd in os.listdir(fd_dir):
-                    path = os.path.join(fd_dir, fd)
+            fd_dir = os.path.join(proc_entry.path, "fd")
 
+            try:
+                for fd_entry in os.scandir(fd_dir):
                     try:
-                        target = os.readlink(path)
+                        target = os.readlink(fd_entry.path)
                         if target.startswith("socket:["):
                             inode = target[8:-1]
 
@@ -11,8 +11,14 @@ class TestNetworkDetails(TestCase):
     """Unit tests for the NetworkDetails class."""
 
     def setUp(self):
-        """Set up a NetworkDetails instance for testing."""
+        """Set up a NetworkDetails instance for testing.
+
+        Sysfs details are cached between instances, so the cache is cleared for every
+        test.
+        """
         self.network_details = NetworkDetails()
+        NetworkDetails._get_sysfs_details.cache_clear()
+        self.addCleanup(NetworkDetails._get_sysfs_details.cache_clear)
 
     @unittest.mock.patch(
         "builtins.open",
@@ -137,6 +143,51 @@ class TestNetworkDetails(TestCase):
         self.assertIn("ipv6", details["eth0"])
         self.assertEqual(details["eth0"]["ipv6"], ["fe80::1"])
 
+    @unittest.mock.patch(
+        "network.tasks.details.NetworkDetails._read_sysfs_details",
+        return_value={
+            "eth0": {"mac": "", "type": "Ethernet", "speed": "", "mtu": ""},
+            "wlan0": {"mac": "", "type": "WiFi", "speed": "", "mtu": ""},
+        },
+    )
+    @unittest.mock.patch(
+        "network.tasks.utils.IW.get_wifi_info", new_callable=unittest.mock.AsyncMock
+    )
+    @unittest.mock.patch(
+        "network.tasks.utils.IP.get_ip_addresses", new_callable=unittest.mock.AsyncMock
+    )
+    async def test_get_details_wifi(
+        self, mock_get_ips, mock_get_wifi_info, mock_read_sysfs_details
+    ):
+        """Test that WiFi info is only queried for WiFi interfaces.
+
+        Asserts:
+            - WiFi info is queried once, for the WiFi interface.
+            - The additional info of other interfaces is empty.
+        """
+        mock_get_ips.return_value = []
+        mock_get_wifi_info.return_value = {"ssid": "sysmonify"}
+
+        details = await self.network_details.get_details()
+
+        mock_get_wifi_info.assert_awaited_once_with(interface_name="wlan0")
+        self.assertEqual(details["wlan0"]["additional"], {"ssid": "sysmonify"})
+        self.assertEqual(details["eth0"]["additional"], {})
+
+    @unittest.mock.patch(
+        "network.tasks.details.NetworkDetails._read_sysfs_details", return_value={}
+    )
+    async def test_get_details_caches_sysfs_details(self, mock_read_sysfs_details):
+        """Test that sysfs details are shared by all instances within the TTL.
+
+        Asserts:
+            Sysfs is read once for two `NetworkDetails` instances.
+        """
+        await self.network_details.get_details()
+        await NetworkDetails().get_details()
+
+        mock_read_sysfs_details.assert_called_once()
+
     @unittest.mock.patch("os.path.exists", return_value=False)
     def test_get_interface_mac_error_returns_default(self, mock_exists):
         """Test error handling in MAC address retrieval.
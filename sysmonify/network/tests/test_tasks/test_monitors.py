@@ -206,23 +206,32 @@ class TestNetworkConnectionsMonitor(unittest.TestCase):
             self.assertEqual(result[0]["sent_bytes"], 0)
             self.assertEqual(result[0]["received_bytes"], 0)
 
-    @unittest.mock.patch("os.listdir")
+    @unittest.mock.patch("os.scandir")
     @unittest.mock.patch("os.readlink")
     @unittest.mock.patch(
         "builtins.open",
         new_callable=unittest.mock.mock_open,
         read_data="test_process\n",
     )
-    def test_get_socket_process_map(self, mock_open_file, mock_readlink, mock_listdir):
+    def test_get_socket_process_map(self, mock_open_file, mock_readlink, mock_scandir):
         """Test that the method correctly maps socket inodes to process IDs and names.
 
         Assert:
             Inodes are correctly mapped to system processes.
         """
-        mock_listdir.side_effect = [
-            ["1234", "5678"],
-            ["1", "2"],
-            ["3", "4"],
+
+        def entries(directory, names):
+            result = []
+            for name in names:
+                entry = unittest.mock.Mock(path=f"{directory}/{name}")
+                entry.name = name
+                result.append(entry)
+            return result
+
+        mock_scandir.side_effect = [
+            entries("/proc", ["1234", "self", "5678"]),
+            entries("/proc/1234/fd", ["1", "2"]),
+            entries("/proc/5678/fd", ["3", "4"]),
         ]
 
         mock_readlink.side_effect = [
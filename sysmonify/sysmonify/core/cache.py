@@ -0,0 +1,72 @@
+"""cache.py.
+
+Caching helpers for hardware details which rarely change.
+
+Functions:
+    `async_ttl_cache()`:
+        Caches the result of a coroutine function for a fixed number of seconds.
+"""
+
+import time
+import asyncio
+import weakref
+import functools
+from typing import Awaitable, Callable
+
+
+def async_ttl_cache(ttl_seconds: float) -> Callable:
+    """Caches the result of a coroutine function for `ttl_seconds` seconds.
+
+    Results are cached per positional arguments, so decorating a method caches per
+    instance. Concurrent callers with a cold or expired cache wait on a lock for the
+    first caller's result instead of each running the coroutine function themselves.
+
+    The decorated function gains a `cache_clear()` method to drop all cached results,
+    e.g. when the underlying hardware is known to have changed.
+
+    Args:
+        ttl_seconds (float):
+            How long a result is reused for, in seconds.
+
+    Returns:
+        Callable:
+            A decorator for a coroutine function taking hashable positional arguments.
+    """
+
+    def decorator(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+        results = {}
+        # asyncio locks are bound to the event loop they are first contended on.
+        locks = weakref.WeakKeyDictionary()
+
+        def _get_fresh(args: tuple) -> tuple[bool, object]:
+            cached = results.get(args)
+            if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+                return True, cached[1]
+
+            return False, None
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            is_fresh, result = _get_fresh(args)
+            if is_fresh:
+                return result
+
+            loop = asyncio.get_running_loop()
+            lock = locks.get(loop)
+            if lock is None:
+                lock = locks[loop] = asyncio.Lock()
+
+            async with lock:
+                is_fresh, result = _get_fresh(args)
+                if is_fresh:
+                    return result
+
+                result = await func(*args)
+                results[args] = (time.monotonic(), result)
+
+            return result
+
+        wrapper.cache_clear = results.clear
+        return wrapper
+
+    return decorator
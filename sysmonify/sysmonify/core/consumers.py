@@ -8,12 +8,14 @@ Classes:
 """
 
 import abc
-import json
 import asyncio
 import logging
 
+import orjson
 from channels.generic.websocket import AsyncWebsocketConsumer
 
+from sysmonify.core.utils import Ticker
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +26,21 @@ class Consumer(AsyncWebsocketConsumer, abc.ABC):
     This consumer allows clients to connect to a WebSocket endpoint
     and receive live system metrics, such as CPU usage, memory usage.
 
+    Attributes:
+        OFFLOAD_THRESHOLD_BYTES (int):
+            Once a serialized message exceeds this size, subsequent messages are
+            serialized in a worker thread so large payloads do not block the event loop.
+
     Methods:
         connect: Handles a new WebSocket connection.
-        disconnect: Handles WebSocket disconnections.
-        receive: Handles incoming messages from the WebSocket client.
+        send_message: Serializes a message and sends it to the client.
     """
 
+    OFFLOAD_THRESHOLD_BYTES = 4096
+
+    _last_message_size = 0
+    _ticker = None
+
     async def connect(self) -> None:
         """Handles a new WebSocket connection.
 
@@ -40,18 +51,47 @@ class Consumer(AsyncWebsocketConsumer, abc.ABC):
         await self.accept()
         await self.send_message_periodically()
 
-    async def disconnect(self, close_code: int) -> None:
-        """Handles WebSocket disconnections.
+    async def send_message(self, message: dict) -> None:
+        """Serializes a message to JSON and sends it to the client.
 
-        Removes the client from the metrics group when the connection is closed.
+        Serialization is moved off the event loop thread when the previous message sent
+        by this consumer exceeded `OFFLOAD_THRESHOLD_BYTES`, as consecutive messages
+        from a consumer are usually of a similar size.
 
         Args:
-            close_code (int):
-                The WebSocket close code.
+            message (dict):
+                The message to send to the client.
+        """
+        if self._last_message_size > self.OFFLOAD_THRESHOLD_BYTES:
+            payload = await asyncio.to_thread(
+                orjson.dumps, message, option=orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            payload = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+
+        self._last_message_size = len(payload)
+        await self.send(text_data=payload.decode())
+
+    async def wait_for_next_message(self, interval_seconds: float) -> None:
+        """Waits until the next message should be sent to the client.
+
+        Waits for the next tick every `interval_seconds` by default, so the time taken
+        to gather and send a message does not delay the following ones. Consumers
+        backed by a shared sampler can override this to wake up as soon as a new sample
+        is available instead.
+
+        Args:
+            interval_seconds (float):
+                The interval time in seconds between messages.
         """
-        pass
+        if self._ticker is None:
+            self._ticker = Ticker(interval_seconds)
 
-    async def send_message_periodically(self, interval_seconds: float = 1.0) -> None:
+        await self._ticker.wait()
+
+    async def send_message_periodically(
+        self, interval_seconds: float = 1.0, wait_before_first_message: bool = False
+    ) -> None:
         """This function sends messages to the client every `interval_seconds` seconds.
 
         Args:
@@ -59,6 +99,11 @@ class Consumer(AsyncWebsocketConsumer, abc.ABC):
                 The interval time in seconds for the websocket to send messages to the
                 client. Default is `1.0` seconds.
 
+            wait_before_first_message (bool):
+                Whether to wait for the next interval before sending the first message,
+                e.g. when the first metrics were already sent along with the initial
+                message. Default is `False`.
+
         Raises:
             asyncio.CancelledError:
                 If the asyncio task is cancelled.
@@ -67,13 +112,16 @@ class Consumer(AsyncWebsocketConsumer, abc.ABC):
                 message.
         """
         try:
+            if wait_before_first_message:
+                await self.wait_for_next_message(interval_seconds)
+
             while True:
                 message = await self.get_message_data()
-                await self.send(text_data=json.dumps(message))
-                await asyncio.sleep(interval_seconds)
+                await self.send_message(message)
+                await self.wait_for_next_message(interval_seconds)
 
         except asyncio.exceptions.CancelledError:
-            ...
+            raise
 
         except Exception as e:
             logger.exception(f"Unexpected error in sending periodic messages: {str(e)}")
@@ -90,23 +138,6 @@ class Consumer(AsyncWebsocketConsumer, abc.ABC):
         """Retrieves message data to be sent to the client."""
         ...
 
-    async def receive(self, json: str) -> None:
-        """Handles incoming messages from the WebSocket client.
-
-        This method processes messages sent by the client. If necessary,
-        it can be extended to handle commands or actions requested by
-        the client.
-
-        Args:
-            json (str):
-                The raw JSON message received from the client.
-
-        Raises:
-            ValueError:
-                If `json` is not valid JSON.
-        """
-        pass
-
 
 class TestConsumer(Consumer):
     """A test subclass of the Consumer class to implement the abstract method."""
@@ -7,9 +7,33 @@ Classes:
     `Monitor`:
         An abstract base monitor that all other real-time hardware monitors inherit
         from.
+
+    `Sampler`:
+        Samples metrics in a single background task and shares the latest sample with
+        all subscribed consumers.
+
+Attributes:
+    `SAMPLING_EXECUTOR`:
+        A small thread pool for the blocking reads made by monitors.
 """
 
 import abc
+import asyncio
+import logging
+import concurrent.futures
+from typing import Awaitable, Callable
+
+from sysmonify.core.utils import Ticker
+
+
+logger = logging.getLogger(__name__)
+
+# Samplers read each metric family (cpu frequency, temperature, disk I/O, ...) once per
+# tick, so a handful of threads is enough. The default executor is sized for general
+# purpose work (up to 32 threads) and would only add threads contending for the GIL.
+SAMPLING_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="sysmonify-sample"
+)
 
 
 class Details(abc.ABC):
@@ -38,3 +62,137 @@ class Monitor(abc.ABC):
     def get_metrics(self) -> dict:
         """Retrieves current metrics for a hardware resource."""
         ...
+
+
+class Sampler:
+    """Samples metrics in a single background task and shares them with all subscribers.
+
+    Rather than every consumer querying the hardware on its own tick, one background
+    task calls `sample()` every `interval_seconds` while at least one consumer is
+    subscribed, and keeps the most recent result. Consumers read the latest sample
+    without triggering any I/O of their own, so the cost of sampling no longer grows
+    with the number of connected clients.
+
+    Methods:
+        subscribe():
+            Registers a consumer, starting the background task if necessary.
+
+        unsubscribe():
+            Unregisters a consumer, stopping the background task after the last one.
+
+        get_latest() -> dict:
+            Returns the most recent sample.
+
+        wait_for_sample():
+            Waits until the next sample has been taken.
+
+    Example:
+        sampler = Sampler(sample=monitor.get_metrics)
+        await sampler.subscribe()
+        metrics = await sampler.get_latest()
+        sampler.unsubscribe()
+    """
+
+    def __init__(
+        self, sample: Callable[[], Awaitable[dict]], interval_seconds: float = 1.0
+    ) -> None:
+        """Default initializer.
+
+        Args:
+            sample (Callable[[], Awaitable[dict]]):
+                A coroutine function returning the current metrics.
+
+            interval_seconds (float):
+                The interval time in seconds between samples. Default is `1.0` seconds.
+        """
+        self._sample = sample
+        self._interval_seconds = interval_seconds
+        self._latest = None
+        self._subscribers = 0
+        self._task = None
+        self._new_sample = asyncio.Condition()
+        self._first_sample = asyncio.Event()
+
+    @property
+    def latest(self) -> dict | None:
+        """The most recent sample, or None if no sample has been taken yet."""
+        return self._latest
+
+    async def subscribe(self) -> None:
+        """Registers a consumer, starting the background sampling task if necessary.
+
+        The task is created before anything is awaited, so concurrent first
+        subscribers cannot each start a task of their own. When the task is (re)started
+        it takes a first sample immediately, and every subscriber waits for that first
+        attempt so the latest sample is never stale from a previous run.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._latest = None
+            self._subscribers = 0
+            self._new_sample = asyncio.Condition()
+            self._first_sample = asyncio.Event()
+            self._task = loop.create_task(self._run())
+
+        self._subscribers += 1
+        await self._first_sample.wait()
+
+    def unsubscribe(self) -> None:
+        """Unregisters a consumer, stopping the background task after the last one."""
+        self._subscribers = max(self._subscribers - 1, 0)
+
+        if self._subscribers == 0 and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def get_latest(self) -> dict:
+        """Returns the most recent sample.
+
+        Only the background task samples, subscribers have already waited for its first
+        attempt in `subscribe()`. A failed sample is not retried here, as every
+        consumer doing so would race the background task on each tick.
+
+        Returns:
+            dict:
+                The most recent metrics returned by `sample()`, or an empty dictionary
+                if no sample has been taken successfully yet.
+        """
+        return self._latest or {}
+
+    async def wait_for_sample(self) -> None:
+        """Waits until the next sample has been taken.
+
+        All waiting consumers are woken together by a single `notify_all()`, so they no
+        longer need to poll for new data on their own timers.
+        """
+        async with self._new_sample:
+            await self._new_sample.wait()
+
+    async def _take_sample(self) -> None:
+        """Calls `sample()`, stores the result as the latest sample and notifies waiters.
+
+        Waiters are notified even if sampling failed, so consumers are never blocked
+        indefinitely by a monitor that keeps failing.
+        """
+        try:
+            self._latest = await self._sample()
+
+        except Exception as e:
+            logger.exception(f"Unexpected error while sampling metrics: {e}")
+
+        async with self._new_sample:
+            self._new_sample.notify_all()
+
+    async def _run(self) -> None:
+        """Samples metrics immediately and then every `interval_seconds` until cancelled."""
+        ticker = Ticker(self._interval_seconds)
+
+        try:
+            while True:
+                await self._take_sample()
+                self._first_sample.set()
+                await ticker.wait()
+
+        except asyncio.CancelledError:
+            ...
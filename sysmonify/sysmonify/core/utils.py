@@ -1,17 +1,31 @@
 """utils.py.
 
-A collection of utility functions.
+A collection of utility functions, and the `Ticker` class for waiting for
+periodic ticks without drift.
+
+Attributes:
+    `SUBPROCESS_EXECUTOR`:
+        A small thread pool for running subprocess commands.
 """
 
 import pathlib
 import asyncio
 import logging
+import functools
+import subprocess
+import concurrent.futures
 
 import aiofiles
 
 
 logger = logging.getLogger(__name__)
 
+# Commands such as 'nvidia-smi', 'top' and 'ip' are run every tick by several apps,
+# a few threads are enough to run them side by side.
+SUBPROCESS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="sysmonify-subprocess"
+)
+
 
 async def read_file_async(filepath: pathlib.Path) -> str | None:
     """Reads a file asynchronously.
@@ -42,26 +56,31 @@ async def read_file_async(filepath: pathlib.Path) -> str | None:
     return file_lines
 
 
-async def run_command_async(command: list):
-    """Run an async subprocess command with error handling.
+async def run_command_async(command: list, timeout_seconds: float = 5.0):
+    """Run a subprocess command in `SUBPROCESS_EXECUTOR` with error handling.
+
+    The command is spawned and waited for in a worker thread, so neither forking a
+    process nor a slow command blocks the event loop.
 
     Args:
         command (list): Command and arguments as a list. Example: ["ls", "-l"]
+        timeout_seconds (float): Seconds after which the command is killed.
 
     Returns:
         dict: A dictionary with 'stdout', 'stderr', and 'exit_code'
     """
     try:
-        process = await asyncio.create_subprocess_exec(
-            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        process = await asyncio.get_running_loop().run_in_executor(
+            SUBPROCESS_EXECUTOR,
+            functools.partial(
+                subprocess.run, command, capture_output=True, timeout=timeout_seconds
+            ),
         )
 
-        stdout, stderr = await process.communicate()
-
         return {
             "exit_code": process.returncode,
-            "stdout": stdout.decode().strip(),
-            "stderr": stderr.decode().strip(),
+            "stdout": process.stdout.decode().strip(),
+            "stderr": process.stderr.decode().strip(),
         }
 
     except FileNotFoundError:
@@ -72,10 +91,48 @@ async def run_command_async(command: list):
             "stderr": f"Command not found: {command[0]}",
         }
 
-    except asyncio.TimeoutError:
+    except subprocess.TimeoutExpired:
         logger.exception(f"Error: Command timed out: {command}")
         return {"exit_code": -1, "stdout": "", "stderr": "Command timed out"}
 
     except Exception as e:
         logger.exception(f"Unexpected error running command {command}: {e}")
         return {"exit_code": -1, "stdout": "", "stderr": str(e)}
+
+
+class Ticker:
+    """Waits for periodic ticks on the event loop's monotonic clock without drift.
+
+    Sleeping for a fixed interval after each piece of work delays every following
+    tick by the time the work took. Ticks are instead scheduled at fixed deadlines
+    `interval_seconds` apart, starting from the first call to `wait()`. Ticks missed
+    while the event loop was busy are skipped rather than fired in a burst.
+
+    Methods:
+        wait():
+            Waits until the next tick.
+    """
+
+    def __init__(self, interval_seconds: float) -> None:
+        """Default initializer.
+
+        Args:
+            interval_seconds (float):
+                The interval time in seconds between ticks.
+        """
+        self._interval_seconds = interval_seconds
+        self._next_tick = None
+
+    async def wait(self) -> None:
+        """Waits until the next tick."""
+        now = asyncio.get_running_loop().time()
+
+        if self._next_tick is None:
+            self._next_tick = now
+
+        self._next_tick += self._interval_seconds
+        if self._next_tick < now:
+            missed_ticks = (now - self._next_tick) // self._interval_seconds + 1
+            self._next_tick += missed_ticks * self._interval_seconds
+
+        await asyncio.sleep(self._next_tick - now)
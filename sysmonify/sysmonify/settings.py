@@ -159,8 +159,22 @@ DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
 
 
 # Channels
+# Consumers never publish to groups or message each other, so no channel layer is
+# configured. This keeps every consumer on the plain ASGI send path.
 
-CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+CHANNEL_LAYERS = {}
+
+
+# Sysmonify
+# GPU stats change slowly and every update queries the GPU driver, so GPU metrics are
+# sent less often than other metrics.
+
+GPU_POLL_INTERVAL_SECONDS = float(os.getenv("SYSMONIFY_GPU_POLL_INTERVAL", "5"))
+
+# Memory stats read by one client are reused by all clients for this long, so the
+# number of `/proc/meminfo` reads does not grow with the number of clients.
+
+MEMORY_CACHE_TTL_SECONDS = float(os.getenv("SYSMONIFY_MEMORY_CACHE_TTL", "0.5"))
 
 # Logging
 
@@ -0,0 +1,76 @@
+"""test_cache.py.
+
+This module contains unit tests for `sysmonify.core.cache`
+"""
+
+import asyncio
+import unittest
+
+from django.test import SimpleTestCase
+
+from sysmonify.core.cache import async_ttl_cache
+
+
+class TestAsyncTTLCache(SimpleTestCase):
+    """Test the `async_ttl_cache` decorator."""
+
+    def setUp(self):
+        """Create a cached coroutine function which counts its calls."""
+
+        async def scan(name):
+            await asyncio.sleep(0.01)
+            return {"name": name}
+
+        self.scan = unittest.mock.AsyncMock(side_effect=scan)
+        self.cached_scan = async_ttl_cache(ttl_seconds=30)(self.scan)
+
+    async def test_result_is_reused_within_ttl(self):
+        """Test that a cached result is returned until it expires.
+
+        Asserts:
+            - The coroutine function is only awaited once for the same arguments.
+            - Different arguments are cached separately.
+        """
+        first = await self.cached_scan("sda")
+        second = await self.cached_scan("sda")
+        await self.cached_scan("sdb")
+
+        self.assertIs(first, second)
+        self.assertEqual(self.scan.await_count, 2)
+
+    async def test_concurrent_callers_share_one_call(self):
+        """Test that concurrent callers with a cold cache wait for a single call.
+
+        Asserts:
+            - The coroutine function is only awaited once.
+            - Every caller gets the same result.
+        """
+        results = await asyncio.gather(*(self.cached_scan("sda") for _ in range(5)))
+
+        self.assertEqual(self.scan.await_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_result_expires_after_ttl(self):
+        """Test that the coroutine function is awaited again once the TTL passes.
+
+        Asserts:
+            The coroutine function is awaited again after the TTL.
+        """
+        with unittest.mock.patch("sysmonify.core.cache.time") as mock_time:
+            mock_time.monotonic.side_effect = [0, 31, 31, 31]
+            await self.cached_scan("sda")
+            await self.cached_scan("sda")
+
+        self.assertEqual(self.scan.await_count, 2)
+
+    async def test_cache_clear(self):
+        """Test that `cache_clear()` drops cached results.
+
+        Asserts:
+            The coroutine function is awaited again after the cache is cleared.
+        """
+        await self.cached_scan("sda")
+        self.cached_scan.cache_clear()
+        await self.cached_scan("sda")
+
+        self.assertEqual(self.scan.await_count, 2)
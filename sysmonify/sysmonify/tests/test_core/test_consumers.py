@@ -3,6 +3,8 @@
 This module contains unit tests for `sysmonify.core.TestConsumer`
 """
 
+import unittest
+
 from django.test import TestCase
 from channels.testing import WebsocketCommunicator
 
@@ -51,3 +53,48 @@ class TestConsumer(TestCase):
         assert connected
 
         await communicator.disconnect()
+
+    async def test_websocket_ignores_client_messages(self):
+        """Test that messages sent by the client are ignored without error.
+
+        Asserts:
+            The consumer keeps sending metrics after receiving a client message.
+        """
+        communicator = WebsocketCommunicator(
+            consumers.TestConsumer.as_asgi(), "ws/metrics/"
+        )
+        connected, subprotocol = await communicator.connect()
+
+        self.assertTrue(connected)
+
+        await communicator.receive_json_from()
+        await communicator.send_to(text_data='{"command": "ping"}')
+
+        response = await communicator.receive_json_from(timeout=3)
+
+        self.assertEqual(response, {"message": "test message"})
+
+        await communicator.disconnect()
+
+    async def test_send_message_offloads_large_payloads(self):
+        """Test that serialization is moved to a worker thread for large payloads.
+
+        Asserts:
+            - Small payloads are serialized inline.
+            - Once a payload exceeds the threshold, the next one is serialized via
+              `asyncio.to_thread`.
+            - The serialized JSON is sent to the client as text.
+        """
+        consumer = consumers.TestConsumer()
+        consumer.send = unittest.mock.AsyncMock()
+
+        with unittest.mock.patch(
+            "asyncio.to_thread", wraps=consumers.asyncio.to_thread
+        ) as mock_to_thread:
+            await consumer.send_message({"message": "x" * 5000})
+            mock_to_thread.assert_not_called()
+
+            await consumer.send_message({"message": "test message"})
+            mock_to_thread.assert_called_once()
+
+        consumer.send.assert_awaited_with(text_data='{"message":"test message"}')
@@ -0,0 +1,129 @@
+"""test_tasks.py.
+
+This module contains unit tests for `sysmonify.core.tasks`
+"""
+
+import asyncio
+import unittest
+
+from django.test import TestCase
+
+from sysmonify.core.tasks import Sampler
+
+
+class TestSampler(TestCase):
+    """Test the `Sampler` class."""
+
+    def setUp(self):
+        """Create a sampler of a mock monitor that counts its calls."""
+        self.sample = unittest.mock.AsyncMock(
+            side_effect=lambda: {"sample": self.sample.await_count}
+        )
+        self.sampler = Sampler(sample=self.sample, interval_seconds=0.01)
+
+    async def test_subscribe_takes_first_sample(self):
+        """Test that subscribing starts sampling with an immediate first sample.
+
+        Asserts:
+            - A sample is available straight after subscribing.
+            - The background task keeps sampling.
+        """
+        await self.sampler.subscribe()
+
+        self.assertEqual(await self.sampler.get_latest(), {"sample": 1})
+
+        await asyncio.sleep(0.05)
+        self.assertGreater(self.sample.await_count, 1)
+
+        self.sampler.unsubscribe()
+
+    async def test_unsubscribe_stops_sampling_after_last_subscriber(self):
+        """Test that the background task only stops after the last unsubscribe.
+
+        Asserts:
+            - The task keeps running while a subscriber remains.
+            - The task is cancelled after the last subscriber leaves.
+        """
+        await self.sampler.subscribe()
+        await self.sampler.subscribe()
+
+        self.sampler.unsubscribe()
+        self.assertIsNotNone(self.sampler._task)
+
+        self.sampler.unsubscribe()
+        self.assertIsNone(self.sampler._task)
+
+    async def test_wait_for_sample_wakes_all_waiters(self):
+        """Test that all waiting consumers are woken by a single new sample.
+
+        Asserts:
+            Every waiter returns once the next sample has been taken.
+        """
+        waiters = [
+            asyncio.create_task(self.sampler.wait_for_sample()) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+
+        await self.sampler._take_sample()
+
+        await asyncio.wait_for(asyncio.gather(*waiters), timeout=1)
+
+    async def test_concurrent_subscribers_share_one_task(self):
+        """Test that concurrent first subscribers start a single background task.
+
+        Asserts:
+            - Only one first sample is taken for both subscribers.
+            - No sampling task is left running after both unsubscribe.
+        """
+
+        async def slow_sample():
+            await asyncio.sleep(0.01)
+            return {"sample": self.sample.await_count}
+
+        self.sample.side_effect = slow_sample
+
+        await asyncio.gather(self.sampler.subscribe(), self.sampler.subscribe())
+
+        self.assertEqual(self.sampler.latest, {"sample": 1})
+        task = self.sampler._task
+
+        self.sampler.unsubscribe()
+        self.sampler.unsubscribe()
+        await asyncio.sleep(0)
+
+        self.assertTrue(task.done())
+        self.assertEqual(
+            [t for t in asyncio.all_tasks() if t.get_coro().__name__ == "_run"], []
+        )
+
+    async def test_get_latest_handles_sampling_errors(self):
+        """Test that a failing sample does not raise.
+
+        Asserts:
+            - An empty dictionary is returned if no sample could be taken.
+            - Only the background task samples, `get_latest()` does not retry.
+        """
+        self.sample.side_effect = Exception("Failed to sample")
+
+        with self.assertLogs("sysmonify.core.tasks", level="ERROR"):
+            await self.sampler.subscribe()
+            self.addCleanup(self.sampler.unsubscribe)
+            await_count = self.sample.await_count
+
+            self.assertEqual(await self.sampler.get_latest(), {})
+            self.assertEqual(self.sample.await_count, await_count)
+
+    async def test_wait_for_sample_wakes_on_sampling_errors(self):
+        """Test that waiting consumers are woken even if a sample fails.
+
+        Asserts:
+            The waiter returns once the failed sample has been attempted.
+        """
+        self.sample.side_effect = Exception("Failed to sample")
+        waiter = asyncio.create_task(self.sampler.wait_for_sample())
+        await asyncio.sleep(0)
+
+        with self.assertLogs("sysmonify.core.tasks", level="ERROR"):
+            await self.sampler._take_sample()
+
+        await asyncio.wait_for(waiter, timeout=1)
@@ -0,0 +1,107 @@
+"""test_utils.py.
+
+This module contains unit tests for `sysmonify.core.utils`
+"""
+
+import asyncio
+import unittest
+
+from django.test import SimpleTestCase
+
+from sysmonify.core.utils import Ticker, run_command_async
+
+
+class TestRunCommandAsync(SimpleTestCase):
+    """Test the `run_command_async` function."""
+
+    async def test_run_command_success(self):
+        """Test that the output and exit code of a command are returned.
+
+        Asserts:
+            The stripped stdout, stderr and the exit code are returned.
+        """
+        result = await run_command_async(["sh", "-c", "echo out; echo err >&2"])
+
+        self.assertEqual(result, {"exit_code": 0, "stdout": "out", "stderr": "err"})
+
+    async def test_run_command_not_found(self):
+        """Test that a missing command is reported rather than raised.
+
+        Asserts:
+            An exit code of -1 and the missing command are returned.
+        """
+        with self.assertLogs("sysmonify.core.utils", level="ERROR"):
+            result = await run_command_async(["sysmonify-missing-command"])
+
+        self.assertEqual(result["exit_code"], -1)
+        self.assertIn("sysmonify-missing-command", result["stderr"])
+
+    async def test_run_command_timeout(self):
+        """Test that a command is killed once it exceeds its timeout.
+
+        Asserts:
+            An exit code of -1 is returned without waiting for the command.
+        """
+        with self.assertLogs("sysmonify.core.utils", level="ERROR"):
+            result = await run_command_async(["sleep", "10"], timeout_seconds=0.1)
+
+        self.assertEqual(
+            result, {"exit_code": -1, "stdout": "", "stderr": "Command timed out"}
+        )
+
+
+class TestTicker(SimpleTestCase):
+    """Test the `Ticker` class."""
+
+    async def _wait_at(self, ticker: Ticker, now: float) -> float:
+        """Waits for the next tick at the given event loop time.
+
+        Args:
+            ticker (Ticker):
+                The ticker to wait for.
+
+            now (float):
+                The event loop time when waiting starts.
+
+        Returns:
+            float:
+                The number of seconds slept for.
+        """
+        loop = asyncio.get_running_loop()
+
+        with (
+            unittest.mock.patch.object(loop, "time", return_value=now),
+            unittest.mock.patch(
+                "sysmonify.core.utils.asyncio.sleep",
+                new_callable=unittest.mock.AsyncMock,
+            ) as mock_sleep,
+        ):
+            await ticker.wait()
+
+        return mock_sleep.await_args.args[0]
+
+    async def test_wait_does_not_drift(self):
+        """Test that the time spent between waits does not delay later ticks.
+
+        Asserts:
+            Ticks are one interval apart from the first wait, however long the work
+            between them took.
+        """
+        ticker = Ticker(interval_seconds=1.0)
+
+        self.assertEqual(await self._wait_at(ticker, 10.0), 1.0)
+        self.assertEqual(await self._wait_at(ticker, 11.25), 0.75)
+        self.assertEqual(await self._wait_at(ticker, 12.5), 0.5)
+
+    async def test_wait_skips_missed_ticks(self):
+        """Test that ticks missed while the event loop was busy are skipped.
+
+        Asserts:
+            The next wait sleeps until the next tick still in the future.
+        """
+        ticker = Ticker(interval_seconds=1.0)
+
+        await self._wait_at(ticker, 10.0)
+
+        self.assertEqual(await self._wait_at(ticker, 13.5), 0.5)
+        self.assertEqual(await self._wait_at(ticker, 14.0), 1.0)